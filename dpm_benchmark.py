@@ -0,0 +1,195 @@
+"""SW Rush DPM 계산기 시뮬레이션 엔진 처리량 벤치마크
+
+고정된 시나리오 표를 사용 가능한 엔진마다 실행해 초당 공격/시뮬레이션 수, 실행 시간, 최대 메모리를 측정하고
+JSON으로 저장한다. 이전 커밋의 결과 파일과 비교해 느려진 항목(회귀)을 찾을 수 있다.
+
+    python dpm_benchmark.py --output bench.json
+    python dpm_benchmark.py --compare bench.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from dpm_engine import (
+    VERSION, ENGINE_VERSION, ENGINE_EXACT, SIMULATION_ENGINES, Character, available_engines, available_rng_algorithms, default_rng_algorithm,
+    derive_seed, expected_critical_attacks, run_exact, run_simulation_shard, tick_timeline, np
+)
+
+BENCHMARK_SEED = 20240601  # 시나리오별 시드를 유도하는 고정 마스터 시드 (커밋 간 같은 난수로 비교)
+BENCHMARK_REPEAT = 3  # 시간 측정 반복 횟수 (가장 빠른 값 사용)
+REGRESSION_THRESHOLD = 0.10  # 기준 대비 처리량이 이 비율 이상 줄면 회귀로 판정
+ENGINE_COLUMN_WIDTH = max(len(engine) for engine in SIMULATION_ENGINES)  # 결과 표의 엔진 열 너비 (가장 긴 엔진 이름)
+
+# 시나리오: (이름, Character 속성 변경, 시간(분), 시뮬레이션 횟수)
+BENCHMARK_SCENARIOS = [
+    ("default", {}, 1, 20000),
+    ("third_awakening", {"is_third_awakening": True}, 1, 20000),
+    ("high_attack_speed", {"attack_speed": 300}, 1, 10000),
+    ("long_fight", {}, 30, 1000),
+    ("huge_simulations", {}, 1, 100000),
+]
+
+
+def scenario_character(overrides):
+    """기본 캐릭터에 시나리오의 속성 변경을 적용"""
+    char = Character("benchmark")
+    for attribute, value in overrides.items():
+        setattr(char, attribute, value)
+    return char
+
+
+def clear_engine_caches(engine):
+    """exact 엔진의 타임라인/치명타 기대 횟수 캐시 비우기 (반복 측정이나 앞 시나리오의 캐시 적중 대신 풀이 시간을 재도록)"""
+    if engine == ENGINE_EXACT:
+        expected_critical_attacks.cache_clear()
+        tick_timeline.cache_clear()
+
+
+def run_scenario(engine, char, minutes, simulations, seed, rng_algorithm=None):
+    """엔진 한 번 실행 (샤드로 나누지 않고 단일 프로세스에서 전체 횟수 실행)"""
+    if engine == ENGINE_EXACT:
+        return run_exact(char, minutes)
+    return run_simulation_shard(engine, char.simulation_params(), minutes, simulations, seed, rng_algorithm=rng_algorithm)
+
+
+def measure(engine, name, overrides, minutes, simulations, scale=1.0, repeat=BENCHMARK_REPEAT, rng_algorithm=None):
+    """시나리오 하나를 측정해 결과 딕셔너리 반환
+
+    시간은 tracemalloc 없이 repeat번 실행한 최솟값, 최대 메모리는 tracemalloc을 켠 별도 실행으로 측정한다.
+    exact 엔진은 매번 캐시를 비운 상태에서 측정한다.
+    """
+    char = scenario_character(overrides)
+    simulations = max(1, int(simulations * scale))
+    seed = derive_seed(BENCHMARK_SEED, name)
+
+    wall_times = []
+    for _ in range(repeat):
+        clear_engine_caches(engine)
+        start = time.perf_counter()
+        stats = run_scenario(engine, char, minutes, simulations, seed, rng_algorithm)
+        wall_times.append(time.perf_counter() - start)
+    wall_time = min(wall_times)
+
+    clear_engine_caches(engine)
+    tracemalloc.start()
+    run_scenario(engine, char, minutes, simulations, seed, rng_algorithm)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # exact 엔진은 샘플링하지 않으므로 처리량 대신 실행 시간만 의미가 있음
+    sampled = engine != ENGINE_EXACT
+    return {
+        "scenario": name,
+        "engine": engine,
+        "rng": (rng_algorithm or default_rng_algorithm(engine)) if sampled else None,
+        "minutes": minutes,
+        "simulations": simulations if sampled else None,
+        "attacks": stats.total_attacks if sampled else None,
+        "dpm": stats.dpm,
+        "wall_time": wall_time,
+        "simulations_per_second": simulations / wall_time if sampled else None,
+        "attacks_per_second": stats.total_attacks / wall_time if sampled else None,
+        "peak_memory_bytes": peak_memory
+    }
+
+
+def git_commit():
+    """현재 git 커밋 (git이 없거나 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(engines=None, scenarios=None, scale=1.0, repeat=BENCHMARK_REPEAT, log=None, rng_algorithm=None):
+    """시나리오 × 엔진 표 전체를 측정해 결과 문서(딕셔너리) 반환 (rng_algorithm이 None이면 엔진별 기본 난수 알고리즘)"""
+    engines = engines or available_engines()
+    results = []
+    for name, overrides, minutes, simulations in BENCHMARK_SCENARIOS:
+        if scenarios and name not in scenarios:
+            continue
+        for engine in engines:
+            result = measure(engine, name, overrides, minutes, simulations, scale, repeat, rng_algorithm)
+            results.append(result)
+            if log:
+                log(format_result(result))
+    return {
+        "version": VERSION,
+        "engine_version": ENGINE_VERSION,
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+        "platform": platform.platform(),
+        "scale": scale,
+        "results": results
+    }
+
+
+def format_result(result):
+    if result["simulations_per_second"] is None:
+        rates = f"{'-':>19} {'-':>24}"
+    else:
+        rates = f"{result['simulations_per_second']:>12,.0f} sims/s {result['attacks_per_second']:>14,.0f} attacks/s"
+    return f"{result['scenario']:<18} {result['engine']:<{ENGINE_COLUMN_WIDTH}} {result.get('rng') or '-':<8} {result['wall_time']:>8.4f}s {rates} {result['peak_memory_bytes'] / 2 ** 20:>8.1f} MiB"
+
+
+def throughput(result):
+    """비교 기준 처리량 (샘플링 엔진은 초당 공격 수, exact 엔진은 초당 실행 횟수)"""
+    if result["attacks_per_second"] is not None:
+        return result["attacks_per_second"]
+    return 1 / result["wall_time"] if result["wall_time"] else None
+
+
+def compare_results(current, baseline, threshold=REGRESSION_THRESHOLD):
+    """기준 결과와 비교해 (시나리오, 엔진, 기준 대비 처리량 비율, 회귀 여부) 목록 반환
+
+    같은 시나리오는 같은 시드를 쓰므로 샘플링 엔진의 초당 공격 수 비율은 초당 시뮬레이션 수 비율과 같다.
+    """
+    baseline_rates = {(item["scenario"], item["engine"]): throughput(item) for item in baseline["results"]}
+    comparisons = []
+    for item in current["results"]:
+        key = (item["scenario"], item["engine"])
+        rate = throughput(item)
+        if not baseline_rates.get(key) or not rate:
+            continue
+        ratio = rate / baseline_rates[key]
+        comparisons.append((item["scenario"], item["engine"], ratio, ratio < 1 - threshold))
+    return comparisons
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시뮬레이션 엔진 처리량 벤치마크")
+    parser.add_argument("--engine", action="append", choices=available_engines(), help="측정할 엔진 (반복 지정 가능, 기본: 전체)")
+    parser.add_argument("--scenario", action="append", choices=[scenario[0] for scenario in BENCHMARK_SCENARIOS], help="측정할 시나리오 (기본: 전체)")
+    parser.add_argument("--rng", choices=available_rng_algorithms(), help="난수 알고리즘 (기본: 엔진별 기본값)")
+    parser.add_argument("--scale", type=float, default=1.0, help="시뮬레이션 횟수 배율 (빠른 확인용으로 0.1 등)")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="시간 측정 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", metavar="BASELINE", help="비교할 기준 결과 JSON (회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="회귀 판정 기준 (처리량 감소 비율)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.engine, args.scenario, args.scale, args.repeat, log=print, rng_algorithm=args.rng)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = 0
+        print(f"\n기준: {baseline.get('commit') or args.compare} → 현재: {report['commit'] or '-'}")
+        for scenario, engine, ratio, regressed in compare_results(report, baseline, args.threshold):
+            regressions += regressed
+            print(f"{scenario:<18} {engine:<{ENGINE_COLUMN_WIDTH}} {ratio:>6.2f}x{'  ← 회귀' if regressed else ''}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3231 @@
+"""SW Rush DPM 계산기 시뮬레이션 엔진 (GUI 없이 사용 가능한 핵심 모듈)
+
+tkinter에 의존하지 않으므로 워커 프로세스, 배치 모드, 테스트에서 가볍게 import할 수 있다.
+"""
+import random
+import sys
+import json
+import os
+import hashlib
+import math
+import multiprocessing
+import queue
+import time
+import atexit
+import csv
+import copy
+import itertools
+import sqlite3
+import zipfile
+import mmap
+from array import array
+from collections import OrderedDict, deque
+from fractions import Fraction
+from functools import partial, lru_cache, cached_property
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 파이썬 엔진만 사용
+    np = None
+
+# "from dpm_engine import *"(main.py)로 내보내는 공개 API (import한 모듈/내부 상태는 제외)
+__all__ = [
+    "VERSION", "INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD", "INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD", "SETTINGS_FILE",
+    "COOLDOWN_REDUCTION_MULTIPLIER", "SEVENTH_AWAKENING_MULTIPLIER", "CHARACTER_SETTING_KEYS", "COMMON_SETTING_KEYS", "BATCH_OUTPUT_FIELDS",
+    "SWEEP_RESULT_COLUMNS", "SWEEP_INTEGER_FIELDS", "SWEEP_CHUNK_SIZE", "SWEEP_CHUNK_SIMULATIONS", "ROSTER_OUTPUT_FIELDS",
+    "BATCH_QUEUE_FACTOR", "ENGINE_PYTHON", "ENGINE_NUMPY", "ENGINE_EXACT", "ENGINE_AGGREGATE", "DEFAULT_ENGINE", "RNG_MT19937", "RNG_PCG64",
+    "RNG_ALGORITHMS", "DEFAULT_RNG_ALGORITHMS", "RNG_BLOCK_SIZE", "RNG_SIMULATION_BLOCK_SIZE", "NUMPY_CHUNK_SIZE",
+    "TIMELINE_MAX_DENOMINATOR", "TIMELINE_CACHE_SIZE", "EXACT_CYCLE_TOLERANCE", "EXACT_MAX_CYCLE_BLOCKS", "EXACT_PROFILE_CACHE_SIZE",
+    "SHARD_SIZE", "DEFAULT_WORKERS", "WORKER_PROGRESS_INTERVAL", "PROGRESS_INTERVAL", "KERNEL_CHECK_TICKS", "CONFIDENCE_Z", "SIGNIFICANCE_LEVEL",
+    "ADAPTIVE_BATCH_SHARDS", "ROSTER_KEEP_TOP", "ROSTER_SHARD_SIZE", "ROSTER_FIRST_ROUND", "ROSTER_PRUNE_Z", "ENGINE_VERSION", "CACHE_FILE",
+    "SURROGATE_FILE", "SURROGATE_FORMAT", "SURROGATE_MAX_ATTACK_SPEED", "SURROGATE_CRITICAL_STEPS", "SURROGATE_CHUNK_SPEEDS",
+    "SURROGATE_ERROR_MARGIN", "CACHE_MEMORY_ENTRIES", "CACHE_DISK_ENTRIES", "CACHE_PRUNE_BATCH", "CACHE_TOUCH_BATCH", "HISTOGRAM_GAMMA", "DPM_PERCENTILES", "DAMAGE_SOURCES",
+    "DAMAGE_SOURCE_KEYS", "STAT_VALUE_STATS", "STAT_BUDGET_STATS", "STAT_BUDGET_BEAM_WIDTH", "STAT_BUDGET_RESULTS", "SIMULATION_ENGINES",
+    "NPY_DESCR",
+    "SimulationCancelled", "ProgressToken", "configure_shard_stop", "shard_stop_requested", "check_shard_stop", "Character", "parse_bool", "character_from_settings",
+    "simulate_attacks_with_critical_and_skill", "KernelDiagnostics", "CountingMultiplier", "ShotCounter", "exact_fraction", "TickTimeline",
+    "tick_timeline", "build_skill_schedule", "simulate_attacks_numpy", "simulate_attacks_aggregate", "expected_critical_attacks",
+    "expected_tick_values", "expected_attacks_with_critical_and_skill", "available_engines", "DpmHistogram", "SimulationStats",
+    "derive_seed", "new_master_seed", "available_rng_algorithms", "default_rng_algorithm", "RandomStream", "get_process_pool",
+    "shutdown_process_pool", "ResultCache", "get_result_cache", "result_cache_key", "run_simulation_shard", "PairedComparison",
+    "simulate_common_random_python", "simulate_common_random_numpy", "simulate_common_random", "run_paired_shard", "run_paired_comparison",
+    "run_sharded_simulation", "run_sharded_simulations", "precision_reached", "run_adaptive_simulations", "run_exact", "run_characters",
+    "StatValueStats", "StatValue", "run_stat_value_shard", "stat_value_variants", "run_stat_values", "StatAllocation",
+    "StatBudgetOptimizer", "optimize_stat_budget", "damage_comoments", "RosterStats", "RosterEntry", "run_roster_shard", "rank_roster",
+    "run_roster", "sweep_values", "parse_sweep_axis", "ParameterSweep", "sweep_typecode", "SweepResult", "run_sweep_chunk", "run_sweep",
+    "cubic_interpolate", "surrogate_fingerprint", "surrogate_rows", "SurrogateTable", "load_surrogate_table", "get_surrogate_table",
+    "summarize_partial", "simulation_worker_main", "SimulationWorker", "read_batch_builds", "read_result_columns", "run_batch_build",
+    "roster_rows", "run_batch"
+]
+
+# 상수
+VERSION = "v0.1.0-rc"
+INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD = 0.2  # 이 비율(%) 이하의 DPM 차이는 의미 없는 차이로 표시
+INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD = 1  # 이 값 이하의 APM 차이는 의미 없는 차이로 표시
+SETTINGS_FILE = "settings.json"
+COOLDOWN_REDUCTION_MULTIPLIER = 0.8
+SEVENTH_AWAKENING_MULTIPLIER = 1.2
+# 설정 파일(save_settings)과 배치 입력에서 쓰는 필드 이름
+CHARACTER_SETTING_KEYS = [
+    "seventh_awakening", "cooldown", "amplification", "third_awakening", "attack_speed", "attack_power",
+    "critical", "strong_hit", "double_shot", "triple_shot", "critical_mult", "strong_hit_mult"
+]
+COMMON_SETTING_KEYS = ["damage_1", "damage_2", "damage_3", "hit_1", "hit_2", "hit_3", "critical_cd", "skill_cd"]
+BATCH_OUTPUT_FIELDS = ["index", "name", "dpm", "apm", "dpm_half_width", "dpm_p5", "dpm_p50", "dpm_p95", "simulations", "seed", "rng", "from_cache", "error"]
+SWEEP_RESULT_COLUMNS = ["dpm", "apm", "dpm_half_width"]
+SWEEP_INTEGER_FIELDS = ("attack_speed", "hit_1", "hit_2", "hit_3", "third_awakening")  # 정수 열로 저장하는 스윕 항목
+SWEEP_CHUNK_SIZE = 1024  # 프로세스 풀 작업 하나가 계산하는 최대 격자점 수
+SWEEP_CHUNK_SIMULATIONS = 200000  # 몬테카를로 엔진에서 작업 하나가 실행하는 최대 시뮬레이션 수 (격자점 수 × 횟수)
+ROSTER_OUTPUT_FIELDS = ["rank", "name", "dpm", "apm", "dpm_half_width", "gap", "gap_half_width", "simulations", "pruned", "seed", "rng"]
+BATCH_QUEUE_FACTOR = 4  # 배치 모드에서 워커당 동시에 대기시키는 빌드 수 (메모리 상한)
+ENGINE_PYTHON = "python"
+ENGINE_NUMPY = "numpy"
+ENGINE_EXACT = "exact"  # 몬테카를로 대신 기댓값을 정확히 계산
+ENGINE_AGGREGATE = "aggregate"  # 타격마다 난수를 뽑는 대신 결과별 타격 수를 이항/다항 분포로 한 번에 샘플링 (NumPy 필요)
+DEFAULT_ENGINE = ENGINE_NUMPY if np is not None else ENGINE_PYTHON
+# 난수 알고리즘 이름 → NumPy 비트 생성기 이름 (mt19937은 NumPy 없이도 파이썬 random으로 사용 가능)
+RNG_MT19937 = "mt19937"
+RNG_PCG64 = "pcg64"
+RNG_ALGORITHMS = {
+    RNG_MT19937: "MT19937",
+    RNG_PCG64: "PCG64",
+    "philox": "Philox",
+    "sfc64": "SFC64",
+}
+# 엔진별 기본 알고리즘 (이전 버전과 같은 시드로 같은 결과를 내도록 각 엔진이 쓰던 생성기 유지)
+DEFAULT_RNG_ALGORITHMS = {ENGINE_PYTHON: RNG_MT19937, ENGINE_NUMPY: RNG_PCG64, ENGINE_AGGREGATE: RNG_PCG64}
+RNG_BLOCK_SIZE = 4096  # NumPy 알고리즘을 파이썬 커널에서 쓸 때 한 번에 미리 생성하는 난수 수
+RNG_SIMULATION_BLOCK_SIZE = 256  # 시뮬레이션 1회마다 새 스트림을 여는 공통 난수 비교용 블록 크기
+NUMPY_CHUNK_SIZE = 65536  # NumPy 엔진이 한 번에 처리하는 시뮬레이션 수 (메모리 상한)
+TIMELINE_MAX_DENOMINATOR = 10 ** 6  # 입력 시간(분/초)을 유리수로 바꿀 때의 최대 분모 (1.6 → 8/5)
+TIMELINE_CACHE_SIZE = 256  # 프로세스마다 재사용하는 틱 타임라인 수
+EXACT_CYCLE_TOLERANCE = 1e-15  # exact 엔진이 치명타 상태 분포가 반복된다고 판단하는 최대 확률 차이
+EXACT_MAX_CYCLE_BLOCKS = 64  # exact 엔진이 찾는 최대 반복 주기 (스킬 주기 블록 수)
+EXACT_PROFILE_CACHE_SIZE = 4096  # exact 엔진이 재사용하는 (타임라인, 치명 확률)별 치명타 기대 횟수 수
+SHARD_SIZE = 5000  # 샤드당 시뮬레이션 수 (워커 수와 무관하게 고정해야 시드 재현성 유지)
+DEFAULT_WORKERS = os.cpu_count() or 1
+WORKER_PROGRESS_INTERVAL = 0.05  # 워커 프로세스가 진행률 메시지를 보내는 최소 간격 (초)
+PROGRESS_INTERVAL = 0.1  # ProgressToken이 진행률 콜백을 호출하는 기본 최소 간격 (초)
+KERNEL_CHECK_TICKS = 100000  # 커널이 진행률 콜백(취소 확인)을 부르는 최대 간격 (시뮬레이션 수 × 틱 수, 파이썬 커널 약 0.1초)
+CONFIDENCE_Z = 1.96  # 95% 신뢰구간
+SIGNIFICANCE_LEVEL = 0.05  # 공통 난수 비교에서 차이가 유의하다고 판단하는 p-값 기준
+ADAPTIVE_BATCH_SHARDS = 2  # 적응형 모드에서 한 배치로 실행하는 샤드 수 (워커 수와 무관해야 같은 시드면 같은 횟수에서 멈춤)
+ROSTER_KEEP_TOP = 10  # 로스터 순위에서 끝까지 시뮬레이션하는 상위 빌드 수 (이보다 확실히 낮은 빌드는 중간에 제외)
+ROSTER_SHARD_SIZE = 1000  # 로스터 샤드당 시뮬레이션 수 (라운드를 잘게 나눠 하위 빌드를 일찍 제외)
+ROSTER_FIRST_ROUND = 2000  # 로스터 첫 라운드 시뮬레이션 수 (라운드마다 두 배, 워커 수와 무관해 같은 시드면 같은 결과)
+ROSTER_PRUNE_Z = 3.0  # 빌드 제외 판정의 신뢰구간 배수 (라운드마다 반복 검정하므로 CONFIDENCE_Z보다 엄격하게)
+ENGINE_VERSION = 4  # 시뮬레이션 커널의 결과가 바뀌면 올려서 이전 캐시를 무효화
+CACHE_FILE = "dpm_cache.sqlite3"
+SURROGATE_FILE = "dpm_surrogate.bin"  # 근사 DPM 표 파일 (설정/상수가 바뀌면 지문이 달라져 다시 만듦)
+SURROGATE_FORMAT = 1  # 근사 표 파일 형식 버전
+SURROGATE_MAX_ATTACK_SPEED = 400  # 근사 표에 담는 공격 속도 범위 (1 ~ 이 값, 벗어나면 exact 엔진 사용)
+SURROGATE_CRITICAL_STEPS = 32  # 근사 표의 치명 확률 구간 수 (0 ~ 1을 나눈 격자점 사이는 3차 보간)
+SURROGATE_CHUNK_SPEEDS = 25  # 근사 표를 만들 때 프로세스 풀 작업 하나가 계산하는 공격 속도 수
+SURROGATE_ERROR_MARGIN = 1.5  # 격자 중간점에서 잰 최대 보간 오차에 곱하는 안전 배수 (4배 조밀한 격자로 잰 최대 오차는 중간점 오차의 1.2배 이내)
+CACHE_MEMORY_ENTRIES = 256  # 메모리 LRU 캐시 항목 수
+CACHE_DISK_ENTRIES = 5000  # 디스크 캐시 최대 항목 수 (오래 사용하지 않은 항목부터 삭제)
+CACHE_PRUNE_BATCH = 100  # 디스크 캐시가 가득 차면 최대 항목 수보다 이만큼 더 지워 매번 정리하지 않게 함
+CACHE_TOUCH_BATCH = 64  # 디스크 캐시 적중의 사용 시각을 모아서 한 번에 기록하는 개수
+HISTOGRAM_GAMMA = 1.01  # DPM 분포 히스토그램의 이웃 구간 경계 비율 (분위수 상대 오차 약 0.5%)
+DPM_PERCENTILES = [5, 50, 95]
+
+# 데미지 출처: (키, 표시 이름), 추가타는 더블샷/트리플샷의 두 번째 이후 발사
+DAMAGE_SOURCES = [
+    ("skill", "전용 스킬"),
+    ("critical", "치명타 공격"),
+    ("normal", "일반 공격"),
+    ("extra_shot", "더블/트리플샷 추가타"),
+]
+DAMAGE_SOURCE_KEYS = [key for key, _ in DAMAGE_SOURCES]
+# 스탯 효율 계산 대상: (Character 속성, 표시 이름, 차분 변화량, 입력 단위 1포인트의 속성 값)
+# 확률/배율은 화면에서 % 단위로 입력하므로 1포인트 = 0.01, 배율은 공통 난수에서 선형이라 큰 변화량으로 노이즈를 줄임
+STAT_VALUE_STATS = [
+    ("attack_speed", "공격 속도", 1, 1),
+    ("attack_power", "공격력", 0.1, 1),
+    ("p_critical", "치명 확률", 0.01, 0.01),
+    ("p_strong_hit", "강타 확률", 0.01, 0.01),
+    ("p_double_shot", "더블샷 확률", 0.01, 0.01),
+    ("p_triple_shot", "트리플샷 확률", 0.01, 0.01),
+    ("critical_multiplier", "치명 피해", 0.1, 0.01),
+    ("strong_hit_multiplier", "강타 피해", 0.1, 0.01)
+]
+# 스탯 배분 최적화 대상: (Character 속성, 1단계 변화량, 1단계 비용, 최댓값), 기본은 화면 입력 단위 1포인트가 1단계
+# 확률은 create_character_from_gui/character_from_settings와 같이 100%에서 제한
+STAT_BUDGET_STATS = [
+    ("attack_speed", 1, 1, None),
+    ("p_critical", 0.01, 1, 1.0),
+    ("p_strong_hit", 0.01, 1, 1.0),
+    ("p_double_shot", 0.01, 1, 1.0),
+    ("p_triple_shot", 0.01, 1, 1.0),
+    ("critical_multiplier", 0.01, 1, None),
+    ("strong_hit_multiplier", 0.01, 1, None)
+]
+STAT_BUDGET_BEAM_WIDTH = 32  # 스탯 배분 탐색에서 단계마다 남기는 후보 수
+STAT_BUDGET_RESULTS = 5  # 최적 배분과 함께 반환하는 차선 배분 수 (최적 포함)
+
+
+class SimulationCancelled(Exception):
+    """사용자 요청으로 시뮬레이션이 취소됨"""
+
+
+_shard_stop_flags = None  # (cancel_job_id, finish_job_id, running_job_id) 공유 정수 (워커 프로세스와 그 프로세스 풀이 공유)
+
+
+def configure_shard_stop(cancel_job_id, finish_job_id, running_job_id):
+    """샤드 실행 중에도 워커의 취소/조기 종료 요청을 확인하도록 공유 작업 번호 등록
+
+    워커 프로세스 시작 시 호출하며, 이후 만드는 프로세스 풀도 초기화 함수로 같은 값을 받아 풀 안의 커널이 직접 확인한다.
+    """
+    global _shard_stop_flags
+    _shard_stop_flags = (cancel_job_id, finish_job_id, running_job_id)
+
+
+def shard_stop_requested():
+    """실행 중인 작업에 취소/조기 종료가 요청되었는지 (등록된 공유 값이 없으면 항상 False)"""
+    if _shard_stop_flags is None:
+        return False
+    cancel_job_id, finish_job_id, running_job_id = _shard_stop_flags
+    job_id = running_job_id.value
+    return job_id > 0 and any(shared is not None and shared.value >= job_id for shared in (cancel_job_id, finish_job_id))
+
+
+def check_shard_stop(progress=None):
+    """샤드 안의 취소 확인 (요청되었으면 SimulationCancelled, 커널의 progress_callback 자리에 넘길 수 있음)"""
+    if shard_stop_requested():
+        raise SimulationCancelled()
+
+
+class ProgressToken:
+    """진행률 보고와 취소 요청을 함께 전달하는 토큰 (progress_callback 자리에 그대로 넘길 수 있음)
+
+    호출될 때마다 취소 여부를 확인해 취소되었으면 SimulationCancelled를 발생시키고,
+    진행률은 반복 횟수와 관계없이 interval초에 한 번만(100%는 항상) callback에 전달한다.
+    cancel_check를 주면 다른 프로세스의 취소 요청 등 외부 조건도 함께 확인한다.
+    """
+
+    def __init__(self, callback=None, interval=PROGRESS_INTERVAL, cancel_check=None):
+        self.callback = callback
+        self.interval = interval
+        self.cancel_check = cancel_check
+        self.cancelled = False
+        self.last_report = 0.0
+
+    def cancel(self):
+        self.cancelled = True
+
+    def is_cancelled(self):
+        return self.cancelled or (self.cancel_check is not None and self.cancel_check())
+
+    def check(self):
+        """취소되었으면 SimulationCancelled 발생"""
+        if self.is_cancelled():
+            raise SimulationCancelled()
+
+    def __call__(self, progress):
+        self.check()
+        now = time.monotonic()
+        if self.callback and (progress >= 100 or now - self.last_report >= self.interval):
+            self.last_report = now
+            self.callback(progress)
+
+
+class Character:
+    DEFAULT_ATTACK_SPEED = 116
+    DEFAULT_ATTACK_POWER = 12.32
+    DEFAULT_P_CRITICAL = 90.35 / 100
+    DEFAULT_P_STRONG_HIT = 58.12 / 100
+    DEFAULT_P_DOUBLE_SHOT = 26.08 / 100
+    DEFAULT_P_TRIPLE_SHOT = 11.23 / 100
+    DEFAULT_CRITICAL_MULTIPLIER = 1171.71 / 100
+    DEFAULT_STRONG_HIT_MULTIPLIER = 185.45 / 100
+    DEFAULT_SEVENTH_AWAKENING = True
+    DEFAULT_COOLDOWN = True
+    DEFAULT_AMPLIFICATION = True
+    DEFAULT_THIRD_AWAKENING = False
+    DEFAULT_DAMAGE_SKILL_1 = 430 / 100
+    DEFAULT_DAMAGE_SKILL_2 = 190 / 100
+    DEFAULT_DAMAGE_SKILL_3 = 280 / 100
+    DEFAULT_CRITICAL_COOLDOWN = 2
+    DEFAULT_SKILL_COOLDOWN = 10
+    DEFAULT_HIT_1 = 1
+    DEFAULT_HIT_2 = 3
+    DEFAULT_HIT_3 = 3
+    AMPLIFICATION_BONUS = 0.6
+
+    def __init__(self, name="Character"):
+        self.name = name
+        self.is_seventh_awakening = Character.DEFAULT_SEVENTH_AWAKENING
+        self.is_cooldown = Character.DEFAULT_COOLDOWN
+        self.is_amplification = Character.DEFAULT_AMPLIFICATION
+        self.is_third_awakening = Character.DEFAULT_THIRD_AWAKENING
+        self.attack_speed = Character.DEFAULT_ATTACK_SPEED
+        self.attack_power = Character.DEFAULT_ATTACK_POWER
+        self.p_critical = Character.DEFAULT_P_CRITICAL
+        self.p_strong_hit = Character.DEFAULT_P_STRONG_HIT
+        self.p_double_shot = Character.DEFAULT_P_DOUBLE_SHOT
+        self.p_triple_shot = Character.DEFAULT_P_TRIPLE_SHOT
+        self.critical_multiplier = Character.DEFAULT_CRITICAL_MULTIPLIER
+        self.strong_hit_multiplier = Character.DEFAULT_STRONG_HIT_MULTIPLIER
+        self.seventh_awakening_multiplier = SEVENTH_AWAKENING_MULTIPLIER if self.is_seventh_awakening else 1
+        self.damage_skill_1 = Character.DEFAULT_DAMAGE_SKILL_1
+        self.damage_skill_2 = Character.DEFAULT_DAMAGE_SKILL_2
+        self.damage_skill_3 = Character.DEFAULT_DAMAGE_SKILL_3
+        self.critical_cooldown = Character.DEFAULT_CRITICAL_COOLDOWN
+        self.skill_cooldown = Character.DEFAULT_SKILL_COOLDOWN
+        self.hit_1 = Character.DEFAULT_HIT_1
+        self.hit_2 = Character.DEFAULT_HIT_2
+        self.hit_3 = Character.DEFAULT_HIT_3
+        if self.is_cooldown:
+            self.critical_cooldown *= COOLDOWN_REDUCTION_MULTIPLIER
+            self.skill_cooldown *= COOLDOWN_REDUCTION_MULTIPLIER
+
+    def simulation_params(self):
+        """시뮬레이션 엔진에 전달할 파라미터 딕셔너리"""
+        return {
+            "attack_power": self.attack_power,
+            "attack_speed": self.attack_speed,
+            "damage_skill_1": self.damage_skill_1,
+            "damage_skill_2": self.damage_skill_2,
+            "damage_skill_3": self.damage_skill_3,
+            "p_critical": self.p_critical,
+            "p_strong_hit": self.p_strong_hit,
+            "p_double_shot": self.p_double_shot,
+            "p_triple_shot": self.p_triple_shot,
+            "critical_multiplier": self.critical_multiplier,
+            "strong_hit_multiplier": self.strong_hit_multiplier,
+            "seventh_awakening_multiplier": self.seventh_awakening_multiplier,
+            "critical_cooldown": self.critical_cooldown,
+            "skill_cooldown": self.skill_cooldown,
+            "hit_1": self.hit_1,
+            "hit_2": self.hit_2,
+            "hit_3": self.hit_3,
+            "third_awakening": self.is_third_awakening
+        }
+
+    def simulate_damage(self, minutes=0.5, simulations=10000, progress_callback=None, engine=DEFAULT_ENGINE, workers=1, seed=None,
+                        target_relative_error=None, time_budget=None, partial_callback=None, diagnostics=False):
+        """캐릭터의 데미지를 시뮬레이션하여 분당 데미지(DPM)를 계산
+
+        progress_callback에 ProgressToken을 넘기면 진행률 보고 간격을 제한하고 중간에 취소할 수 있다.
+        partial_callback은 샤드가 끝날 때마다 지금까지의 중간 합계(SimulationStats)를 받는다.
+        diagnostics=True면 (DPM, APM, KernelDiagnostics)를 반환한다.
+        """
+        stats = self.run_simulation(minutes, simulations, progress_callback, engine, workers, seed, target_relative_error, time_budget,
+                                    partial_callback, diagnostics)
+        if diagnostics:
+            return stats.dpm, stats.apm, stats.diagnostics
+        return stats.dpm, stats.apm
+
+    def run_simulation(self, minutes=0.5, simulations=10000, progress_callback=None, engine=DEFAULT_ENGINE, workers=1, seed=None,
+                       target_relative_error=None, time_budget=None, partial_callback=None, diagnostics=False):
+        """시뮬레이션을 샤드로 나누어 실행하고 합계(SimulationStats)를 반환 (workers > 1이면 프로세스 풀 사용)
+
+        target_relative_error나 time_budget을 지정하면 적응형 모드로 동작하며, simulations는 최대 횟수가 된다.
+        """
+        partial = (lambda stats_list: partial_callback(stats_list[0])) if partial_callback else None
+        return run_characters([self], minutes, simulations, engine, workers, seed, progress_callback, target_relative_error, time_budget,
+                              partial_callback=partial, diagnostics=diagnostics)[0]
+
+
+def parse_bool(value):
+    """설정값(bool, 숫자, "true"/"false" 등 문자열)을 bool로 변환"""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("1", "true", "yes", "y", "on"):
+            return True
+        if text in ("0", "false", "no", "n", "off", ""):
+            return False
+        raise ValueError(f"참/거짓 값이 아닙니다: {value}")
+    return bool(value)
+
+
+def character_from_settings(settings, common=None):
+    """save_settings와 같은 필드 이름/단위(%)의 딕셔너리로 Character 생성 (GUI 없이 사용 가능)
+
+    settings에는 캐릭터 항목(CHARACTER_SETTING_KEYS와 name), common에는 공통 항목(COMMON_SETTING_KEYS)을 넣는다.
+    빠진 항목은 Character 기본값을 사용하며, 값이 잘못되면 ValueError를 발생시킨다.
+    """
+    common = common or {}
+    char = Character(str(settings.get("name", "Character")))
+    
+    # 기본 설정
+    char.is_seventh_awakening = parse_bool(settings.get("seventh_awakening", Character.DEFAULT_SEVENTH_AWAKENING))
+    char.is_cooldown = parse_bool(settings.get("cooldown", Character.DEFAULT_COOLDOWN))
+    char.is_amplification = parse_bool(settings.get("amplification", Character.DEFAULT_AMPLIFICATION))
+    char.is_third_awakening = parse_bool(settings.get("third_awakening", Character.DEFAULT_THIRD_AWAKENING))
+    
+    # 공격 관련
+    char.attack_speed = int(float(settings.get("attack_speed", Character.DEFAULT_ATTACK_SPEED)))
+    if char.attack_speed < 1:
+        raise ValueError("공격 속도는 1 이상이어야 합니다.")
+    char.attack_power = float(settings.get("attack_power", Character.DEFAULT_ATTACK_POWER))
+    
+    # 확률 관련 (100% 초과 시 100%로 제한)
+    char.p_critical = min(float(settings.get("critical", Character.DEFAULT_P_CRITICAL * 100)) / 100, 1.0)
+    char.p_strong_hit = min(float(settings.get("strong_hit", Character.DEFAULT_P_STRONG_HIT * 100)) / 100, 1.0)
+    char.p_double_shot = min(float(settings.get("double_shot", Character.DEFAULT_P_DOUBLE_SHOT * 100)) / 100, 1.0)
+    char.p_triple_shot = min(float(settings.get("triple_shot", Character.DEFAULT_P_TRIPLE_SHOT * 100)) / 100, 1.0)
+    
+    # 배율 관련
+    char.critical_multiplier = float(settings.get("critical_mult", Character.DEFAULT_CRITICAL_MULTIPLIER * 100)) / 100
+    char.strong_hit_multiplier = float(settings.get("strong_hit_mult", Character.DEFAULT_STRONG_HIT_MULTIPLIER * 100)) / 100
+    char.seventh_awakening_multiplier = SEVENTH_AWAKENING_MULTIPLIER if char.is_seventh_awakening else 1
+    
+    # 데미지 배율 (공통 설정 사용)
+    char.damage_skill_1 = float(common.get("damage_1", Character.DEFAULT_DAMAGE_SKILL_1 * 100)) / 100
+    char.damage_skill_2 = float(common.get("damage_2", Character.DEFAULT_DAMAGE_SKILL_2 * 100)) / 100
+    char.damage_skill_3 = float(common.get("damage_3", Character.DEFAULT_DAMAGE_SKILL_3 * 100)) / 100
+    
+    # 증폭 효과 적용 (60%p 증가)
+    if char.is_amplification:
+        char.damage_skill_1 += Character.AMPLIFICATION_BONUS
+        char.damage_skill_2 += Character.AMPLIFICATION_BONUS
+        char.damage_skill_3 += Character.AMPLIFICATION_BONUS
+    
+    # 쿨타임 설정 (공통 설정 사용) 및 쿨타임 감소 적용
+    char.critical_cooldown = float(common.get("critical_cd", Character.DEFAULT_CRITICAL_COOLDOWN))
+    char.skill_cooldown = float(common.get("skill_cd", Character.DEFAULT_SKILL_COOLDOWN))
+    if char.is_cooldown:
+        char.critical_cooldown *= COOLDOWN_REDUCTION_MULTIPLIER
+        char.skill_cooldown *= COOLDOWN_REDUCTION_MULTIPLIER
+    
+    # 타수(공통설정) 적용
+    char.hit_1 = int(float(common.get("hit_1", Character.DEFAULT_HIT_1)))
+    char.hit_2 = int(float(common.get("hit_2", Character.DEFAULT_HIT_2)))
+    char.hit_3 = int(float(common.get("hit_3", Character.DEFAULT_HIT_3)))
+    
+    return char
+
+
+def simulate_attacks_with_critical_and_skill(
+    minutes=1, 
+    simulations=1000,
+    attack_power=1,
+    attack_speed=120,
+    damage_skill_1=1, 
+    damage_skill_2=2, 
+    damage_skill_3=5, 
+    p_critical=0.5, 
+    p_strong_hit=0.1, 
+    p_double_shot=0.1, 
+    p_triple_shot=0.05,
+    critical_multiplier=2, 
+    strong_hit_multiplier=2, 
+    seventh_awakening_multiplier=1,
+    critical_cooldown=2, 
+    skill_cooldown=10, 
+    hit_1=1, 
+    hit_2=1, 
+    hit_3=1,
+    progress_callback=None,
+    third_awakening=False,
+    rng=None,
+    stats=None,
+    diagnostics=None
+):
+    start_time = time.perf_counter()
+    attack_speed = int(attack_speed)
+    total_damage = 0
+    total_attacks = 0
+    # 시뮬레이션별 데미지의 편차 제곱합 (Welford 방식, 신뢰구간 계산용)
+    simulations_done = 0
+    damage_mean = 0.0
+    damage_m2 = 0.0
+    # 출처별 데미지 합계와 시뮬레이션별 DPM 분포 (stats를 넘긴 경우에만 분포 기록)
+    # 출처별 합계는 분기 전후 누적 데미지의 차이로 구해 타격마다 더하는 비용을 피함
+    skill_damage = critical_damage = extra_shot_damage = 0
+    histogram = DpmHistogram() if stats is not None else None
+    # 난수 생성기 (rng를 넘기면 독립 스트림 사용, 없으면 모듈 전역 random)
+    rand = rng.random if rng is not None else random.random
+    
+    # 공격속도 100당 1초에 1번 공격 (즉, 공격속도 100이면 1초에 1번, 200이면 1초에 2번)
+    # 시간은 정수 틱으로 진행하고, 스킬 발동 틱은 난수와 무관하므로 타임라인에서 한 번만 계산
+    timeline = tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+    skill_schedule = timeline.skill_schedule
+    first_critical_tick = timeline.first_critical_tick
+    critical_period = timeline.critical_period
+    # 진행률 업데이트 간격 (1000번마다, 긴 전투는 취소가 늦지 않도록 KERNEL_CHECK_TICKS 틱마다)
+    progress_every = max(1, min(1000, KERNEL_CHECK_TICKS // max(timeline.tick_count, 1)))
+    # 치명타 스킬에 곱하는 치명 배율 (계측할 때 타격의 치명 발동과 따로 세기 위한 이름)
+    critical_skill_multiplier = critical_multiplier
+    if diagnostics is not None:
+        # 계측: 판정이 성공했을 때만 곱하는 값을 곱해진 횟수를 세는 값으로 바꿔 분기/발동 횟수를 셈
+        # 루프 코드는 그대로이므로 계측을 끈 실행에는 비용이 없고, 결과도 같은 값끼리 곱한 것이라 비트 단위로 같음
+        rand = diagnostics.timed(rand, "rng_time")
+        if progress_callback:
+            progress_callback = diagnostics.timed(progress_callback, "callback_time")
+        critical_multiplier = CountingMultiplier(critical_multiplier)
+        critical_skill_multiplier = CountingMultiplier(critical_skill_multiplier)
+        strong_hit_multiplier = CountingMultiplier(strong_hit_multiplier)
+        hit_1 = ShotCounter(hit_1)
+    
+    for _ in range(simulations):
+        damage_this_simulation = 0
+        critical_ready_tick = first_critical_tick
+        
+        # 진행률 업데이트
+        if progress_callback and (_ + 1) % progress_every == 0:
+            progress = (_ + 1) / simulations * 100
+            progress_callback(progress)
+        
+        for tick, is_skill_tick in enumerate(skill_schedule):
+            
+            # 1. 스킬 (3각이 활성화되면 쿨타임 무시하고 바로 발동)
+            if is_skill_tick:  # 스킬 쿨타임 체크
+                base_damage = damage_skill_3 * attack_power * seventh_awakening_multiplier
+                source_start = damage_this_simulation
+                for _ in range(hit_3):
+                    damage_tick = base_damage
+                    if rand() < p_critical:
+                        damage_tick *= critical_multiplier
+                    if rand() < p_strong_hit:
+                        damage_tick *= strong_hit_multiplier
+                    damage_this_simulation += damage_tick
+                skill_damage += damage_this_simulation - source_start
+                total_attacks += hit_3
+
+            # 2. 치명타
+            elif tick >= critical_ready_tick and rand() < p_critical:  # 치명타 쿨타임 체크 & 치명타 확률 체크
+                base_damage = damage_skill_2 * attack_power * critical_skill_multiplier * seventh_awakening_multiplier
+                source_start = damage_this_simulation
+                for _ in range(hit_2):
+                    damage_tick = base_damage
+                    if rand() < p_strong_hit:
+                        damage_tick *= strong_hit_multiplier
+                    damage_this_simulation += damage_tick
+                critical_damage += damage_this_simulation - source_start
+                total_attacks += hit_2
+                critical_ready_tick = tick + critical_period
+
+            # 3. 일반 공격
+            else:
+                base_damage = damage_skill_1 * attack_power * seventh_awakening_multiplier
+                # 더블샷/트리플샷 확률 계산
+                shot_count = 1
+                if rand() < p_double_shot:
+                    shot_count = 2
+                if rand() < p_triple_shot:
+                    shot_count = 3
+
+                # 데미지 계산 (두 번째 이후 발사는 추가타로 집계, 첫 발은 마지막에 나머지로 계산)
+                for shot in range(shot_count):
+                    if shot == 1:
+                        source_start = damage_this_simulation
+                    for _ in range(hit_1):
+                        damage_tick = base_damage
+                        if rand() < p_critical and shot_count > 1: # 더블샷/트리플 샷 일 때 치명타 발생
+                            damage_tick *= critical_multiplier
+                        if rand() < p_strong_hit: # 강타 발생
+                            damage_tick *= strong_hit_multiplier
+                        damage_this_simulation += damage_tick
+                if shot_count > 1:
+                    extra_shot_damage += damage_this_simulation - source_start
+                total_attacks += shot_count * hit_1
+
+        total_damage += damage_this_simulation
+        # 루프 변수 _는 내부 루프에서 덮어쓰므로 별도 카운터 사용
+        simulations_done += 1
+        delta = damage_this_simulation - damage_mean
+        damage_mean += delta / simulations_done
+        damage_m2 += delta * (damage_this_simulation - damage_mean)
+        if histogram is not None:
+            histogram.add(damage_this_simulation / minutes)
+    
+    if stats is not None:
+        stats.add(simulations, total_damage, total_attacks, damage_m2)
+        normal_damage = total_damage - skill_damage - critical_damage - extra_shot_damage
+        stats.add_sources({"skill": skill_damage, "critical": critical_damage, "normal": normal_damage, "extra_shot": extra_shot_damage})
+        stats.add_histogram(histogram)
+    if diagnostics is not None:
+        # 스킬/전체 틱 수는 타임라인으로 정해지고, 일반 공격 틱마다 발사 수 × 타수를 한 번 계산함
+        diagnostics.ticks += simulations * len(skill_schedule)
+        diagnostics.skill += simulations * sum(skill_schedule)
+        diagnostics.critical += critical_skill_multiplier.count
+        diagnostics.normal += sum(hit_1.shots.values())
+        diagnostics.double_shot += hit_1.shots.get(2, 0)
+        diagnostics.triple_shot += hit_1.shots.get(3, 0)
+        diagnostics.critical_proc += critical_multiplier.count
+        diagnostics.strong_hit_proc += strong_hit_multiplier.count
+        diagnostics.total_time += time.perf_counter() - start_time
+        if stats is not None:
+            stats.diagnostics = diagnostics
+    
+    # 분당 데미지(DPM)와 분당 공격 횟수(APM) 반환
+    return total_damage / (simulations * minutes), total_attacks / (simulations * minutes)
+
+
+class KernelDiagnostics:
+    """커널 계측 결과 (분기/발동 횟수와 구간별 시간, diagnostics=True로 실행할 때만 생성)
+
+    시간은 계측 오버헤드를 포함하며, 분기 처리 시간은 전체에서 난수/진행률 콜백 시간을 뺀 값이다.
+    """
+
+    COUNTERS = ["ticks", "skill", "critical", "normal", "double_shot", "triple_shot", "critical_proc", "strong_hit_proc"]
+
+    def __init__(self):
+        for name in KernelDiagnostics.COUNTERS:
+            setattr(self, name, 0)
+        self.rng_time = 0.0
+        self.callback_time = 0.0
+        self.total_time = 0.0
+
+    def merge(self, other):
+        """다른 샤드의 계측 결과 병합"""
+        for name in KernelDiagnostics.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.rng_time += other.rng_time
+        self.callback_time += other.callback_time
+        self.total_time += other.total_time
+
+    @property
+    def branch_time(self):
+        return max(self.total_time - self.rng_time - self.callback_time, 0.0)
+
+    @property
+    def ticks_per_second(self):
+        return self.ticks / self.total_time if self.total_time else 0.0
+
+    def timed(self, function, name):
+        """호출에 걸린 시간을 name 항목(rng_time/callback_time)에 더하는 function 래퍼 (계측 오버헤드 포함)"""
+        perf_counter = time.perf_counter
+
+        def call(*args):
+            call_start = perf_counter()
+            result = function(*args)
+            setattr(self, name, getattr(self, name) + perf_counter() - call_start)
+            return result
+        return call
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in KernelDiagnostics.COUNTERS}
+        data.update({
+            "rng_time": self.rng_time,
+            "branch_time": self.branch_time,
+            "callback_time": self.callback_time,
+            "total_time": self.total_time,
+            "ticks_per_second": self.ticks_per_second
+        })
+        return data
+
+
+class CountingMultiplier(float):
+    """곱해질 때마다 횟수(count)를 세는 배율 (계측할 때 판정 성공 시에만 곱하는 배율 대신 사용)
+
+    값은 원래 배율과 같고, 곱셈 결과도 원래 배율(정수면 정수)을 곱한 값 그대로다.
+    """
+
+    def __new__(cls, value):
+        multiplier = super().__new__(cls, value)
+        multiplier.value = value
+        multiplier.count = 0
+        return multiplier
+
+    def __rmul__(self, other):
+        self.count += 1
+        return other * self.value
+
+
+class ShotCounter(int):
+    """발사 수 × 타수로 곱해질 때 발사 수별 횟수(shots)를 세는 일반 공격 타수 (일반 공격 틱마다 한 번 곱해짐)"""
+
+    def __new__(cls, value):
+        hits = super().__new__(cls, value)
+        hits.value = value
+        hits.shots = {}
+        return hits
+
+    def __rmul__(self, other):
+        self.shots[other] = self.shots.get(other, 0) + 1
+        return other * self.value
+
+
+def exact_fraction(value):
+    """입력 시간을 유리수로 변환 (부동소수점 표현 오차 제거, 1.6 → 8/5)"""
+    return Fraction(value).limit_denominator(TIMELINE_MAX_DENOMINATOR)
+
+
+class TickTimeline:
+    """정수 틱 타임라인 (공격 간격 100 / attack_speed초를 유리수로 계산해 부동소수점 누적 오차가 없음)
+
+    틱 t의 시각은 t × 공격 간격이고, 쿨타임은 ceil(쿨타임 / 공격 간격) 틱으로 바꾼다.
+    전용 스킬은 first_skill_tick부터 skill_period 틱마다 발동하고, 치명타는 first_critical_tick부터
+    판정하며 발동 후 critical_period 틱 뒤에 다시 판정한다 (3각이면 둘 다 0틱부터).
+    """
+
+    def __init__(self, minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening=False):
+        attack_interval = Fraction(100, int(attack_speed))
+        self.tick_count = max(math.ceil(exact_fraction(minutes) * 60 / attack_interval), 0)
+        skill_ticks = max(math.ceil(exact_fraction(skill_cooldown) / attack_interval), 0)
+        # 치명타 쿨타임 틱 수 (exact 엔진의 상태 수)
+        self.critical_ticks = max(math.ceil(exact_fraction(critical_cooldown) / attack_interval), 0)
+        # 발동한 틱에서 경과 시간이 0이 되므로 쿨타임이 0이어도 다음 발동은 최소 1틱 뒤
+        self.skill_period = max(skill_ticks, 1)
+        self.first_skill_tick = 0 if third_awakening else skill_ticks
+        self.critical_period = max(self.critical_ticks, 1)
+        self.first_critical_tick = 0 if third_awakening else self.critical_ticks
+        self.skill_count = max((self.tick_count - 1 - self.first_skill_tick) // self.skill_period + 1, 0)
+
+    @cached_property
+    def skill_schedule(self):
+        """틱별 전용 스킬 발동 여부 (몬테카를로 엔진용, exact 엔진은 주기만 사용하므로 필요할 때 한 번 생성)"""
+        return tuple(
+            tick >= self.first_skill_tick and (tick - self.first_skill_tick) % self.skill_period == 0 for tick in range(self.tick_count)
+        )
+
+
+@lru_cache(maxsize=TIMELINE_CACHE_SIZE)
+def tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening=False):
+    """같은 설정의 TickTimeline을 프로세스 안에서 한 번만 계산해 모든 샤드/시뮬레이션이 재사용"""
+    return TickTimeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+
+
+def build_skill_schedule(minutes, attack_speed, skill_cooldown, third_awakening=False):
+    """틱별 전용 스킬 발동 여부 리스트 (정수 틱 타임라인 기준)"""
+    return list(tick_timeline(minutes, attack_speed, skill_cooldown, 0, third_awakening).skill_schedule)
+
+
+def simulate_attacks_numpy(
+    minutes=1,
+    simulations=1000,
+    attack_power=1,
+    attack_speed=120,
+    damage_skill_1=1,
+    damage_skill_2=2,
+    damage_skill_3=5,
+    p_critical=0.5,
+    p_strong_hit=0.1,
+    p_double_shot=0.1,
+    p_triple_shot=0.05,
+    critical_multiplier=2,
+    strong_hit_multiplier=2,
+    seventh_awakening_multiplier=1,
+    critical_cooldown=2,
+    skill_cooldown=10,
+    hit_1=1,
+    hit_2=1,
+    hit_3=1,
+    progress_callback=None,
+    third_awakening=False,
+    seed=None,
+    chunk_size=NUMPY_CHUNK_SIZE,
+    stats=None,
+    diagnostics=None,
+    rng=None
+):
+    """simulate_attacks_with_critical_and_skill의 NumPy 버전 (모든 시뮬레이션을 배열로 한 틱씩 동시에 진행)
+
+    diagnostics(KernelDiagnostics)를 넘기면 틱마다 분기/발동 횟수를 세고 난수 생성 시간을 따로 잰다.
+    계측은 틱 단위 검사라 끈 상태의 비용은 배열 연산에 비해 무시할 수 있다.
+    rng(RandomStream)를 넘기면 seed 대신 그 스트림의 generator를 사용한다.
+    """
+    if np is None:
+        raise RuntimeError("NumPy가 설치되어 있지 않아 numpy 엔진을 사용할 수 없습니다.")
+
+    start_time = time.perf_counter()
+    attack_speed = int(attack_speed)
+    rng = rng.generator if rng is not None else np.random.default_rng(seed)
+    draw = diagnostics.timed(rng.random, "rng_time") if diagnostics is not None else rng.random
+    total_damage = 0.0
+    total_attacks = 0
+
+    # 스킬 발동 여부는 난수와 무관하므로 틱별 스케줄을 한 번만 계산
+    timeline = tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+
+    base_damage_1 = damage_skill_1 * attack_power * seventh_awakening_multiplier
+    base_damage_2 = damage_skill_2 * attack_power * critical_multiplier * seventh_awakening_multiplier
+    base_damage_3 = damage_skill_3 * attack_power * seventh_awakening_multiplier
+    max_normal_hits = 3 * hit_1
+    normal_hit_index = np.arange(max_normal_hits)
+    source_damage = dict.fromkeys(DAMAGE_SOURCE_KEYS, 0.0)
+    histogram = DpmHistogram() if stats is not None else None
+
+    done = 0
+    while done < simulations:
+        # 청크 단위로 처리하여 시뮬레이션 횟수와 무관하게 메모리 사용량 유지
+        n = min(chunk_size, simulations - done)
+        chunk_attacks_start = total_attacks
+        damage = np.zeros(n)
+        critical_ready_tick = np.full(n, timeline.first_critical_tick, dtype=np.int64)
+        # 긴 전투는 청크 하나가 오래 걸리므로 청크 안에서도 KERNEL_CHECK_TICKS마다 진행률 보고 (취소 확인)
+        progress_every = max(1, KERNEL_CHECK_TICKS // n)
+
+        for tick, is_skill_tick in enumerate(timeline.skill_schedule):
+            if progress_callback and tick % progress_every == progress_every - 1:
+                callback_start = time.perf_counter()
+                progress_callback((done + n * tick / timeline.tick_count) / simulations * 100)
+                if diagnostics is not None:
+                    diagnostics.callback_time += time.perf_counter() - callback_start
+            # 1. 스킬 (모든 시뮬레이션에서 같은 틱에 발동)
+            if is_skill_tick:
+                skill_critical = draw((n, hit_3)) < p_critical
+                skill_strong = draw((n, hit_3)) < p_strong_hit
+                damage_tick = base_damage_3 * np.where(skill_critical, critical_multiplier, 1.0)
+                damage_tick *= np.where(skill_strong, strong_hit_multiplier, 1.0)
+                if diagnostics is not None:
+                    diagnostics.ticks += n
+                    diagnostics.skill += n
+                    diagnostics.critical_proc += int(np.count_nonzero(skill_critical))
+                    diagnostics.strong_hit_proc += int(np.count_nonzero(skill_strong))
+                skill_damage = damage_tick.sum(axis=1)
+                damage += skill_damage
+                source_damage["skill"] += float(skill_damage.sum())
+                total_attacks += hit_3 * n
+                continue
+
+            # 2. 치명타 (쿨타임이 찬 시뮬레이션 중 치명타 확률 통과)
+            critical_mask = (critical_ready_tick <= tick) & (draw(n) < p_critical)
+            critical_count = int(np.count_nonzero(critical_mask))
+            if critical_count:
+                critical_strong = draw((critical_count, hit_2)) < p_strong_hit
+                damage_tick = base_damage_2 * np.where(critical_strong, strong_hit_multiplier, 1.0)
+                if diagnostics is not None:
+                    diagnostics.strong_hit_proc += int(np.count_nonzero(critical_strong))
+                critical_damage = damage_tick.sum(axis=1)
+                damage[critical_mask] += critical_damage
+                source_damage["critical"] += float(critical_damage.sum())
+                total_attacks += hit_2 * critical_count
+                critical_ready_tick[critical_mask] = tick + timeline.critical_period
+
+            # 3. 일반 공격 (더블샷/트리플샷 타수만큼만 유효한 타격으로 마스킹)
+            normal_count = n - critical_count
+            if diagnostics is not None:
+                diagnostics.ticks += n
+                diagnostics.critical += critical_count
+                diagnostics.normal += normal_count
+            if normal_count:
+                double_shot = draw(normal_count) < p_double_shot
+                triple_shot = draw(normal_count) < p_triple_shot
+                shot_count = np.where(triple_shot, 3, np.where(double_shot, 2, 1))
+                hit_mask = normal_hit_index < (shot_count * hit_1)[:, None]
+                # 더블샷/트리플 샷 일 때만 치명타 발생
+                critical_hit = (draw((normal_count, max_normal_hits)) < p_critical) & (shot_count > 1)[:, None]
+                strong_hit = draw((normal_count, max_normal_hits)) < p_strong_hit
+                damage_tick = base_damage_1 * np.where(critical_hit, critical_multiplier, 1.0)
+                damage_tick *= np.where(strong_hit, strong_hit_multiplier, 1.0)
+                if diagnostics is not None:
+                    diagnostics.double_shot += int(np.count_nonzero(shot_count == 2))
+                    diagnostics.triple_shot += int(np.count_nonzero(shot_count == 3))
+                    diagnostics.critical_proc += int(np.count_nonzero(critical_hit & hit_mask))
+                    diagnostics.strong_hit_proc += int(np.count_nonzero(strong_hit & hit_mask))
+                normal_hits = np.where(hit_mask, damage_tick, 0.0)
+                normal_damage = normal_hits.sum(axis=1)
+                # 앞쪽 hit_1개 타격(첫 발) 이후는 더블샷/트리플샷 추가타 (첫 발은 마지막에 나머지로 계산)
+                source_damage["extra_shot"] += float(normal_hits[:, hit_1:].sum())
+                if critical_count:
+                    damage[~critical_mask] += normal_damage
+                else:
+                    damage += normal_damage
+                total_attacks += int(shot_count.sum()) * hit_1
+
+        chunk_damage = float(damage.sum())
+        total_damage += chunk_damage
+        done += n
+
+        if stats is not None:
+            chunk_m2 = float(np.square(damage - chunk_damage / n).sum())
+            stats.add(n, chunk_damage, total_attacks - chunk_attacks_start, chunk_m2)
+            histogram.add_values(damage / minutes)
+
+        if progress_callback:
+            callback_start = time.perf_counter()
+            progress_callback(done / simulations * 100)
+            if diagnostics is not None:
+                diagnostics.callback_time += time.perf_counter() - callback_start
+
+    if stats is not None:
+        source_damage["normal"] = total_damage - source_damage["skill"] - source_damage["critical"] - source_damage["extra_shot"]
+        stats.add_sources(source_damage)
+        stats.add_histogram(histogram)
+    if diagnostics is not None:
+        diagnostics.total_time += time.perf_counter() - start_time
+        if stats is not None:
+            stats.diagnostics = diagnostics
+    return total_damage / (simulations * minutes), total_attacks / (simulations * minutes)
+
+
+def simulate_attacks_aggregate(
+    minutes=1,
+    simulations=1000,
+    attack_power=1,
+    attack_speed=120,
+    damage_skill_1=1,
+    damage_skill_2=2,
+    damage_skill_3=5,
+    p_critical=0.5,
+    p_strong_hit=0.1,
+    p_double_shot=0.1,
+    p_triple_shot=0.05,
+    critical_multiplier=2,
+    strong_hit_multiplier=2,
+    seventh_awakening_multiplier=1,
+    critical_cooldown=2,
+    skill_cooldown=10,
+    hit_1=1,
+    hit_2=1,
+    hit_3=1,
+    progress_callback=None,
+    third_awakening=False,
+    seed=None,
+    chunk_size=NUMPY_CHUNK_SIZE,
+    stats=None,
+    rng=None
+):
+    """결과별 타격 수를 직접 샘플링하는 집계 엔진 (시뮬레이션별 분포가 기존 엔진과 같음)
+
+    한 분기 안의 타격은 기본 × {1, 치명} × {1, 강타} 중 하나이므로 전투 데미지는 결과별 타격 수로 정해진다.
+    - 치명타 공격: 쿨타임이 찬 뒤 스킬이 아닌 틱마다 p_critical로 발동하므로, 다음 발동까지의 틱 수를
+      기하분포로 뽑아 건너뛴다 (스킬 틱은 치명타 판정을 하지 않음). 비용은 틱 수가 아니라 치명타 횟수에 비례한다.
+    - 일반 공격의 발사 수는 다항분포, 타격별 치명/강타는 이항/다항분포로 한 번에 뽑는다.
+      더블샷/트리플샷일 때만 치명타가 발생하는 규칙에 따라 1발 공격의 타격은 강타만 판정한다.
+    """
+    if np is None:
+        raise RuntimeError("NumPy가 설치되어 있지 않아 aggregate 엔진을 사용할 수 없습니다.")
+
+    attack_speed = int(attack_speed)
+    rng = rng.generator if rng is not None else np.random.default_rng(seed)
+    timeline = tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+    skill_schedule = np.array(timeline.skill_schedule, dtype=bool)
+    tick_count = timeline.tick_count
+    skill_count = timeline.skill_count
+    # 스킬이 아닌 틱 위치와, 틱 t 이후 첫 번째 비스킬 틱의 순번 (t가 끝을 넘으면 비스킬 틱 수)
+    normal_ticks = np.flatnonzero(~skill_schedule)
+    next_normal_rank = np.concatenate(([0], np.cumsum(~skill_schedule)))
+
+    base_damage_1 = damage_skill_1 * attack_power * seventh_awakening_multiplier
+    base_damage_2 = damage_skill_2 * attack_power * critical_multiplier * seventh_awakening_multiplier
+    base_damage_3 = damage_skill_3 * attack_power * seventh_awakening_multiplier
+    # 치명·강타 / 치명 / 강타 / 없음 확률과 각 결과의 배율
+    outcome_probs = [p_critical * p_strong_hit, p_critical * (1 - p_strong_hit), (1 - p_critical) * p_strong_hit,
+                     (1 - p_critical) * (1 - p_strong_hit)]
+    outcome_multipliers = np.array([critical_multiplier * strong_hit_multiplier, critical_multiplier, strong_hit_multiplier, 1.0])
+    # 트리플샷 판정이 더블샷 판정을 덮어씀: 1발 / 2발 / 3발 확률
+    shot_probs = [(1 - p_triple_shot) * (1 - p_double_shot), (1 - p_triple_shot) * p_double_shot, p_triple_shot]
+
+    def hit_damage(hits):
+        """hits개 타격의 치명/강타 결과별 배율 합 (시뮬레이션별 배열)"""
+        return rng.multinomial(hits, outcome_probs) @ outcome_multipliers
+
+    def strong_hit_damage(hits):
+        """강타만 판정하는 타격의 배율 합"""
+        return hits + rng.binomial(hits, p_strong_hit) * (strong_hit_multiplier - 1)
+
+    total_damage = 0.0
+    total_attacks = 0
+    source_damage = dict.fromkeys(DAMAGE_SOURCE_KEYS, 0.0)
+    histogram = DpmHistogram() if stats is not None else None
+
+    done = 0
+    while done < simulations:
+        n = min(chunk_size, simulations - done)
+
+        # 1. 치명타 공격 횟수: 쿨타임이 찬 틱부터 기하분포만큼 비스킬 틱을 건너뛰며 발동 위치를 찾음
+        critical_count = np.zeros(n, dtype=np.int64)
+        if p_critical > 0 and len(normal_ticks):
+            ready_tick = np.full(n, timeline.first_critical_tick, dtype=np.int64)
+            active = np.arange(n)
+            while len(active):
+                target = next_normal_rank[np.minimum(ready_tick[active], tick_count)] + rng.geometric(min(p_critical, 1.0), len(active)) - 1
+                fired = target < len(normal_ticks)
+                active = active[fired]
+                critical_count[active] += 1
+                ready_tick[active] = normal_ticks[target[fired]] + timeline.critical_period
+        normal_count = len(normal_ticks) - critical_count
+
+        # 2. 결과별 타격 수로 데미지 계산
+        skill_damage = base_damage_3 * hit_damage(np.full(n, skill_count * hit_3))
+        critical_damage = base_damage_2 * strong_hit_damage(critical_count * hit_2)
+        shots = rng.multinomial(normal_count, shot_probs)
+        multi_shots = shots[:, 1] + shots[:, 2]
+        normal_damage = base_damage_1 * (strong_hit_damage(shots[:, 0] * hit_1) + hit_damage(multi_shots * hit_1))
+        extra_shot_damage = base_damage_1 * hit_damage((shots[:, 1] + 2 * shots[:, 2]) * hit_1)
+        damage = skill_damage + critical_damage + normal_damage + extra_shot_damage
+        attacks = skill_count * hit_3 * n + int(critical_count.sum()) * hit_2 + int((shots[:, 0] + 2 * shots[:, 1] + 3 * shots[:, 2]).sum()) * hit_1
+
+        chunk_damage = float(damage.sum())
+        total_damage += chunk_damage
+        total_attacks += attacks
+        done += n
+        if stats is not None:
+            stats.add(n, chunk_damage, attacks, float(np.square(damage - chunk_damage / n).sum()))
+            for key, values in (("skill", skill_damage), ("critical", critical_damage), ("normal", normal_damage), ("extra_shot", extra_shot_damage)):
+                source_damage[key] += float(values.sum())
+            histogram.add_values(damage / minutes)
+        if progress_callback:
+            progress_callback(done / simulations * 100)
+
+    if stats is not None:
+        stats.add_sources(source_damage)
+        stats.add_histogram(histogram)
+    return total_damage / (simulations * minutes), total_attacks / (simulations * minutes)
+
+
+@lru_cache(maxsize=EXACT_PROFILE_CACHE_SIZE)
+def expected_critical_attacks(timeline, p_critical):
+    """전투 한 번의 치명타 공격 기대 횟수 (치명타 쿨타임 상태에 대한 동적 계획법)
+
+    결과는 틱 타임라인과 치명 확률에만 의존하므로 캐시해 두고, 다른 스탯만 다른 빌드는 재사용한다.
+    스킬 주기 한 블록이 지날 때마다 치명타 상태 분포를 이전 블록들과 비교해, 분포가 반복되면(정상 상태 도달)
+    남은 블록은 반복 주기의 합으로 한 번에 더하므로 긴 전투도 시간과 무관한 비용으로 계산한다.
+    """
+    # 치명타 상태: 마지막 치명타 이후 경과 틱 수 (ready_state 이상이면 쿨타임 충족, 하나의 상태로 합침)
+    ready_state = timeline.critical_ticks
+    state_probs = [0.0] * (ready_state + 1)
+    # 3각이면 첫 틱부터 치명타 쿨타임 충족 상태
+    state_probs[ready_state if timeline.first_critical_tick == 0 else 0] = 1.0
+
+    def step(state_probs, is_skill_tick):
+        """한 틱 진행 → (다음 상태 분포, 치명타 공격 확률)"""
+        next_probs = [0.0] * (ready_state + 1)
+        if is_skill_tick:
+            for state, prob in enumerate(state_probs):
+                next_probs[min(state + 1, ready_state)] += prob
+            return next_probs, 0.0
+        p_critical_attack = state_probs[ready_state] * p_critical
+        # 치명타 발동 시 경과 시간 0으로 초기화 후 한 틱 진행
+        next_probs[min(1, ready_state)] += p_critical_attack
+        for state in range(ready_state):
+            next_probs[state + 1] += state_probs[state]
+        next_probs[ready_state] += state_probs[ready_state] * (1 - p_critical)
+        return next_probs, p_critical_attack
+
+    total = 0.0
+
+    def advance(state_probs, pattern, repetitions):
+        """같은 틱 패턴을 repetitions번 진행 (상태 분포가 주기적으로 반복되면 남은 반복은 주기 합으로 외삽)"""
+        nonlocal total
+        history = deque(maxlen=EXACT_MAX_CYCLE_BLOCKS)  # 최근 블록의 (시작 분포, 블록 치명타 기대 횟수)
+        done = 0
+        while done < repetitions:
+            for lag, (previous_probs, _) in enumerate(reversed(history), 1):
+                if max(abs(a - b) for a, b in zip(state_probs, previous_probs)) <= EXACT_CYCLE_TOLERANCE:
+                    # lag 블록 전과 같은 분포 → 마지막 lag 블록의 기대 횟수가 그대로 반복
+                    cycles = (repetitions - done) // lag
+                    total += sum(block for _, block in list(history)[-lag:]) * cycles
+                    done += cycles * lag
+                    history.clear()
+                    break
+            if done >= repetitions:
+                break
+            block = 0.0
+            start_probs = state_probs
+            for is_skill_tick in pattern:
+                state_probs, p_critical_attack = step(state_probs, is_skill_tick)
+                block += p_critical_attack
+            total += block
+            history.append((start_probs, block))
+            done += 1
+        return state_probs
+
+    # 첫 스킬 전 구간 → 스킬 주기 블록 반복 → 전투 종료 직전의 남은 틱
+    first_skill_tick = min(timeline.first_skill_tick, timeline.tick_count)
+    state_probs = advance(state_probs, (False,), first_skill_tick)
+    cycle_ticks = timeline.tick_count - first_skill_tick
+    block_pattern = (True,) + (False,) * (timeline.skill_period - 1)
+    state_probs = advance(state_probs, block_pattern, cycle_ticks // timeline.skill_period)
+    advance(state_probs, block_pattern[:cycle_ticks % timeline.skill_period], 1)
+    return total
+
+
+def expected_tick_values(attack_power, damage_skill_1, damage_skill_2, damage_skill_3, p_critical, p_strong_hit, p_double_shot, p_triple_shot,
+                         critical_multiplier, strong_hit_multiplier, seventh_awakening_multiplier, hit_1, hit_2, hit_3):
+    """틱 종류별 기대값 → (스킬 틱 데미지, 치명타 틱 데미지, 일반 틱 첫 발 데미지, 일반 틱 추가타 데미지, 일반 틱 타격 수)
+
+    타임라인과 무관한 스탯만으로 정해지므로 exact 엔진과 근사 표(SurrogateTable)가 함께 사용한다.
+    """
+    # 타격 1회당 치명/강타 기대 배율
+    critical_factor = 1 + p_critical * (critical_multiplier - 1)
+    strong_hit_factor = 1 + p_strong_hit * (strong_hit_multiplier - 1)
+
+    # 1. 스킬
+    skill_damage = hit_3 * damage_skill_3 * attack_power * seventh_awakening_multiplier * critical_factor * strong_hit_factor
+    # 2. 치명타
+    critical_damage = hit_2 * damage_skill_2 * attack_power * critical_multiplier * seventh_awakening_multiplier * strong_hit_factor
+    # 3. 일반 공격 (트리플샷 판정이 더블샷 판정을 덮어씀, 더블샷/트리플 샷 일 때만 치명타 발생)
+    p_three_shots = p_triple_shot
+    p_two_shots = (1 - p_triple_shot) * p_double_shot
+    p_one_shot = (1 - p_triple_shot) * (1 - p_double_shot)
+    normal_shot_damage = hit_1 * damage_skill_1 * attack_power * seventh_awakening_multiplier * strong_hit_factor
+    first_shot_damage = normal_shot_damage * (p_one_shot + (p_two_shots + p_three_shots) * critical_factor)
+    extra_shot_damage = normal_shot_damage * (p_two_shots + 2 * p_three_shots) * critical_factor
+    normal_attacks = hit_1 * (p_one_shot + 2 * p_two_shots + 3 * p_three_shots)
+    return skill_damage, critical_damage, first_shot_damage, extra_shot_damage, normal_attacks
+
+
+def expected_attacks_with_critical_and_skill(
+    minutes=1,
+    simulations=None,
+    attack_power=1,
+    attack_speed=120,
+    damage_skill_1=1,
+    damage_skill_2=2,
+    damage_skill_3=5,
+    p_critical=0.5,
+    p_strong_hit=0.1,
+    p_double_shot=0.1,
+    p_triple_shot=0.05,
+    critical_multiplier=2,
+    strong_hit_multiplier=2,
+    seventh_awakening_multiplier=1,
+    critical_cooldown=2,
+    skill_cooldown=10,
+    hit_1=1,
+    hit_2=1,
+    hit_3=1,
+    progress_callback=None,
+    third_awakening=False,
+    stats=None
+):
+    """시뮬레이션 없이 DPM/APM 기댓값을 정확히 계산 (치명타 쿨타임 상태에 대한 동적 계획법)
+
+    simulations, progress_callback은 다른 엔진과 호출 형식을 맞추기 위한 인자로 사용하지 않는다.
+    stats를 넘기면 기댓값을 한 번의 시뮬레이션으로 기록하고 출처별 기대 데미지도 함께 기록한다.
+
+    틱마다 치명타 공격이 나갈 확률만 동적 계획법(expected_critical_attacks, 캐시됨)으로 구하고, 데미지/타격 수는
+    그 기대 횟수에 대해 선형이므로 바로 계산한다. 따라서 공격 속도/쿨타임/치명 확률이 같은 빌드끼리는 동적 계획법을 다시 풀지 않는다.
+    """
+    timeline = tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+    expected_critical_attack_count = expected_critical_attacks(timeline, p_critical)
+    skill_damage, critical_damage, first_shot_damage, extra_shot_damage, normal_attacks = expected_tick_values(
+        attack_power, damage_skill_1, damage_skill_2, damage_skill_3, p_critical, p_strong_hit, p_double_shot, p_triple_shot,
+        critical_multiplier, strong_hit_multiplier, seventh_awakening_multiplier, hit_1, hit_2, hit_3
+    )
+    normal_damage = first_shot_damage + extra_shot_damage
+
+    skill_ticks = timeline.skill_count
+    expected_normal_attacks = timeline.tick_count - skill_ticks - expected_critical_attack_count
+    expected_damage = skill_ticks * skill_damage + expected_critical_attack_count * critical_damage + expected_normal_attacks * normal_damage
+    expected_attacks = skill_ticks * hit_3 + expected_critical_attack_count * hit_2 + expected_normal_attacks * normal_attacks
+
+    if stats is not None:
+        stats.add(1, expected_damage, expected_attacks)
+        stats.add_sources({
+            "skill": skill_ticks * skill_damage,
+            "critical": expected_critical_attack_count * critical_damage,
+            "normal": expected_normal_attacks * first_shot_damage,
+            "extra_shot": expected_normal_attacks * extra_shot_damage
+        })
+    return expected_damage / minutes, expected_attacks / minutes
+
+
+def available_engines():
+    """현재 환경에서 사용 가능한 엔진 이름 목록"""
+    return [engine for engine in SIMULATION_ENGINES if engine not in (ENGINE_NUMPY, ENGINE_AGGREGATE) or np is not None]
+
+
+# 엔진 이름 → 시뮬레이션 함수
+SIMULATION_ENGINES = {
+    ENGINE_PYTHON: simulate_attacks_with_critical_and_skill,
+    ENGINE_NUMPY: simulate_attacks_numpy,
+    ENGINE_AGGREGATE: simulate_attacks_aggregate,
+    ENGINE_EXACT: expected_attacks_with_critical_and_skill,
+}
+
+
+class DpmHistogram:
+    """시뮬레이션별 DPM 분포 (로그 간격 고정 구간 히스토그램)
+
+    구간 경계가 HISTOGRAM_GAMMA의 거듭제곱으로 고정되어 있어 샤드끼리 그대로 더해 병합할 수 있고,
+    메모리는 시뮬레이션 횟수가 아니라 DPM 값의 범위(구간 수)에만 비례한다.
+    """
+
+    LOG_GAMMA = math.log(HISTOGRAM_GAMMA)
+
+    def __init__(self):
+        self.counts = {}  # 구간 번호 → 시뮬레이션 수 (구간 i는 (γ^(i-1), γ^i])
+        self.zero_count = 0  # 0 이하 (데미지 없음)
+        self.total = 0
+
+    def add(self, value):
+        if value > 0:
+            index = math.ceil(math.log(value) / DpmHistogram.LOG_GAMMA)
+            self.counts[index] = self.counts.get(index, 0) + 1
+        else:
+            self.zero_count += 1
+        self.total += 1
+
+    def add_values(self, values):
+        """값 배열 누적 (NumPy 배열이면 구간 번호를 한 번에 계산)"""
+        if np is not None and isinstance(values, np.ndarray):
+            positive = values[values > 0]
+            self.zero_count += len(values) - len(positive)
+            self.total += len(values)
+            if not len(positive):
+                return
+            indexes = np.ceil(np.log(positive) / DpmHistogram.LOG_GAMMA).astype(np.int64)
+            offset = int(indexes.min())
+            # 구간 번호 범위가 좁으므로 정렬 없이 bincount로 집계
+            for index, count in enumerate(np.bincount(indexes - offset).tolist(), offset):
+                if count:
+                    self.counts[index] = self.counts.get(index, 0) + count
+        else:
+            for value in values:
+                self.add(value)
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.total += other.total
+
+    def quantile(self, q):
+        """q(0~1) 분위수 (해당 구간의 대표값 2γ^i / (γ + 1)로 근사)"""
+        if not self.total:
+            return None
+        rank = q * (self.total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if rank < seen:
+                return 2 * HISTOGRAM_GAMMA ** index / (HISTOGRAM_GAMMA + 1)
+        return 2 * HISTOGRAM_GAMMA ** max(self.counts) / (HISTOGRAM_GAMMA + 1)
+
+    def to_dict(self):
+        """캐시 저장용 딕셔너리 (JSON 키는 문자열)"""
+        return {"counts": {str(index): count for index, count in self.counts.items()}, "zero_count": self.zero_count}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.zero_count = data["zero_count"]
+        histogram.total = histogram.zero_count + sum(histogram.counts.values())
+        return histogram
+
+
+class SimulationStats:
+    """시뮬레이션 합계 (샤드/배치 결과를 평균이 아닌 합계로 정확히 병합)
+
+    damage_m2는 시뮬레이션별 데미지의 편차 제곱합으로, DPM 신뢰구간 계산에 사용한다.
+    source_damage는 DAMAGE_SOURCES별 데미지 합계, histogram은 시뮬레이션별 DPM 분포다 (기록한 엔진에서만).
+    """
+
+    def __init__(self, minutes, engine=DEFAULT_ENGINE, seed=None):
+        self.minutes = minutes
+        self.engine = engine
+        self.seed = seed
+        self.simulations = 0
+        self.total_damage = 0.0
+        self.total_attacks = 0
+        self.damage_m2 = 0.0
+        self.elapsed = 0.0  # 실행 시간 (초)
+        self.from_cache = False
+        self.diagnostics = None  # KernelDiagnostics (계측을 켠 실행에서만)
+        self.source_damage = None
+        self.histogram = None
+        self.rng_algorithm = default_rng_algorithm(engine)  # 시드와 함께 결과 재현에 필요한 난수 알고리즘
+
+    def add(self, simulations, total_damage, total_attacks, damage_m2=0.0):
+        """엔진 한 번 실행분의 합계 누적 (편차 제곱합은 병렬 분산 공식으로 병합)"""
+        if simulations == 0:
+            return
+        if self.simulations:
+            count = self.simulations + simulations
+            delta = total_damage / simulations - self.total_damage / self.simulations
+            self.damage_m2 += damage_m2 + delta * delta * self.simulations * simulations / count
+        else:
+            self.damage_m2 = damage_m2
+        self.simulations += simulations
+        self.total_damage += total_damage
+        self.total_attacks += total_attacks
+
+    def merge(self, other):
+        """다른 샤드의 합계 병합"""
+        self.add(other.simulations, other.total_damage, other.total_attacks, other.damage_m2)
+        self.add_sources(other.source_damage)
+        self.add_histogram(other.histogram)
+        if other.diagnostics is not None:
+            if self.diagnostics is None:
+                self.diagnostics = KernelDiagnostics()
+            self.diagnostics.merge(other.diagnostics)
+
+    def to_dict(self):
+        """캐시 저장용 딕셔너리"""
+        return {
+            "minutes": self.minutes,
+            "engine": self.engine,
+            "seed": self.seed,
+            "simulations": self.simulations,
+            "total_damage": self.total_damage,
+            "total_attacks": self.total_attacks,
+            "damage_m2": self.damage_m2,
+            "elapsed": self.elapsed,
+            "rng_algorithm": self.rng_algorithm,
+            "source_damage": self.source_damage,
+            "histogram": self.histogram.to_dict() if self.histogram is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data["minutes"], engine=data["engine"], seed=data["seed"])
+        stats.simulations = data["simulations"]
+        stats.total_damage = data["total_damage"]
+        stats.total_attacks = data["total_attacks"]
+        stats.damage_m2 = data["damage_m2"]
+        stats.elapsed = data["elapsed"]
+        stats.rng_algorithm = data.get("rng_algorithm", stats.rng_algorithm)
+        stats.source_damage = data.get("source_damage")
+        if data.get("histogram") is not None:
+            stats.histogram = DpmHistogram.from_dict(data["histogram"])
+        return stats
+
+    def add_values(self, values, total_attacks=0, distribution=False):
+        """시뮬레이션별 데미지(또는 데미지 차이) 목록 누적 (distribution=True면 DPM 분포에도 기록)"""
+        count = len(values)
+        total = math.fsum(values)
+        mean = total / count
+        self.add(count, total, total_attacks, math.fsum((value - mean) ** 2 for value in values))
+        if distribution:
+            histogram = DpmHistogram()
+            histogram.add_values([value / self.minutes for value in values])
+            self.add_histogram(histogram)
+
+    def add_sources(self, source_damage):
+        """출처별 데미지 합계 누적"""
+        if source_damage is None:
+            return
+        if self.source_damage is None:
+            self.source_damage = dict.fromkeys(DAMAGE_SOURCE_KEYS, 0.0)
+        for key, damage in source_damage.items():
+            self.source_damage[key] += damage
+
+    def add_histogram(self, histogram):
+        """시뮬레이션별 DPM 분포 병합"""
+        if histogram is None:
+            return
+        if self.histogram is None:
+            self.histogram = DpmHistogram()
+        self.histogram.merge(histogram)
+
+    @property
+    def source_dpm(self):
+        """출처별 DPM (DAMAGE_SOURCES 순서의 딕셔너리, 기록하지 않은 엔진은 None)"""
+        if self.source_damage is None or not self.simulations:
+            return None
+        return {key: self.source_damage[key] / (self.simulations * self.minutes) for key in DAMAGE_SOURCE_KEYS}
+
+    def dpm_percentile(self, percent):
+        """시뮬레이션별 DPM의 백분위수 (분포를 기록하지 않았으면 None)"""
+        if self.histogram is None:
+            return None
+        return self.histogram.quantile(percent / 100)
+
+    @property
+    def dpm(self):
+        return self.total_damage / (self.simulations * self.minutes)
+
+    @property
+    def apm(self):
+        return self.total_attacks / (self.simulations * self.minutes)
+
+    @property
+    def dpm_std_error(self):
+        """DPM 평균의 표준오차 (exact 엔진은 0)"""
+        if self.engine == ENGINE_EXACT or self.simulations < 2:
+            return 0.0
+        variance = self.damage_m2 / (self.simulations - 1)
+        return math.sqrt(variance / self.simulations) / self.minutes
+
+    @property
+    def dpm_half_width(self):
+        """DPM 신뢰구간 반폭 (CONFIDENCE_Z 기준)"""
+        return CONFIDENCE_Z * self.dpm_std_error
+
+    @property
+    def relative_error(self):
+        """DPM 대비 신뢰구간 반폭 비율"""
+        return self.dpm_half_width / self.dpm if self.dpm else 0.0
+
+
+def derive_seed(master_seed, *keys):
+    """마스터 시드와 키(샤드 번호 등)로부터 독립적인 64비트 시드 생성"""
+    text = ":".join(str(value) for value in (master_seed,) + keys)
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def new_master_seed():
+    """시드가 지정되지 않았을 때 사용할 무작위 마스터 시드 (결과 재현을 위해 기록)"""
+    return random.SystemRandom().getrandbits(63)
+
+
+def available_rng_algorithms():
+    """현재 환경에서 사용 가능한 난수 알고리즘 이름 목록"""
+    return [algorithm for algorithm in RNG_ALGORITHMS if algorithm == RNG_MT19937 or np is not None]
+
+
+def default_rng_algorithm(engine):
+    """엔진의 기본 난수 알고리즘 (exact 엔진은 난수를 쓰지 않으므로 None)"""
+    return DEFAULT_RNG_ALGORITHMS.get(engine)
+
+
+class RandomStream:
+    """시드로 재현 가능한 균등 난수 스트림 (모든 엔진이 공통으로 사용)
+
+    random()은 파이썬 커널용으로 [0, 1) 난수를 하나씩 반환하고, generator는 NumPy 엔진용
+    numpy.random.Generator다. 같은 스트림에서 둘을 함께 쓰면 상태를 공유하므로 한쪽만 사용한다.
+    NumPy 알고리즘은 block_size개씩 미리 생성해 두고 C 수준 반복자로 꺼내 호출당 비용을 줄인다.
+    mt19937은 파이썬 random.Random을 그대로 쓴다 (호출 자체가 C 함수라 블록으로 모아도 빨라지지 않음).
+    spawn()은 샤드/시뮬레이션별로 서로 독립인 자식 스트림을 만든다.
+    """
+
+    def __init__(self, seed=None, algorithm=RNG_MT19937, block_size=RNG_BLOCK_SIZE):
+        if algorithm not in RNG_ALGORITHMS:
+            raise ValueError(f"알 수 없는 난수 알고리즘: {algorithm}")
+        if algorithm != RNG_MT19937 and np is None:
+            raise RuntimeError(f"NumPy가 설치되어 있지 않아 {algorithm} 알고리즘을 사용할 수 없습니다.")
+        self.seed = new_master_seed() if seed is None else seed
+        self.algorithm = algorithm
+        self.block_size = block_size
+        self._generator = None
+        if algorithm == RNG_MT19937:
+            self.random = random.Random(self.seed).random
+        else:
+            self.random = itertools.chain.from_iterable(self._blocks()).__next__
+
+    def _blocks(self):
+        generator = self.generator
+        while True:
+            yield generator.random(self.block_size).tolist()
+
+    @property
+    def generator(self):
+        if self._generator is None:
+            if np is None:
+                raise RuntimeError("NumPy가 설치되어 있지 않아 numpy 엔진을 사용할 수 없습니다.")
+            self._generator = np.random.Generator(getattr(np.random, RNG_ALGORITHMS[self.algorithm])(self.seed))
+        return self._generator
+
+    def spawn(self, *keys, block_size=None):
+        """키(샤드 번호 등)로 유도한 시드의 독립 자식 스트림 (같은 알고리즘)"""
+        return RandomStream(derive_seed(self.seed, *keys), self.algorithm, block_size or self.block_size)
+
+
+_process_pool = None
+_process_pool_workers = 0
+
+
+def get_process_pool(workers):
+    """상주 프로세스 풀 반환 (비교할 때마다 프로세스를 새로 띄우지 않도록 재사용)"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is None or _process_pool_workers != workers:
+        shutdown_process_pool()
+        # 워커 프로세스의 풀이면 풀 프로세스도 같은 취소 요청 공유 값을 확인
+        _process_pool = ProcessPoolExecutor(max_workers=workers, initializer=configure_shard_stop if _shard_stop_flags else None,
+                                            initargs=_shard_stop_flags or ())
+        _process_pool_workers = workers
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """상주 프로세스 풀 종료"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_workers = 0
+
+
+class ResultCache:
+    """시뮬레이션 결과 캐시 (메모리 LRU + 항목 수 제한이 있는 SQLite 디스크 캐시)
+
+    값은 to_dict()로 만든 딕셔너리이며, 디스크를 쓸 수 없으면 메모리 캐시만 사용한다.
+    디스크 적중의 사용 시각은 모아 두었다가 다음 저장 때(또는 CACHE_TOUCH_BATCH개마다) 한 번에 기록하고,
+    오래된 항목 정리는 항목 수가 최대치를 넘을 때만 last_used 인덱스로 한다.
+    """
+
+    def __init__(self, path=CACHE_FILE, memory_entries=CACHE_MEMORY_ENTRIES, disk_entries=CACHE_DISK_ENTRIES):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.memory = OrderedDict()
+        self.connection = None
+        self.disk_count = 0  # 디스크 항목 수 추정치 (덮어쓴 저장도 세므로 실제보다 크거나 같음)
+        self.pending_touches = {}  # 아직 기록하지 않은 디스크 적중의 키 → 사용 시각
+
+    def _connect(self):
+        if self.connection is None and self.path:
+            try:
+                self.connection = sqlite3.connect(self.path, timeout=5)
+                self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)")
+                self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+                self.connection.commit()
+                self.disk_count = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            except sqlite3.Error:
+                self.connection = None
+                self.path = None
+        return self.connection
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def get(self, key):
+        """캐시된 값 반환 (없으면 None)"""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value = json.loads(row[0])
+            self.pending_touches[key] = time.time()
+            if len(self.pending_touches) >= CACHE_TOUCH_BATCH:
+                self._flush_touches(connection)
+                connection.commit()
+        except (sqlite3.Error, ValueError):
+            return None
+        self._remember(key, value)
+        return value
+    
+    def _flush_touches(self, connection):
+        """모아 둔 디스크 적중의 사용 시각 기록 (커밋은 호출한 쪽에서)"""
+        if self.pending_touches:
+            connection.executemany("UPDATE results SET last_used = ? WHERE key = ?", [(used, key) for key, used in self.pending_touches.items()])
+            self.pending_touches.clear()
+    
+    def _prune(self, connection):
+        """최대 항목 수를 넘었으면 오래 사용하지 않은 항목을 CACHE_PRUNE_BATCH개 더 지움 (커밋은 호출한 쪽에서)"""
+        self.disk_count = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if self.disk_count <= self.disk_entries:
+            return
+        excess = self.disk_count - max(self.disk_entries - CACHE_PRUNE_BATCH, 0)
+        connection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+        self.disk_count -= excess
+
+    def put(self, key, value):
+        """값 저장 (디스크 캐시가 최대 항목 수를 넘으면 오래 사용하지 않은 항목부터 삭제)"""
+        self._remember(key, value)
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            self._flush_touches(connection)
+            connection.execute("INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)", (key, json.dumps(value), time.time()))
+            self.disk_count += 1
+            if self.disk_count > self.disk_entries:
+                self._prune(connection)
+            connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """메모리/디스크 캐시 비우기"""
+        self.memory.clear()
+        self.pending_touches.clear()
+        connection = self._connect()
+        if connection is not None:
+            connection.execute("DELETE FROM results")
+            connection.commit()
+            self.disk_count = 0
+
+
+_result_cache = None
+
+
+def get_result_cache():
+    """프로세스 공용 결과 캐시 반환"""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
+
+
+def result_cache_key(kind, params, minutes, simulations, engine, seed, rng_algorithm=None):
+    """시뮬레이션 파라미터 전체 + 시간/횟수/시드/난수 알고리즘/엔진 버전으로 만든 정규화된 캐시 키
+
+    숫자는 float로 통일해 1과 1.0이 같은 키가 되게 하고, exact 엔진은 횟수/시드와 무관하다.
+    """
+    def canonical(value):
+        if isinstance(value, dict):
+            return {key: canonical(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [canonical(item) for item in value]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return value
+
+    if engine == ENGINE_EXACT:
+        simulations, seed, rng_algorithm = 0, None, None
+    payload = {
+        "kind": kind,
+        "version": ENGINE_VERSION,
+        "engine": engine,
+        "rng": rng_algorithm or default_rng_algorithm(engine),
+        "params": canonical(params),
+        "minutes": float(minutes),
+        "simulations": int(simulations),
+        "seed": seed
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def run_simulation_shard(engine, params, minutes, simulations, seed, diagnostics=False, rng_algorithm=None):
+    """샤드 하나를 자체 시드의 난수 스트림으로 실행 (프로세스 풀 작업 단위)
+
+    diagnostics=True면 계측을 켜고 실행해 stats.diagnostics에 KernelDiagnostics를 기록한다 (결과는 같음).
+    rng_algorithm이 None이면 엔진의 기본 난수 알고리즘을 사용한다.
+    """
+    check_shard_stop()
+    # 워커 작업으로 실행 중이면 커널이 진행률 콜백 자리에서 취소 요청을 확인 (샤드가 끝나기를 기다리지 않고 중단)
+    stop_check = check_shard_stop if _shard_stop_flags is not None else None
+    stats = SimulationStats(minutes, engine=engine)
+    rng = RandomStream(seed, rng_algorithm or default_rng_algorithm(engine))
+    if engine == ENGINE_AGGREGATE:
+        # 집계 엔진은 타격별 판정을 하지 않으므로 계측 대상이 아님
+        simulate_attacks_aggregate(minutes=minutes, simulations=simulations, rng=rng, stats=stats, progress_callback=stop_check, **params)
+    elif engine == ENGINE_NUMPY:
+        simulate_attacks_numpy(minutes=minutes, simulations=simulations, rng=rng, stats=stats,
+                               diagnostics=KernelDiagnostics() if diagnostics else None, progress_callback=stop_check, **params)
+    else:
+        simulate_attacks_with_critical_and_skill(minutes=minutes, simulations=simulations, rng=rng, stats=stats,
+                                                 diagnostics=KernelDiagnostics() if diagnostics else None, progress_callback=stop_check, **params)
+    return stats
+
+
+class PairedComparison:
+    """공통 난수 비교 결과 (캐릭터별 합계 + 시뮬레이션별 DPM 차이(캐릭터 2 - 캐릭터 1)의 합계)"""
+
+    def __init__(self, minutes, engine=DEFAULT_ENGINE, seed=None):
+        self.minutes = minutes
+        self.engine = engine
+        self.seed = seed
+        self.stats1 = SimulationStats(minutes, engine=engine, seed=seed)
+        self.stats2 = SimulationStats(minutes, engine=engine, seed=seed)
+        # 차이 통계는 SimulationStats의 누적/병합 방식을 그대로 사용 (공격 횟수는 사용하지 않음)
+        self.difference = SimulationStats(minutes, engine=engine, seed=seed)
+        self.elapsed = 0.0
+        self.from_cache = False
+
+    def add_damages(self, damages1, damages2, attacks1, attacks2):
+        """같은 난수로 얻은 시뮬레이션별 데미지 두 묶음 누적"""
+        self.stats1.add_values(damages1, attacks1, distribution=True)
+        self.stats2.add_values(damages2, attacks2, distribution=True)
+        self.difference.add_values([damage2 - damage1 for damage1, damage2 in zip(damages1, damages2)])
+
+    def merge(self, other):
+        """다른 샤드의 결과 병합"""
+        self.stats1.merge(other.stats1)
+        self.stats2.merge(other.stats2)
+        self.difference.merge(other.difference)
+
+    def to_dict(self):
+        """캐시 저장용 딕셔너리"""
+        return {"stats1": self.stats1.to_dict(), "stats2": self.stats2.to_dict(), "difference": self.difference.to_dict(), "elapsed": self.elapsed}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats1 = SimulationStats.from_dict(data["stats1"])
+        comparison = cls(stats1.minutes, engine=stats1.engine, seed=stats1.seed)
+        comparison.stats1 = stats1
+        comparison.stats2 = SimulationStats.from_dict(data["stats2"])
+        comparison.difference = SimulationStats.from_dict(data["difference"])
+        comparison.elapsed = data["elapsed"]
+        return comparison
+
+    @property
+    def simulations(self):
+        return self.difference.simulations
+
+    @property
+    def dpm_difference(self):
+        """DPM 차이 평균 (캐릭터 2 - 캐릭터 1)"""
+        return self.difference.dpm
+
+    @property
+    def difference_half_width(self):
+        """DPM 차이 신뢰구간 반폭 (짝지은 표준오차 기준)"""
+        return self.difference.dpm_half_width
+
+    @property
+    def relative_error(self):
+        """평균 DPM 대비 차이 신뢰구간 반폭 비율 (적응형 모드 종료 판정용)"""
+        mean_dpm = (self.stats1.dpm + self.stats2.dpm) / 2
+        return self.difference_half_width / mean_dpm if mean_dpm else 0.0
+
+    @property
+    def p_value(self):
+        """DPM 차이가 0이라는 가설에 대한 양측 p-값 (정규 근사)"""
+        std_error = self.difference.dpm_std_error
+        if std_error == 0:
+            return 0.0 if self.dpm_difference else 1.0
+        return math.erfc(abs(self.dpm_difference / std_error) / math.sqrt(2))
+
+    @property
+    def is_significant(self):
+        return self.p_value < SIGNIFICANCE_LEVEL
+
+
+def simulate_common_random_python(params_list, minutes, simulations, seed, rng_algorithm=RNG_MT19937):
+    """여러 캐릭터가 시뮬레이션마다 같은 시드로 시작하는 공통 난수 시뮬레이션 (순수 파이썬)
+
+    시뮬레이션 i는 마스터 스트림의 자식 스트림 i를 캐릭터마다 새로 열어 같은 난수열을 쓴다.
+    (캐릭터별 시뮬레이션 데미지 리스트의 리스트, 캐릭터별 총 공격 횟수 리스트)를 반환한다.
+    """
+    master = RandomStream(seed, rng_algorithm, RNG_SIMULATION_BLOCK_SIZE)
+    damages_list = [[] for _ in params_list]
+    attacks = [0] * len(params_list)
+    for simulation in range(simulations):
+        check_shard_stop()
+        for index, params in enumerate(params_list):
+            rng = master.spawn(simulation)
+            stats = SimulationStats(minutes)
+            simulate_attacks_with_critical_and_skill(minutes=minutes, simulations=1, rng=rng, stats=stats, **params)
+            damages_list[index].append(stats.total_damage)
+            attacks[index] += stats.total_attacks
+    return damages_list, attacks
+
+
+def simulate_common_random_numpy(params_list, minutes, simulations, seed, rng_algorithm=RNG_PCG64):
+    """여러 캐릭터를 같은 틱마다 같은 난수 배열로 진행하는 공통 난수 시뮬레이션 (NumPy)
+
+    분기와 관계없이 틱마다 모든 판정용 난수를 시뮬레이션 수만큼 뽑아 모든 캐릭터가 같은 위치의 난수를 쓰게 한다.
+    """
+    if np is None:
+        raise RuntimeError("NumPy가 설치되어 있지 않아 numpy 엔진을 사용할 수 없습니다.")
+    rng = RandomStream(seed, rng_algorithm).generator
+    n = simulations
+    characters = []
+    for params in params_list:
+        timeline = tick_timeline(minutes, int(params["attack_speed"]), params["skill_cooldown"], params["critical_cooldown"], params["third_awakening"])
+        characters.append({
+            "params": params,
+            "critical_period": timeline.critical_period,
+            "schedule": timeline.skill_schedule,
+            "damage": np.zeros(n),
+            "attacks": 0,
+            "critical_ready_tick": np.full(n, timeline.first_critical_tick, dtype=np.int64)
+        })
+    max_hit_1 = 3 * max(params["hit_1"] for params in params_list)
+    max_hit_2 = max(params["hit_2"] for params in params_list)
+    max_hit_3 = max(params["hit_3"] for params in params_list)
+    normal_hit_index = np.arange(max_hit_1)
+    check_every = max(1, KERNEL_CHECK_TICKS // max(n * len(params_list), 1))
+
+    for tick in range(max(len(character["schedule"]) for character in characters)):
+        if tick % check_every == 0:
+            check_shard_stop()
+        skill_critical_draw = rng.random((n, max_hit_3))
+        skill_strong_draw = rng.random((n, max_hit_3))
+        critical_attack_draw = rng.random(n)
+        critical_strong_draw = rng.random((n, max_hit_2))
+        double_shot_draw = rng.random(n)
+        triple_shot_draw = rng.random(n)
+        normal_critical_draw = rng.random((n, max_hit_1))
+        normal_strong_draw = rng.random((n, max_hit_1))
+
+        for character in characters:
+            if tick >= len(character["schedule"]):
+                continue
+            p = character["params"]
+            base = p["attack_power"] * p["seventh_awakening_multiplier"]
+            critical_ready_tick = character["critical_ready_tick"]
+            if character["schedule"][tick]:
+                hits = p["hit_3"]
+                damage_tick = p["damage_skill_3"] * base * np.where(skill_critical_draw[:, :hits] < p["p_critical"], p["critical_multiplier"], 1.0)
+                damage_tick *= np.where(skill_strong_draw[:, :hits] < p["p_strong_hit"], p["strong_hit_multiplier"], 1.0)
+                character["damage"] += damage_tick.sum(axis=1)
+                character["attacks"] += hits * n
+            else:
+                critical_mask = (critical_ready_tick <= tick) & (critical_attack_draw < p["p_critical"])
+                hits = p["hit_2"]
+                critical_damage = (p["damage_skill_2"] * p["attack_power"] * p["critical_multiplier"] * p["seventh_awakening_multiplier"]
+                                   * np.where(critical_strong_draw[:, :hits] < p["p_strong_hit"], p["strong_hit_multiplier"], 1.0)).sum(axis=1)
+                hits = 3 * p["hit_1"]
+                shot_count = np.where(triple_shot_draw < p["p_triple_shot"], 3, np.where(double_shot_draw < p["p_double_shot"], 2, 1))
+                hit_mask = normal_hit_index[:hits] < (shot_count * p["hit_1"])[:, None]
+                critical_hit = (normal_critical_draw[:, :hits] < p["p_critical"]) & (shot_count > 1)[:, None]
+                damage_tick = p["damage_skill_1"] * base * np.where(critical_hit, p["critical_multiplier"], 1.0)
+                damage_tick *= np.where(normal_strong_draw[:, :hits] < p["p_strong_hit"], p["strong_hit_multiplier"], 1.0)
+                normal_damage = np.where(hit_mask, damage_tick, 0.0).sum(axis=1)
+                character["damage"] += np.where(critical_mask, critical_damage, normal_damage)
+                character["attacks"] += p["hit_2"] * int(np.count_nonzero(critical_mask)) + p["hit_1"] * int(shot_count[~critical_mask].sum())
+                critical_ready_tick[critical_mask] = tick + character["critical_period"]
+
+    return [character["damage"] for character in characters], [character["attacks"] for character in characters]
+
+
+def simulate_common_random(engine, params_list, minutes, simulations, seed, rng_algorithm=None):
+    """엔진에 맞는 공통 난수 시뮬레이션 실행 (데미지는 항상 파이썬 리스트로 반환)
+
+    aggregate 엔진은 캐릭터마다 타격 수 분포가 달라 같은 난수를 맞출 수 없으므로 NumPy 공통 난수 시뮬레이션을 사용한다.
+    """
+    rng_algorithm = rng_algorithm or default_rng_algorithm(engine)
+    if engine in (ENGINE_NUMPY, ENGINE_AGGREGATE):
+        damages_list, attacks = simulate_common_random_numpy(params_list, minutes, simulations, seed, rng_algorithm)
+        return [damages.tolist() for damages in damages_list], attacks
+    return simulate_common_random_python(params_list, minutes, simulations, seed, rng_algorithm)
+
+
+def run_paired_shard(engine, params_pair, minutes, simulations, seed):
+    """공통 난수 비교 샤드 하나 실행 (프로세스 풀 작업 단위)"""
+    comparison = PairedComparison(minutes, engine=engine)
+    (damages1, damages2), (attacks1, attacks2) = simulate_common_random(engine, params_pair, minutes, simulations, seed)
+    comparison.add_damages(damages1, damages2, attacks1, attacks2)
+    return comparison
+
+
+def run_paired_comparison(char1, char2, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None,
+                          target_relative_error=None, time_budget=None, use_cache=True, partial_callback=None):
+    """두 캐릭터를 공통 난수로 비교해 PairedComparison 반환 (차이의 신뢰구간/p-값은 짝지은 표준오차로 계산)
+
+    고정 횟수 실행 결과는 결과 캐시에 저장하며, 캐시에서 가져온 결과는 from_cache가 True다.
+    partial_callback은 샤드가 끝날 때마다 중간 PairedComparison을 받는다.
+    """
+    start_time = time.monotonic()
+    if engine == ENGINE_EXACT:
+        raise ValueError("exact 엔진은 난수를 쓰지 않으므로 공통 난수 비교가 필요 없습니다.")
+    params_list = [(char1.simulation_params(), char2.simulation_params())]
+    adaptive = target_relative_error is not None or time_budget is not None
+    key = None
+    if use_cache and not adaptive:
+        key = result_cache_key("paired", params_list[0], minutes, simulations, engine, seed)
+        cached = get_result_cache().get(key)
+        if cached is not None:
+            comparison = PairedComparison.from_dict(cached)
+            comparison.from_cache = comparison.stats1.from_cache = comparison.stats2.from_cache = True
+            if progress_callback:
+                progress_callback(100)
+            return comparison
+    partial = (lambda comparisons: partial_callback(comparisons[0])) if partial_callback else None
+    if adaptive:
+        comparison = run_adaptive_simulations(params_list, minutes, simulations, engine, workers, seed, progress_callback,
+                                              target_relative_error, time_budget,
+                                              shard_function=run_paired_shard, stats_class=PairedComparison, partial_callback=partial)[0]
+    else:
+        comparison = run_sharded_simulations(params_list, minutes, simulations, engine, workers, seed, progress_callback,
+                                             shard_function=run_paired_shard, stats_class=PairedComparison, partial_callback=partial)[0]
+    comparison.elapsed = comparison.stats1.elapsed = comparison.stats2.elapsed = time.monotonic() - start_time
+    if key is not None:
+        get_result_cache().put(key, comparison.to_dict())
+    return comparison
+
+
+def run_sharded_simulation(params, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None):
+    """시뮬레이션을 고정 크기 샤드로 나누어 실행 후 샤드 순서대로 병합
+
+    샤드 크기와 샤드별 시드가 워커 수와 무관하므로, 같은 마스터 시드면 워커 수에 관계없이 결과가 같다.
+    """
+    return run_sharded_simulations([params], minutes, simulations, engine, workers, seed, progress_callback)[0]
+
+
+def run_sharded_simulations(params_list, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None, shard_offset=0,
+                            shard_function=run_simulation_shard, stats_class=SimulationStats, partial_callback=None, shard_size=SHARD_SIZE):
+    """여러 파라미터 세트의 샤드를 번갈아 제출해 동시에 실행 (세트별 SimulationStats 리스트 반환)
+
+    모든 세트가 같은 마스터 시드를 쓰므로 결과는 세트마다 run_sharded_simulation을 따로 호출한 것과 같다.
+    shard_offset은 이어서 실행할 때 시드를 겹치지 않게 하기 위한 시작 샤드 번호다 (shard_size는 재현성을 위해 호출마다 같아야 함).
+    shard_function/stats_class를 바꾸면 다른 종류의 샤드(예: 공통 난수 비교)도 같은 방식으로 실행한다.
+    partial_callback은 샤드가 끝날 때마다 끝난 순서대로 합친 세트별 중간 합계 리스트를 받는다
+    (최종 결과는 재현성을 위해 샤드 번호 순으로 다시 병합한다).
+    """
+    if seed is None:
+        seed = new_master_seed()
+    shard_sizes = [min(shard_size, simulations - start) for start in range(0, simulations, shard_size)]
+    # (세트 번호, 샤드 번호) 순서로 번갈아 배치해 모든 세트가 함께 진행되도록 함
+    tasks = [(job, index) for index in range(len(shard_sizes)) for job in range(len(params_list))]
+    shard_stats = {}
+    total = simulations * len(params_list)
+    done = 0
+    running = [stats_class(minutes, engine=engine, seed=seed) for _ in params_list]
+
+    def report_partial(job, shard):
+        if partial_callback:
+            running[job].merge(shard)
+            partial_callback(running)
+
+    if workers <= 1:
+        for job, index in tasks:
+            shard_stats[job, index] = shard_function(engine, params_list[job], minutes, shard_sizes[index], derive_seed(seed, shard_offset + index))
+            done += shard_sizes[index]
+            report_partial(job, shard_stats[job, index])
+            if progress_callback:
+                progress_callback(done / total * 100)
+    else:
+        pool = get_process_pool(workers)
+        futures = {
+            pool.submit(shard_function, engine, params_list[job], minutes, shard_sizes[index], derive_seed(seed, shard_offset + index)): (job, index)
+            for job, index in tasks
+        }
+        try:
+            for future in as_completed(futures):
+                job, index = futures[future]
+                shard_stats[job, index] = future.result()
+                done += shard_sizes[index]
+                report_partial(job, shard_stats[job, index])
+                if progress_callback:
+                    progress_callback(done / total * 100)
+        except SimulationCancelled:
+            # 아직 시작하지 않은 샤드는 버림 (실행 중인 샤드는 워커 작업이면 커널 안에서 취소 요청을 확인해 곧 중단)
+            for future in futures:
+                future.cancel()
+            raise
+
+    results = []
+    for job in range(len(params_list)):
+        stats = stats_class(minutes, engine=engine, seed=seed)
+        for index in range(len(shard_sizes)):
+            stats.merge(shard_stats[job, index])
+        results.append(stats)
+    return results
+
+
+def precision_reached(stats_list, target_relative_error, compare_difference=False):
+    """신뢰구간이 목표 상대오차보다 좁아졌는지 확인
+
+    compare_difference=True면 두 세트의 DPM 차이 신뢰구간 반폭을 평균 DPM 대비로 판정한다.
+    """
+    if compare_difference and len(stats_list) == 2:
+        stats1, stats2 = stats_list
+        half_width = CONFIDENCE_Z * math.hypot(stats1.dpm_std_error, stats2.dpm_std_error)
+        return half_width <= target_relative_error * (stats1.dpm + stats2.dpm) / 2
+    return all(stats.relative_error <= target_relative_error for stats in stats_list)
+
+
+def run_adaptive_simulations(params_list, minutes, max_simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None,
+                             target_relative_error=None, time_budget=None, compare_difference=False,
+                             shard_function=run_simulation_shard, stats_class=SimulationStats, partial_callback=None):
+    """배치 단위로 시뮬레이션하며 목표 상대오차에 도달하거나 시간 제한(초)이 지나면 중단
+
+    배치마다 샤드 번호가 이어지므로 같은 시드면 고정 횟수 실행 결과의 앞부분과 같은 난수를 사용한다.
+    배치 크기는 워커 수와 무관하게 고정하고(배치 안의 샤드는 풀에서 병렬 실행), 목표 상대오차로 멈추는 지점과 결과가
+    워커 수에 따라 달라지지 않게 한다 (시간 제한으로 멈추는 지점은 실행 속도에 따라 달라짐).
+    """
+    if seed is None:
+        seed = new_master_seed()
+    start_time = time.monotonic()
+    batch_size = SHARD_SIZE * ADAPTIVE_BATCH_SHARDS
+    results = [stats_class(minutes, engine=engine, seed=seed) for _ in params_list]
+    done = 0
+
+    while done < max_simulations:
+        size = min(batch_size, max_simulations - done)
+        if progress_callback:
+            # 배치 안에서도 샤드마다 진행률 보고/취소 확인
+            def batch_progress(progress, done=done, size=size):
+                progress_callback(min((done + size * progress / 100) / max_simulations, 1) * 100)
+        else:
+            batch_progress = None
+        if partial_callback:
+            # 지금까지의 배치 합계 + 진행 중인 배치의 중간 합계
+            def batch_partial(partial):
+                snapshot = []
+                for stats, batch_stats in zip(results, partial):
+                    merged = stats_class(minutes, engine=engine, seed=seed)
+                    merged.merge(stats)
+                    merged.merge(batch_stats)
+                    snapshot.append(merged)
+                partial_callback(snapshot)
+        else:
+            batch_partial = None
+        batch = run_sharded_simulations(params_list, minutes, size, engine, workers, seed, batch_progress, shard_offset=done // SHARD_SIZE,
+                                        shard_function=shard_function, stats_class=stats_class, partial_callback=batch_partial)
+        for stats, batch_stats in zip(results, batch):
+            stats.merge(batch_stats)
+        done += size
+
+        elapsed = time.monotonic() - start_time
+        if progress_callback:
+            time_progress = elapsed / time_budget if time_budget else 0
+            progress_callback(min(max(done / max_simulations, time_progress), 1) * 100)
+        if target_relative_error is not None and precision_reached(results, target_relative_error, compare_difference):
+            break
+        if time_budget is not None and elapsed >= time_budget:
+            break
+    return results
+
+
+def run_exact(character, minutes):
+    """exact 엔진 결과를 SimulationStats 형태로 반환 (기댓값을 한 번의 시뮬레이션으로 기록)"""
+    stats = SimulationStats(minutes, engine=ENGINE_EXACT)
+    expected_attacks_with_critical_and_skill(minutes=minutes, stats=stats, **character.simulation_params())
+    return stats
+
+
+def run_characters(characters, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None,
+                   target_relative_error=None, time_budget=None, compare_difference=False, use_cache=True, partial_callback=None,
+                   diagnostics=False, rng_algorithm=None):
+    """여러 캐릭터를 동시에 시뮬레이션하여 캐릭터별 SimulationStats 리스트 반환
+
+    diagnostics=True면 계측을 켜고 실행해 각 결과의 diagnostics에 분기 카운터/구간별 시간을 기록한다
+    (exact 엔진은 계측 대상이 아니며, 계측 결과는 캐시하지 않으므로 캐시를 건너뛴다).
+    rng_algorithm은 난수 알고리즘(RNG_ALGORITHMS)으로, None이면 엔진 기본값이며 결과의 rng_algorithm에 기록된다.
+
+    partial_callback은 샤드가 끝날 때마다 캐릭터별 중간 합계 리스트(캐시된 캐릭터는 최종 결과)를 받는다.
+
+    target_relative_error나 time_budget을 지정하면 적응형 모드로 동작하며, simulations는 최대 횟수가 된다.
+    고정 횟수/exact 결과는 캐릭터별로 결과 캐시에 저장하고 캐시에 없는 캐릭터만 시뮬레이션한다.
+    (샤드 시드는 세트와 무관하므로 캐릭터별 결과는 함께 실행한 다른 캐릭터에 영향받지 않는다.)
+    적응형 모드는 종료 시점이 실행 시간/다른 캐릭터에 따라 달라지므로 캐시하지 않는다.
+    """
+    start_time = time.monotonic()
+    params_list = [char.simulation_params() for char in characters]
+    adaptive = engine != ENGINE_EXACT and (target_relative_error is not None or time_budget is not None)
+    rng_algorithm = (rng_algorithm or default_rng_algorithm(engine)) if engine != ENGINE_EXACT else None
+    shard_function = run_simulation_shard
+    if diagnostics or rng_algorithm != default_rng_algorithm(engine):
+        shard_function = partial(run_simulation_shard, diagnostics=diagnostics, rng_algorithm=rng_algorithm)
+    use_cache = use_cache and not diagnostics
+    if adaptive:
+        results = run_adaptive_simulations(params_list, minutes, simulations, engine, workers, seed, progress_callback,
+                                           target_relative_error, time_budget, compare_difference, shard_function=shard_function,
+                                           partial_callback=partial_callback)
+        elapsed = time.monotonic() - start_time
+        for stats in results:
+            stats.elapsed = elapsed
+            stats.rng_algorithm = rng_algorithm
+        return results
+
+    results = [None] * len(characters)
+    keys = [None] * len(characters)
+    if use_cache:
+        cache = get_result_cache()
+        for index, params in enumerate(params_list):
+            keys[index] = result_cache_key("character", params, minutes, simulations, engine, seed, rng_algorithm)
+            cached = cache.get(keys[index])
+            if cached is not None:
+                results[index] = SimulationStats.from_dict(cached)
+                results[index].from_cache = True
+    missing = [index for index, stats in enumerate(results) if stats is None]
+    if missing:
+        if engine == ENGINE_EXACT:
+            computed = [run_exact(characters[index], minutes) for index in missing]
+        else:
+            if partial_callback:
+                def missing_partial(partial):
+                    snapshot = list(results)
+                    for index, stats in zip(missing, partial):
+                        snapshot[index] = stats
+                    partial_callback(snapshot)
+            else:
+                missing_partial = None
+            computed = run_sharded_simulations([params_list[index] for index in missing], minutes, simulations, engine, workers, seed,
+                                               progress_callback, shard_function=shard_function, partial_callback=missing_partial)
+        elapsed = time.monotonic() - start_time
+        for index, stats in zip(missing, computed):
+            stats.elapsed = elapsed
+            stats.rng_algorithm = rng_algorithm
+            results[index] = stats
+            if use_cache:
+                cache.put(keys[index], stats.to_dict())
+    elif progress_callback:
+        progress_callback(100)
+    return results
+
+
+class StatValueStats:
+    """스탯 효율 계산 합계 (기준 캐릭터와 스탯을 하나씩 올린 변형들을 공통 난수로 시뮬레이션)
+
+    differences[i]는 변형 i와 기준 캐릭터의 시뮬레이션별 데미지 차이 합계다.
+    """
+
+    def __init__(self, minutes, engine=DEFAULT_ENGINE, seed=None):
+        self.minutes = minutes
+        self.engine = engine
+        self.seed = seed
+        self.base = SimulationStats(minutes, engine=engine, seed=seed)
+        self.differences = []
+        self.elapsed = 0.0
+
+    def _difference(self, index):
+        while len(self.differences) <= index:
+            self.differences.append(SimulationStats(self.minutes, engine=self.engine, seed=self.seed))
+        return self.differences[index]
+
+    def add_damages(self, damages_list, attacks_list):
+        """같은 난수로 얻은 시뮬레이션별 데미지 묶음 누적 (첫 번째가 기준 캐릭터)"""
+        base_damages = damages_list[0]
+        self.base.add_values(base_damages, attacks_list[0], distribution=True)
+        for index, damages in enumerate(damages_list[1:]):
+            self._difference(index).add_values([damage - base for base, damage in zip(base_damages, damages)])
+
+    def merge(self, other):
+        """다른 샤드의 결과 병합"""
+        self.base.merge(other.base)
+        for index, difference in enumerate(other.differences):
+            self._difference(index).merge(difference)
+
+    @property
+    def simulations(self):
+        return self.base.simulations
+
+    @property
+    def relative_error(self):
+        """기준 DPM 대비 가장 넓은 차이 신뢰구간 반폭 비율 (적응형 모드 종료 판정용)"""
+        if not self.base.dpm:
+            return 0.0
+        return max((difference.dpm_half_width for difference in self.differences), default=0.0) / self.base.dpm
+
+
+class StatValue:
+    """스탯 하나의 효율 (입력 단위 1포인트당 DPM 증가량)"""
+
+    def __init__(self, attribute, label, unit, dpm_gain, half_width, base_dpm):
+        self.attribute = attribute
+        self.label = label
+        self.unit = unit
+        self.dpm_gain = dpm_gain
+        self.half_width = half_width
+        # DPM은 공격력에 정비례하므로, 1포인트의 증가량을 같은 DPM을 주는 공격력 증가율(%)로 환산
+        self.equivalent_attack_power = dpm_gain / base_dpm * 100 if base_dpm else 0.0
+
+
+def run_stat_value_shard(engine, params_list, minutes, simulations, seed):
+    """스탯 효율 샤드 하나 실행 (기준 + 변형 파라미터를 공통 난수로 시뮬레이션)"""
+    stats = StatValueStats(minutes, engine=engine)
+    stats.add_damages(*simulate_common_random(engine, params_list, minutes, simulations, seed))
+    return stats
+
+
+def stat_value_variants(character):
+    """STAT_VALUE_STATS의 스탯을 하나씩 바꾼 캐릭터 목록과 실제 변화량 목록 반환
+
+    확률이 100%를 넘게 되면 반대 방향으로 바꿔 차분을 구한다.
+    """
+    variants, deltas = [], []
+    for attribute, _, step, _ in STAT_VALUE_STATS:
+        value = getattr(character, attribute)
+        delta = -step if attribute.startswith("p_") and value + step > 1 else step
+        variant = copy.copy(character)
+        setattr(variant, attribute, value + delta)
+        variants.append(variant)
+        deltas.append(delta)
+    return variants, deltas
+
+
+def run_stat_values(character, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None,
+                    target_relative_error=None, time_budget=None):
+    """스탯별 1포인트당 DPM 증가량을 한 번의 공통 난수 실행(또는 exact 엔진)으로 계산
+
+    효율이 높은 순으로 정렬한 StatValue 리스트와 기준 캐릭터의 SimulationStats를 반환한다.
+    """
+    start_time = time.monotonic()
+    variants, deltas = stat_value_variants(character)
+    if engine == ENGINE_EXACT:
+        stats = StatValueStats(minutes, engine=engine)
+        base = run_exact(character, minutes)
+        stats.base.merge(base)
+        for index, variant in enumerate(variants):
+            stats._difference(index).add(1, run_exact(variant, minutes).total_damage - base.total_damage, 0)
+    else:
+        params_list = [[char.simulation_params() for char in [character] + variants]]
+        if target_relative_error is not None or time_budget is not None:
+            stats = run_adaptive_simulations(params_list, minutes, simulations, engine, workers, seed, progress_callback,
+                                             target_relative_error, time_budget,
+                                             shard_function=run_stat_value_shard, stats_class=StatValueStats)[0]
+        else:
+            stats = run_sharded_simulations(params_list, minutes, simulations, engine, workers, seed, progress_callback,
+                                            shard_function=run_stat_value_shard, stats_class=StatValueStats)[0]
+    stats.elapsed = stats.base.elapsed = time.monotonic() - start_time
+
+    values = []
+    for (attribute, label, _, unit), delta, difference in zip(STAT_VALUE_STATS, deltas, stats.differences):
+        scale = unit / delta
+        values.append(StatValue(attribute, label, unit, difference.dpm * scale, difference.dpm_half_width * abs(scale), stats.base.dpm))
+    values.sort(key=lambda value: value.dpm_gain, reverse=True)
+    return values, stats.base
+
+
+class StatAllocation:
+    """스탯 배분 후보 하나 (속성별 투자 단계 수, 사용한 비용, 배분 후 캐릭터와 기대 DPM)"""
+
+    def __init__(self, steps, cost, dpm, base_dpm, character):
+        self.steps = steps  # 속성 → 투자 단계 수 (투자하지 않은 속성 제외)
+        self.cost = cost
+        self.dpm = dpm
+        self.dpm_gain = dpm - base_dpm
+        self.character = character
+
+
+class StatBudgetOptimizer:
+    """정해진 예산(단계 비용 합)을 스탯에 나눠 투자할 때 기대 DPM이 가장 높은 배분을 찾는 탐색기
+
+    후보는 exact 엔진의 기댓값으로 평가하며, 같은 배분은 한 번만 계산한다 (cache).
+    공격 속도/치명 확률이 같은 이웃 후보는 치명타 동적 계획법 결과(expected_critical_attacks)를 재사용해
+    나머지 스탯만 바꾼 후보의 평가는 사칙연산 몇 번으로 끝난다.
+    """
+
+    def __init__(self, character, budget, minutes=1, stats=None, caps=None):
+        self.character = character
+        self.budget = budget
+        self.minutes = minutes
+        self.base_params = character.simulation_params()
+        caps = caps or {}
+        self.stats = []
+        for attribute, delta, cost, cap in (stats or STAT_BUDGET_STATS):
+            if cost <= 0 or delta <= 0:
+                raise ValueError(f"단계 변화량과 비용은 0보다 커야 합니다: {attribute}")
+            cap = caps.get(attribute, cap)
+            max_steps = int(budget // cost)
+            if cap is not None:
+                max_steps = min(max_steps, max(int(math.floor((cap - getattr(character, attribute)) / delta + 1e-9)), 0))
+            self.stats.append((attribute, delta, cost, max_steps))
+        self.min_cost = min((cost for _, _, cost, max_steps in self.stats if max_steps > 0), default=None)
+        self.cache = {}
+
+    def params(self, steps):
+        """배분(속성 순서의 단계 수 튜플)을 적용한 시뮬레이션 파라미터"""
+        params = dict(self.base_params)
+        for (attribute, delta, _, _), count in zip(self.stats, steps):
+            if count:
+                value = getattr(self.character, attribute) + delta * count
+                params[attribute] = int(round(value)) if attribute == "attack_speed" else value
+        return params
+
+    def cost(self, steps):
+        return sum(cost * count for (_, _, cost, _), count in zip(self.stats, steps))
+
+    def evaluate(self, steps):
+        """배분의 기대 DPM (계산한 배분은 캐시)"""
+        dpm = self.cache.get(steps)
+        if dpm is None:
+            dpm = self.cache[steps] = expected_attacks_with_critical_and_skill(minutes=self.minutes, **self.params(steps))[0]
+        return dpm
+
+    def neighbors(self, steps):
+        """한 단계 더 투자하거나, 한 스탯의 한 단계를 다른 스탯으로 옮긴 배분 (예산/최댓값 안에서)"""
+        spent = self.cost(steps)
+        for j, (_, _, cost_j, max_j) in enumerate(self.stats):
+            if steps[j] >= max_j:
+                continue
+            if spent + cost_j <= self.budget:
+                yield steps[:j] + (steps[j] + 1,) + steps[j + 1:]
+            for i, (_, _, cost_i, _) in enumerate(self.stats):
+                if i != j and steps[i] and spent - cost_i + cost_j <= self.budget:
+                    moved = list(steps)
+                    moved[i] -= 1
+                    moved[j] += 1
+                    yield tuple(moved)
+
+    def is_complete(self, steps):
+        """남은 예산으로 더 올릴 수 있는 스탯이 없는 배분인지 (DPM은 스탯에 대해 감소하지 않으므로 완성된 배분만 비교)"""
+        spent = self.cost(steps)
+        return all(steps[k] >= max_steps or spent + cost > self.budget for k, (_, _, cost, max_steps) in enumerate(self.stats))
+
+    def fill(self, steps):
+        """남은 예산을 DPM이 가장 많이 오르는 한 단계씩 채운 완성 배분"""
+        while not self.is_complete(steps):
+            steps = max((steps[:k] + (steps[k] + 1,) + steps[k + 1:]
+                         for k, (_, _, cost, max_steps) in enumerate(self.stats)
+                         if steps[k] < max_steps and self.cost(steps) + cost <= self.budget), key=self.evaluate)
+        return steps
+
+    def search(self, beam_width=STAT_BUDGET_BEAM_WIDTH, results=STAT_BUDGET_RESULTS, progress_callback=None):
+        """빔 탐색으로 예산을 한 단계씩 채운 뒤, 상위 후보를 단계 이동으로 더 이상 좋아지지 않을 때까지 개선
+
+        DPM이 높은 순서의 (단계 수 튜플, DPM) 목록을 반환한다.
+        """
+        zero = (0,) * len(self.stats)
+        self.evaluate(zero)
+        frontier = [zero]
+        speed_index = next((k for k, (attribute, _, _, _) in enumerate(self.stats) if attribute == "attack_speed"), None)
+        levels = int(self.budget // self.min_cost) if self.min_cost else 0
+        for level in range(levels):
+            candidates = {
+                steps[:k] + (steps[k] + 1,) + steps[k + 1:]
+                for steps in frontier
+                for k, (_, _, cost, max_steps) in enumerate(self.stats)
+                if steps[k] < max_steps and self.cost(steps) + cost <= self.budget
+            }
+            if not candidates:
+                break
+            ranked = sorted(candidates, key=self.evaluate, reverse=True)
+            frontier = ranked[:beam_width]
+            if speed_index is not None:
+                # 공격 속도는 틱 수가 계단식으로 바뀌어 DPM이 매끄럽지 않으므로 공격 속도 단계 수별 최고 후보도 함께 유지
+                best_by_speed = {}
+                for steps in ranked:
+                    best_by_speed.setdefault(steps[speed_index], steps)
+                frontier = list(dict.fromkeys(frontier + list(best_by_speed.values())))
+            if progress_callback:
+                progress_callback((level + 1) / levels * 80)
+
+        # 빔 탐색이 놓친 배분을 이웃 이동으로 보완 (상위 후보가 모두 이웃보다 좋아질 때까지)
+        improved = True
+        while improved:
+            improved = False
+            top = sorted((steps for steps in self.cache if self.is_complete(steps)), key=self.evaluate, reverse=True)[:results]
+            for steps in top:
+                for neighbor in list(self.neighbors(steps)):
+                    if neighbor in self.cache:
+                        continue
+                    # 비용이 다른 스탯으로 옮기면 예산이 남을 수 있으므로 채운 배분으로 비교
+                    if self.evaluate(self.fill(neighbor)) > self.evaluate(top[-1]):
+                        improved = True
+        if progress_callback:
+            progress_callback(100)
+        complete = sorted((steps for steps in self.cache if self.is_complete(steps)), key=self.evaluate, reverse=True)
+        return [(steps, self.evaluate(steps)) for steps in complete[:results]]
+
+
+def optimize_stat_budget(character, budget, minutes=1, stats=None, caps=None, results=STAT_BUDGET_RESULTS,
+                         beam_width=STAT_BUDGET_BEAM_WIDTH, progress_callback=None):
+    """예산을 스탯에 나눠 투자하는 배분 중 기대 DPM이 높은 순서의 StatAllocation 목록과 기준 DPM 반환
+
+    stats는 (속성, 1단계 변화량, 1단계 비용, 최댓값) 목록(기본 STAT_BUDGET_STATS), caps는 속성별 최댓값 덮어쓰기다.
+    """
+    optimizer = StatBudgetOptimizer(character, budget, minutes, stats, caps)
+    base_dpm = optimizer.evaluate((0,) * len(optimizer.stats))
+    allocations = []
+    for steps, dpm in optimizer.search(beam_width, results, progress_callback):
+        upgraded = copy.copy(character)
+        params = optimizer.params(steps)
+        for attribute, _, _, _ in optimizer.stats:
+            setattr(upgraded, attribute, params[attribute])
+        allocations.append(StatAllocation(
+            {attribute: count for (attribute, _, _, _), count in zip(optimizer.stats, steps) if count},
+            optimizer.cost(steps), dpm, base_dpm, upgraded
+        ))
+    return allocations, base_dpm
+
+
+def damage_comoments(damages_list):
+    """빌드별 시뮬레이션 데미지 목록(같은 난수)의 편차 곱 합계 행렬 (공통 난수 차이의 분산 계산용)"""
+    if np is not None:
+        matrix = np.asarray(damages_list, dtype=float)
+        centered = matrix - matrix.mean(axis=1, keepdims=True)
+        return (centered @ centered.T).tolist()
+    centered = []
+    for damages in damages_list:
+        mean = math.fsum(damages) / len(damages)
+        centered.append([damage - mean for damage in damages])
+    comoments = [[0.0] * len(centered) for _ in centered]
+    for i, row in enumerate(centered):
+        for j in range(i, len(centered)):
+            comoments[i][j] = comoments[j][i] = math.fsum(a * b for a, b in zip(row, centered[j]))
+    return comoments
+
+
+class RosterStats:
+    """로스터 순위 합계 (여러 빌드를 공통 난수로 시뮬레이션한 빌드별 합계와 빌드 간 편차 곱 합계)
+
+    comoments[i][j]는 빌드 i, j의 시뮬레이션별 데미지 편차 곱의 합으로, 모든 빌드 쌍의 차이 신뢰구간을
+    빌드 수의 제곱만큼의 샤드를 따로 돌리지 않고 한 번의 공통 난수 실행에서 구한다.
+    """
+
+    def __init__(self, minutes, engine=DEFAULT_ENGINE, seed=None):
+        self.minutes = minutes
+        self.engine = engine
+        self.seed = seed
+        self.builds = []
+        self.comoments = []
+        self.elapsed = 0.0
+
+    def _resize(self, count):
+        if not self.builds:
+            self.builds = [SimulationStats(self.minutes, engine=self.engine, seed=self.seed) for _ in range(count)]
+            self.comoments = [[0.0] * count for _ in range(count)]
+
+    def _add_comoments(self, simulations, means, comoments):
+        """편차 곱 합계를 병렬 공분산 공식으로 병합 (빌드 합계를 더하기 전에 호출)"""
+        own = self.simulations
+        factor = own * simulations / (own + simulations) if own else 0.0
+        own_means = [stats.total_damage / own if own else 0.0 for stats in self.builds]
+        delta = [mean - own_mean for mean, own_mean in zip(means, own_means)]
+        for i, row in enumerate(self.comoments):
+            for j in range(len(row)):
+                row[j] += comoments[i][j] + delta[i] * delta[j] * factor
+
+    def add_damages(self, damages_list, attacks_list):
+        """같은 난수로 얻은 빌드별 시뮬레이션 데미지 묶음 누적"""
+        self._resize(len(damages_list))
+        means = [math.fsum(damages) / len(damages) for damages in damages_list]
+        self._add_comoments(len(damages_list[0]), means, damage_comoments(damages_list))
+        for stats, damages, attacks in zip(self.builds, damages_list, attacks_list):
+            stats.add_values(damages, attacks, distribution=True)
+
+    def merge(self, other):
+        """다른 샤드의 결과 병합"""
+        if not other.builds:
+            return
+        self._resize(len(other.builds))
+        means = [stats.total_damage / stats.simulations for stats in other.builds]
+        self._add_comoments(other.simulations, means, other.comoments)
+        for stats, other_stats in zip(self.builds, other.builds):
+            stats.merge(other_stats)
+
+    def select(self, indices):
+        """일부 빌드만 남긴 RosterStats (제외된 빌드를 빼고 이어서 시뮬레이션할 때 사용)"""
+        selected = RosterStats(self.minutes, engine=self.engine, seed=self.seed)
+        selected.builds = [self.builds[i] for i in indices]
+        selected.comoments = [[self.comoments[i][j] for j in indices] for i in indices]
+        return selected
+
+    def difference(self, i, j, z=CONFIDENCE_Z):
+        """빌드 i - 빌드 j의 DPM 차이와 신뢰구간 반폭 (짝지은 표준오차 × z)"""
+        dpm_difference = self.builds[i].dpm - self.builds[j].dpm
+        simulations = self.simulations
+        if self.engine == ENGINE_EXACT or simulations < 2:
+            return dpm_difference, 0.0
+        variance = max(self.comoments[i][i] + self.comoments[j][j] - 2 * self.comoments[i][j], 0.0) / (simulations - 1)
+        return dpm_difference, z * math.sqrt(variance / simulations) / self.minutes
+
+    @property
+    def simulations(self):
+        return self.builds[0].simulations if self.builds else 0
+
+    @property
+    def relative_error(self):
+        """가장 넓은 빌드별 DPM 신뢰구간 반폭 비율 (적응형 모드 종료 판정용)"""
+        return max((stats.relative_error for stats in self.builds), default=0.0)
+
+
+class RosterEntry:
+    """로스터 순위 한 줄 (빌드 결과와 1위 대비 공통 난수 DPM 차이)
+
+    pruned가 True인 빌드는 상위권과의 차이가 확실해 중간에 제외된 빌드로, stats와 gap은 제외 시점의 값이다.
+    """
+
+    def __init__(self, character, stats, gap=0.0, gap_half_width=0.0, pruned=False):
+        self.character = character
+        self.stats = stats
+        self.gap = gap
+        self.gap_half_width = gap_half_width
+        self.pruned = pruned
+        self.rank = None
+
+    @property
+    def name(self):
+        return self.character.name
+
+
+def run_roster_shard(engine, params_list, minutes, simulations, seed):
+    """로스터 샤드 하나 실행 (남아 있는 빌드들을 공통 난수로 시뮬레이션)"""
+    stats = RosterStats(minutes, engine=engine)
+    stats.add_damages(*simulate_common_random(engine, params_list, minutes, simulations, seed))
+    return stats
+
+
+def rank_roster(entries):
+    """끝까지 남은 빌드를 먼저, 각 그룹 안에서는 DPM 높은 순으로 정렬해 순위 지정"""
+    entries.sort(key=lambda entry: (entry.pruned, -entry.stats.dpm))
+    for rank, entry in enumerate(entries, 1):
+        entry.rank = rank
+    return entries
+
+
+def run_roster(characters, minutes, simulations, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None,
+               keep_top=ROSTER_KEEP_TOP, target_relative_error=None, time_budget=None):
+    """여러 빌드를 공통 난수로 시뮬레이션해 DPM 순위(RosterEntry 리스트) 반환
+
+    라운드(ROSTER_FIRST_ROUND부터 두 배씩)마다 남은 빌드 전체를 같은 난수로 진행하고, 상위 keep_top번째 빌드보다
+    짝지은 신뢰구간(ROSTER_PRUNE_Z 기준) 상한까지 낮은 빌드는 제외해 이후 라운드에서 시뮬레이션하지 않는다.
+    따라서 전체 비용은 (빌드 수 × 첫 라운드) + (상위권 빌드 수 × 나머지)로, 두 빌드씩 따로 비교하는 것보다 훨씬 적다.
+    target_relative_error/time_budget은 적응형 모드와 같이 남은 빌드의 신뢰구간이 좁아지거나 시간이 지나면 중단한다.
+    """
+    start_time = time.monotonic()
+    if engine == ENGINE_EXACT:
+        entries = [RosterEntry(char, run_exact(char, minutes)) for char in characters]
+        leader_dpm = max(entry.stats.dpm for entry in entries)
+        for entry in entries:
+            entry.gap = entry.stats.dpm - leader_dpm
+            entry.stats.elapsed = time.monotonic() - start_time
+        if progress_callback:
+            progress_callback(100)
+        return rank_roster(entries)
+
+    if seed is None:
+        seed = new_master_seed()
+    round_size = ROSTER_FIRST_ROUND
+    keep_top = max(int(keep_top), 1)
+    active = list(range(len(characters)))
+    params_list = [char.simulation_params() for char in characters]
+    results = RosterStats(minutes, engine=engine, seed=seed)
+    entries = []
+    done = 0
+
+    def leader_gaps(stats, indices):
+        leader = max(range(len(indices)), key=lambda i: stats.builds[i].dpm)
+        return [stats.difference(i, leader) for i in range(len(indices))]
+
+    while done < simulations and active:
+        size = min(round_size, simulations - done)
+        if progress_callback:
+            def round_progress(progress, done=done, size=size):
+                progress_callback(min((done + size * progress / 100) / simulations, 1) * 100)
+        else:
+            round_progress = None
+        batch = run_sharded_simulations([tuple(params_list[index] for index in active)], minutes, size, engine, workers, seed, round_progress,
+                                        shard_offset=done // ROSTER_SHARD_SIZE, shard_function=run_roster_shard, stats_class=RosterStats,
+                                        shard_size=ROSTER_SHARD_SIZE)[0]
+        results.merge(batch)
+        done += size
+        round_size *= 2
+
+        # 상위 keep_top번째 빌드보다 확실히 낮은 빌드 제외
+        if len(active) > keep_top:
+            order = sorted(range(len(active)), key=lambda i: results.builds[i].dpm, reverse=True)
+            cutoff = order[keep_top - 1]
+            gaps = leader_gaps(results, active)
+            keep = []
+            for i in range(len(active)):
+                difference, half_width = results.difference(i, cutoff, ROSTER_PRUNE_Z)
+                if i in order[:keep_top] or difference + half_width >= 0:
+                    keep.append(i)
+                else:
+                    entries.append(RosterEntry(characters[active[i]], results.builds[i], *gaps[i], pruned=True))
+            if len(keep) < len(active):
+                results = results.select(keep)
+                active = [active[i] for i in keep]
+
+        elapsed = time.monotonic() - start_time
+        if progress_callback:
+            time_progress = elapsed / time_budget if time_budget else 0
+            progress_callback(min(max(done / simulations, time_progress), 1) * 100)
+        if target_relative_error is not None and results.relative_error <= target_relative_error:
+            break
+        if time_budget is not None and elapsed >= time_budget:
+            break
+
+    for i, gap in enumerate(leader_gaps(results, active)):
+        entries.append(RosterEntry(characters[active[i]], results.builds[i], *gap))
+    elapsed = time.monotonic() - start_time
+    for entry in entries:
+        entry.stats.elapsed = elapsed
+    return rank_roster(entries)
+
+
+def sweep_values(start, stop, step):
+    """start부터 stop까지(포함) step 간격 값 목록 (부동소수점 누적 없이 start + i × step)"""
+    if step <= 0:
+        raise ValueError("스윕 간격은 0보다 커야 합니다.")
+    count = int(math.floor((stop - start) / step + 1e-9)) + 1
+    return [round(start + index * step, 10) for index in range(max(count, 0))]
+
+
+def parse_sweep_axis(text):
+    """"항목=시작:끝:간격" 또는 "항목=값1,값2,..." 형식의 스윕 축 해석 → (항목, 값 목록)"""
+    field, separator, spec = text.partition("=")
+    if not separator or not spec:
+        raise ValueError(f"스윕 축 형식이 잘못되었습니다: {text} (예: attack_speed=100:200:10)")
+    if ":" in spec:
+        start, stop, step = (float(value) for value in spec.split(":"))
+        return field.strip(), sweep_values(start, stop, step)
+    return field.strip(), [float(value) for value in spec.split(",")]
+
+
+class ParameterSweep:
+    """기준 캐릭터의 시뮬레이션 파라미터 몇 개를 값 목록의 데카르트 곱으로 바꾼 격자
+
+    격자점은 펼쳐 두지 않고 번호(마지막 축이 가장 빠르게 바뀌는 순서)로부터 그때그때 파라미터를 만든다.
+    """
+
+    def __init__(self, character, axes):
+        self.base_params = character.simulation_params()
+        self.axes = []
+        for field, values in (axes.items() if isinstance(axes, dict) else axes):
+            if field not in self.base_params:
+                raise ValueError(f"스윕할 수 없는 항목입니다: {field} (가능: {', '.join(self.base_params)})")
+            if not values:
+                raise ValueError(f"스윕 값이 비어 있습니다: {field}")
+            # 정수 항목(공격 속도, 타수, 3각)은 정수로, 나머지는 실수로 통일
+            self.axes.append((field, [int(value) if field in SWEEP_INTEGER_FIELDS else float(value) for value in values]))
+        self.fields = [field for field, _ in self.axes]
+        self.shape = [len(values) for _, values in self.axes]
+        self.size = math.prod(self.shape)
+
+    def point_params(self, index):
+        """격자점 index의 시뮬레이션 파라미터 딕셔너리"""
+        params = dict(self.base_params)
+        for field, values in reversed(self.axes):
+            index, position = divmod(index, len(values))
+            params[field] = values[position]
+        params["third_awakening"] = bool(params["third_awakening"])
+        return params
+
+    def axis_column(self, axis):
+        """축 하나의 전체 격자 값 열 (같은 값 반복 블록을 배열 곱으로 만들어 격자점마다 파이썬 객체를 만들지 않음)"""
+        field, values = self.axes[axis]
+        stride = math.prod(self.shape[axis + 1:])
+        block = array(sweep_typecode(field), itertools.chain.from_iterable(itertools.repeat(value, stride) for value in values))
+        return block * (self.size // len(block))
+
+
+def sweep_typecode(field):
+    """스윕 열의 array 형식 (정수 항목은 'q', 나머지는 'd')"""
+    return "q" if field in SWEEP_INTEGER_FIELDS else "d"
+
+
+# array 형식 → .npy 자료형 (리틀 엔디언으로 저장)
+NPY_DESCR = {"d": "<f8", "q": "<i8"}
+
+
+class SweepResult:
+    """스윕 결과 (격자 축 값과 DPM/APM/신뢰구간 반폭을 항목별 array 열로 저장)
+
+    격자점 하나당 열마다 8바이트만 사용하므로 축 3개짜리 100만 점 격자도 약 48MB다.
+    """
+
+    def __init__(self, sweep, minutes, engine=DEFAULT_ENGINE, simulations=None, seed=None):
+        self.minutes = minutes
+        self.engine = engine
+        self.simulations = simulations
+        self.seed = seed
+        self.elapsed = 0.0
+        self.columns = OrderedDict((field, sweep.axis_column(axis)) for axis, field in enumerate(sweep.fields))
+        for name in SWEEP_RESULT_COLUMNS:
+            self.columns[name] = array("d", bytes(8 * sweep.size))
+
+    def __len__(self):
+        return len(self.columns[SWEEP_RESULT_COLUMNS[0]])
+
+    def fill(self, start, chunk):
+        """격자점 start부터의 결과 열 조각 기록"""
+        for name, values in chunk.items():
+            self.columns[name][start:start + len(values)] = values
+
+    def to_numpy(self):
+        """열 이름 → NumPy 배열 딕셔너리 (복사 없이 같은 메모리 사용, NumPy 필요)"""
+        if np is None:
+            raise RuntimeError("NumPy가 설치되어 있지 않습니다.")
+        return {name: np.frombuffer(column, dtype=column.typecode) for name, column in self.columns.items()}
+
+    def write_csv(self, stream):
+        """CSV로 한 줄씩 출력 (전체를 문자열로 만들지 않음)"""
+        writer = csv.writer(stream)
+        writer.writerow(list(self.columns))
+        writer.writerows(zip(*self.columns.values()))
+
+    def save_npz(self, path):
+        """열마다 .npy 파일 하나씩 담은 .npz로 저장 (numpy.load로 읽을 수 있으며 저장에는 NumPy가 필요 없음)"""
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name, column in self.columns.items():
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                header = f"{{'descr': '{NPY_DESCR[column.typecode]}', 'fortran_order': False, 'shape': ({len(column)},), }}"
+                # 매직(6) + 버전(2) + 길이(2) + 헤더가 64바이트 단위가 되도록 공백으로 채우고 줄바꿈으로 끝냄
+                header += " " * (63 - (10 + len(header)) % 64) + "\n"
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+                    f.write(b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1"))
+                    f.write(column.tobytes())
+
+
+def run_sweep_chunk(engine, sweep, minutes, simulations, seed, start, stop):
+    """격자점 start ~ stop-1 계산 (프로세스 풀 작업 단위) → (start, 결과 열 조각 딕셔너리)"""
+    chunk = {name: array("d") for name in SWEEP_RESULT_COLUMNS}
+    for index in range(start, stop):
+        check_shard_stop()
+        params = sweep.point_params(index)
+        if engine == ENGINE_EXACT:
+            dpm, apm = expected_attacks_with_critical_and_skill(minutes=minutes, **params)
+            half_width = 0.0
+        else:
+            stats = run_simulation_shard(engine, params, minutes, simulations, derive_seed(seed, "sweep", index))
+            dpm, apm, half_width = stats.dpm, stats.apm, stats.dpm_half_width
+        chunk["dpm"].append(dpm)
+        chunk["apm"].append(apm)
+        chunk["dpm_half_width"].append(half_width)
+    return start, chunk
+
+
+def run_sweep(character, axes, minutes, simulations=20000, engine=DEFAULT_ENGINE, workers=1, seed=None, progress_callback=None):
+    """기준 캐릭터의 파라미터 격자(axes: 항목 → 값 목록)를 모두 계산해 SweepResult 반환
+
+    격자점을 묶음(SWEEP_CHUNK_SIZE 이하) 단위로 프로세스 풀에 나눠 실행하고, 동시에 대기하는 묶음 수를
+    워커 수 × BATCH_QUEUE_FACTOR로 제한한다. 몬테카를로 엔진은 격자점마다 (seed, 번호)에서 유도한 시드를 써서
+    워커 수와 관계없이 같은 결과가 나온다. 격자가 크면 exact 엔진을 권장한다.
+    """
+    start_time = time.monotonic()
+    sweep = ParameterSweep(character, axes)
+    if engine != ENGINE_EXACT and seed is None:
+        seed = new_master_seed()
+    result = SweepResult(sweep, minutes, engine, simulations if engine != ENGINE_EXACT else None, seed)
+    chunk_size = SWEEP_CHUNK_SIZE if engine == ENGINE_EXACT else max(1, min(SWEEP_CHUNK_SIZE, SWEEP_CHUNK_SIMULATIONS // max(simulations, 1)))
+    chunks = [(start, min(start + chunk_size, sweep.size)) for start in range(0, sweep.size, chunk_size)]
+    done = 0
+
+    def store(start, chunk):
+        nonlocal done
+        result.fill(start, chunk)
+        done += len(chunk["dpm"])
+        if progress_callback:
+            progress_callback(done / sweep.size * 100)
+
+    if workers <= 1:
+        for start, stop in chunks:
+            store(*run_sweep_chunk(engine, sweep, minutes, simulations, seed, start, stop))
+    else:
+        pool = get_process_pool(workers)
+        pending = set()
+        try:
+            for start, stop in chunks:
+                pending.add(pool.submit(run_sweep_chunk, engine, sweep, minutes, simulations, seed, start, stop))
+                if len(pending) >= workers * BATCH_QUEUE_FACTOR:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        store(*future.result())
+            for future in as_completed(pending):
+                store(*future.result())
+        except SimulationCancelled:
+            for future in pending:
+                future.cancel()
+            raise
+    result.elapsed = time.monotonic() - start_time
+    return result
+
+
+def cubic_interpolate(values, start, steps, x):
+    """values[start : start + steps + 1]에 놓인 등간격 격자값의 3차(Catmull-Rom) 보간 (x는 격자 단위, 양 끝은 선형 외삽한 점 사용)"""
+    index = min(max(int(x), 0), steps - 1)
+    t = x - index
+    p1 = values[start + index]
+    p2 = values[start + index + 1]
+    p0 = values[start + index - 1] if index > 0 else 2 * p1 - p2
+    p3 = values[start + index + 2] if index + 2 <= steps else 2 * p2 - p1
+    return p1 + 0.5 * t * (p2 - p0 + t * (2 * p0 - 5 * p1 + 4 * p2 - p3 + t * (3 * (p1 - p2) + p3 - p0)))
+
+
+def surrogate_fingerprint(minutes, critical_cooldown, skill_cooldown, max_attack_speed=SURROGATE_MAX_ATTACK_SPEED):
+    """근사 표 내용을 결정하는 설정/상수의 지문 (하나라도 바뀌면 표를 다시 만들어야 함)
+
+    7각성 배율(SEVENTH_AWAKENING_MULTIPLIER)과 증폭(AMPLIFICATION_BONUS)은 조회할 때 닫힌 식으로 적용하므로 표에 들어가지 않는다.
+    """
+    payload = {
+        "format": SURROGATE_FORMAT,
+        "engine_version": ENGINE_VERSION,
+        "minutes": float(minutes),
+        "critical_cooldown": float(critical_cooldown),
+        "skill_cooldown": float(skill_cooldown),
+        "max_attack_speed": int(max_attack_speed),
+        "critical_steps": SURROGATE_CRITICAL_STEPS,
+        "error_margin": SURROGATE_ERROR_MARGIN,
+        "cooldown_reduction": COOLDOWN_REDUCTION_MULTIPLIER,
+        "timeline_denominator": TIMELINE_MAX_DENOMINATOR
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def surrogate_rows(minutes, critical_cooldown, skill_cooldown, third_awakening, attack_speeds):
+    """공격 속도마다 근사 표 한 줄 계산 (프로세스 풀 작업 단위)
+
+    한 줄은 [틱 수, 스킬 틱 수, 치명타 기대 횟수 오차 한계, 치명 확률 격자점별 치명타 기대 횟수...]이다.
+    격자 간격의 절반 지점에서도 정확히 계산해 보간값과 비교한 최대 오차에 SURROGATE_ERROR_MARGIN을 곱해 오차 한계로 둔다.
+    """
+    steps = SURROGATE_CRITICAL_STEPS
+    rows = array("d")
+    for attack_speed in attack_speeds:
+        timeline = tick_timeline(minutes, attack_speed, skill_cooldown, critical_cooldown, third_awakening)
+        grid = [expected_critical_attacks(timeline, index / steps) for index in range(steps + 1)]
+        error = max(
+            abs(cubic_interpolate(grid, 0, steps, index + 0.5) - expected_critical_attacks(timeline, (index + 0.5) / steps))
+            for index in range(steps)
+        )
+        rows.extend((timeline.tick_count, timeline.skill_count, error * SURROGATE_ERROR_MARGIN))
+        rows.extend(grid)
+    return rows
+
+
+class SurrogateTable:
+    """시뮬레이션 없이 DPM/APM을 수 마이크로초에 근사하는 미리 계산한 표
+
+    DPM은 전투 한 번의 치명타 공격 기대 횟수에 대해 선형이므로(expected_attacks_with_critical_and_skill 참고) 표에는
+    (쿨타임 감소, 3각성) 조합 × 공격 속도(정수) × 치명 확률 격자의 치명타 기대 횟수만 담고, 나머지 스탯(공격력, 강타,
+    더블/트리플샷, 배율, 7각성, 증폭, 타수)은 조회할 때 닫힌 식으로 정확히 적용한다. 오차는 치명 확률 보간에서만 생기며
+    estimate가 줄마다 기록된 오차 한계로 DPM/APM 오차 한계를 함께 돌려준다.
+
+    파일은 JSON 헤더 한 줄 뒤에 리틀 엔디언 float64 값을 이어 붙인 형식이며, load_surrogate_table이 mmap으로 연다.
+    """
+
+    def __init__(self, minutes, critical_cooldown, skill_cooldown, max_attack_speed, values, fingerprint=None):
+        self.minutes = minutes
+        self.critical_cooldown = critical_cooldown
+        self.skill_cooldown = skill_cooldown
+        self.max_attack_speed = max_attack_speed
+        self.values = values
+        self.fingerprint = fingerprint or surrogate_fingerprint(minutes, critical_cooldown, skill_cooldown, max_attack_speed)
+        self.row_length = SURROGATE_CRITICAL_STEPS + 4
+        self.mapping = None  # load_surrogate_table이 연 mmap (close에서 해제)
+        # (치명타 쿨타임, 스킬 쿨타임, 3각성) → 표 구역 번호, 쿨타임은 Character와 같은 식으로 감소를 적용해 비교
+        self.configs = {}
+        for index, (cooldown, third_awakening) in enumerate(itertools.product((False, True), repeat=2)):
+            multiplier = COOLDOWN_REDUCTION_MULTIPLIER if cooldown else 1
+            key = (round(critical_cooldown * multiplier, 9), round(skill_cooldown * multiplier, 9), third_awakening)
+            self.configs.setdefault(key, index)
+
+    @classmethod
+    def build(cls, minutes=1, critical_cooldown=Character.DEFAULT_CRITICAL_COOLDOWN, skill_cooldown=Character.DEFAULT_SKILL_COOLDOWN,
+              max_attack_speed=SURROGATE_MAX_ATTACK_SPEED, workers=1, progress_callback=None):
+        """모든 (쿨타임 감소, 3각성, 공격 속도) 줄을 계산해 표 생성 (workers > 1이면 프로세스 풀 사용)"""
+        tasks = []
+        for cooldown, third_awakening in itertools.product((False, True), repeat=2):
+            multiplier = COOLDOWN_REDUCTION_MULTIPLIER if cooldown else 1
+            for start in range(1, max_attack_speed + 1, SURROGATE_CHUNK_SPEEDS):
+                speeds = range(start, min(start + SURROGATE_CHUNK_SPEEDS, max_attack_speed + 1))
+                tasks.append((minutes, critical_cooldown * multiplier, skill_cooldown * multiplier, third_awakening, speeds))
+        chunks = [None] * len(tasks)
+        done = 0
+
+        def store(index, rows):
+            nonlocal done
+            chunks[index] = rows
+            done += 1
+            if progress_callback:
+                progress_callback(done / len(tasks) * 100)
+
+        if workers <= 1:
+            for index, task in enumerate(tasks):
+                store(index, surrogate_rows(*task))
+        else:
+            pool = get_process_pool(workers)
+            futures = {pool.submit(surrogate_rows, *task): index for index, task in enumerate(tasks)}
+            try:
+                for future in as_completed(futures):
+                    store(futures[future], future.result())
+            except SimulationCancelled:
+                for future in futures:
+                    future.cancel()
+                raise
+        values = array("d")
+        for rows in chunks:
+            values.extend(rows)
+        return cls(minutes, critical_cooldown, skill_cooldown, max_attack_speed, values)
+
+    @property
+    def max_critical_error(self):
+        """표 전체에서 가장 큰 치명타 기대 횟수 오차 한계"""
+        return max(self.values[offset + 2] for offset in range(0, len(self.values), self.row_length))
+
+    def critical_attacks(self, config, attack_speed, p_critical):
+        """(틱 수, 스킬 틱 수, 치명타 기대 횟수, 오차 한계)"""
+        offset = (config * self.max_attack_speed + attack_speed - 1) * self.row_length
+        values = self.values
+        critical_attacks = cubic_interpolate(values, offset + 3, SURROGATE_CRITICAL_STEPS, min(max(p_critical, 0.0), 1.0) * SURROGATE_CRITICAL_STEPS)
+        return values[offset], values[offset + 1], critical_attacks, values[offset + 2]
+
+    def estimate(self, character, minutes=None):
+        """캐릭터의 근사 (DPM, APM, DPM 오차 한계, APM 오차 한계), 표 범위를 벗어나면 None (exact 엔진으로 계산할 것)"""
+        if minutes is not None and minutes != self.minutes:
+            return None
+        config = self.configs.get((round(character.critical_cooldown, 9), round(character.skill_cooldown, 9), bool(character.is_third_awakening)))
+        attack_speed = character.attack_speed
+        if config is None or attack_speed != int(attack_speed) or not 1 <= attack_speed <= self.max_attack_speed:
+            return None
+        tick_count, skill_ticks, critical_attacks, critical_error = self.critical_attacks(config, int(attack_speed), character.p_critical)
+        skill_damage, critical_damage, first_shot_damage, extra_shot_damage, normal_attacks = expected_tick_values(
+            character.attack_power, character.damage_skill_1, character.damage_skill_2, character.damage_skill_3,
+            character.p_critical, character.p_strong_hit, character.p_double_shot, character.p_triple_shot, character.critical_multiplier,
+            character.strong_hit_multiplier, character.seventh_awakening_multiplier, character.hit_1, character.hit_2, character.hit_3
+        )
+        normal_damage = first_shot_damage + extra_shot_damage
+        normal_ticks = tick_count - skill_ticks - critical_attacks
+        damage = skill_ticks * skill_damage + critical_attacks * critical_damage + normal_ticks * normal_damage
+        attacks = skill_ticks * character.hit_3 + critical_attacks * character.hit_2 + normal_ticks * normal_attacks
+        # 치명타 틱 하나가 일반 틱으로 바뀔 때의 변화량 × 치명타 기대 횟수 오차 한계
+        minutes = self.minutes
+        return (damage / minutes, attacks / minutes, critical_error * abs(critical_damage - normal_damage) / minutes,
+                critical_error * abs(character.hit_2 - normal_attacks) / minutes)
+
+    def save(self, path=SURROGATE_FILE):
+        """JSON 헤더 한 줄(8바이트 단위로 공백 채움) + 리틀 엔디언 float64 값으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        header = json.dumps({
+            "format": SURROGATE_FORMAT,
+            "fingerprint": self.fingerprint,
+            "minutes": self.minutes,
+            "critical_cooldown": self.critical_cooldown,
+            "skill_cooldown": self.skill_cooldown,
+            "max_attack_speed": self.max_attack_speed,
+            "count": len(self.values)
+        })
+        header += " " * (7 - len(header) % 8) + "\n"
+        values = array("d", self.values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(header.encode("ascii"))
+            f.write(values.tobytes())
+        os.replace(temporary_path, path)
+
+    def close(self):
+        """load_surrogate_table이 연 파일 매핑 해제"""
+        if self.mapping is not None:
+            self.values.release()
+            self.values = array("d")
+            self.mapping.close()
+            self.mapping = None
+
+
+def load_surrogate_table(path=SURROGATE_FILE, minutes=1, critical_cooldown=Character.DEFAULT_CRITICAL_COOLDOWN,
+                         skill_cooldown=Character.DEFAULT_SKILL_COOLDOWN, max_attack_speed=SURROGATE_MAX_ATTACK_SPEED):
+    """근사 표 파일을 mmap으로 열어 SurrogateTable 반환, 없거나 손상됐거나 설정/상수 지문이 다르면 None"""
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        header_end = mapping.find(b"\n") + 1
+        header = json.loads(mapping[:header_end])
+        expected = surrogate_fingerprint(minutes, critical_cooldown, skill_cooldown, max_attack_speed)
+        if header_end % 8 or header.get("fingerprint") != expected or len(mapping) - header_end != header["count"] * 8:
+            mapping.close()
+            return None
+    except (ValueError, KeyError, TypeError):
+        mapping.close()
+        return None
+    if sys.byteorder == "big":
+        values = array("d", mapping[header_end:])
+        values.byteswap()
+        mapping.close()
+        return SurrogateTable(minutes, critical_cooldown, skill_cooldown, max_attack_speed, values, expected)
+    table = SurrogateTable(minutes, critical_cooldown, skill_cooldown, max_attack_speed, memoryview(mapping)[header_end:].cast("d"), expected)
+    table.mapping = mapping
+    return table
+
+
+def get_surrogate_table(path=SURROGATE_FILE, minutes=1, critical_cooldown=Character.DEFAULT_CRITICAL_COOLDOWN,
+                        skill_cooldown=Character.DEFAULT_SKILL_COOLDOWN, workers=1, progress_callback=None):
+    """저장된 근사 표를 열고, 없거나 지문이 다르면 새로 만들어 저장 (저장할 수 없으면 메모리의 표만 반환)"""
+    table = load_surrogate_table(path, minutes, critical_cooldown, skill_cooldown)
+    if table is not None:
+        return table
+    table = SurrogateTable.build(minutes, critical_cooldown, skill_cooldown, workers=workers, progress_callback=progress_callback)
+    try:
+        table.save(path)
+    except OSError:
+        pass
+    return table
+
+
+def summarize_partial(partial):
+    """중간 합계를 GUI로 보낼 작은 딕셔너리로 변환 (캐릭터별 횟수/DPM/APM/신뢰구간 + DPM 차이 추정)"""
+    if isinstance(partial, PairedComparison):
+        stats_list = [partial.stats1, partial.stats2]
+        difference = (partial.dpm_difference, partial.difference_half_width)
+    else:
+        stats_list = partial
+        difference = None
+        if len(stats_list) == 2 and all(stats.simulations for stats in stats_list):
+            stats1, stats2 = stats_list
+            difference = (stats2.dpm - stats1.dpm, CONFIDENCE_Z * math.hypot(stats1.dpm_std_error, stats2.dpm_std_error))
+    return {
+        "characters": [
+            {"simulations": stats.simulations, "dpm": stats.dpm, "apm": stats.apm, "dpm_half_width": stats.dpm_half_width}
+            if stats.simulations else None
+            for stats in stats_list
+        ],
+        "difference": difference
+    }
+
+
+def simulation_worker_main(request_queue, result_queue, cancel_job_id=None, finish_job_id=None):
+    """시뮬레이션 전용 워커 프로세스 본체 (GUI와는 메시지 큐로만 통신)
+
+    요청: {"job_id", "characters", "minutes", "simulations", 옵션...}, 종료는 None
+    옵션: engine, workers, seed, show_exact, target_relative_error, time_budget, paired, diagnostics/rng_algorithm(공통 난수 비교 제외),
+          task("stat_values"면 첫 캐릭터의 스탯 효율 계산, "roster"면 모든 캐릭터의 순위 계산 + keep_top,
+          "stat_budget"이면 첫 캐릭터의 스탯 배분 최적화 + budget)
+    응답: ("progress", job_id, 진행률), ("partial", job_id, summarize_partial 결과), ("result", job_id, 결과 딕셔너리),
+          ("cancelled", job_id, None), ("error", job_id, 메시지)
+    cancel_job_id(공유 정수)가 작업 번호 이상이 되면 해당 작업을 중단한다 (프로세스 풀에서 실행 중인 샤드도 커널 안에서 확인해 중단).
+    finish_job_id가 작업 번호 이상이 되면 마찬가지로 중단하되, 그때까지 끝난 샤드의 중간 합계를 결과("partial": True)로 보낸다.
+    """
+    # 지금 실행 중인 작업 번호 (프로세스 풀의 커널이 취소 요청과 비교)
+    running_job_id = multiprocessing.Value("q", 0)
+    configure_shard_stop(cancel_job_id, finish_job_id, running_job_id)
+    while True:
+        request = request_queue.get()
+        if request is None:
+            break
+        job_id = request["job_id"]
+        running_job_id.value = job_id
+
+        def stop_requested(job_id=job_id):
+            return any(shared is not None and shared.value >= job_id for shared in (cancel_job_id, finish_job_id))
+
+        # 진행률/중간 결과 메시지는 일정 시간 간격으로만 전송 (GUI 큐 폭주 방지)
+        report_progress = ProgressToken(lambda progress, job_id=job_id: result_queue.put(("progress", job_id, progress)),
+                                        WORKER_PROGRESS_INTERVAL, stop_requested)
+        latest_partial = [None, 0.0]
+
+        def report_partial(partial, job_id=job_id):
+            latest_partial[0] = partial
+            now = time.monotonic()
+            if now - latest_partial[1] >= WORKER_PROGRESS_INTERVAL:
+                latest_partial[1] = now
+                result_queue.put(("partial", job_id, summarize_partial(partial)))
+
+        def send_result(characters, minutes, stats, comparison, partial=False):
+            exact = None
+            if request.get("show_exact") and request.get("engine", DEFAULT_ENGINE) != ENGINE_EXACT:
+                exact = [char.simulate_damage(minutes, engine=ENGINE_EXACT) for char in characters]
+            result_queue.put(("result", job_id, {
+                "characters": characters,
+                "stats": stats,
+                "comparison": comparison,
+                "dpm": [s.dpm for s in stats],
+                "apm": [s.apm for s in stats],
+                "exact": exact,
+                "partial": partial
+            }))
+
+        try:
+            report_progress.check()
+            characters = request["characters"]
+            minutes = request["minutes"]
+            engine = request.get("engine", DEFAULT_ENGINE)
+            if request.get("task") == "stat_values":
+                values, base = run_stat_values(
+                    characters[0], minutes, request["simulations"], engine, request.get("workers", 1), request.get("seed"),
+                    report_progress, request.get("target_relative_error"), request.get("time_budget")
+                )
+                result_queue.put(("result", job_id, {"task": "stat_values", "characters": characters, "stat_values": values, "stats": [base]}))
+                continue
+            if request.get("task") == "stat_budget":
+                allocations, base_dpm = optimize_stat_budget(characters[0], request["budget"], minutes, progress_callback=report_progress)
+                result_queue.put(("result", job_id, {"task": "stat_budget", "characters": characters, "allocations": allocations,
+                                                     "base_dpm": base_dpm, "budget": request["budget"]}))
+                continue
+            if request.get("task") == "roster":
+                ranking = run_roster(
+                    characters, minutes, request["simulations"], engine, request.get("workers", 1), request.get("seed"), report_progress,
+                    request.get("keep_top", ROSTER_KEEP_TOP), request.get("target_relative_error"), request.get("time_budget")
+                )
+                result_queue.put(("result", job_id, {"task": "roster", "characters": characters, "ranking": ranking}))
+                continue
+            comparison = None
+            if request.get("paired") and engine != ENGINE_EXACT:
+                comparison = run_paired_comparison(
+                    characters[0], characters[1], minutes, request["simulations"], engine, request.get("workers", 1), request.get("seed"),
+                    report_progress, request.get("target_relative_error"), request.get("time_budget"), partial_callback=report_partial
+                )
+                stats = [comparison.stats1, comparison.stats2]
+            else:
+                stats = run_characters(
+                    characters, minutes, request["simulations"], engine, request.get("workers", 1), request.get("seed"), report_progress,
+                    request.get("target_relative_error"), request.get("time_budget"), compare_difference=len(characters) == 2,
+                    partial_callback=report_partial, diagnostics=request.get("diagnostics", False),
+                    rng_algorithm=request.get("rng_algorithm")
+                )
+            send_result(characters, minutes, stats, comparison)
+        except SimulationCancelled:
+            partial = latest_partial[0]
+            finished_early = finish_job_id is not None and finish_job_id.value >= job_id
+            if finished_early and partial is not None and request.get("task") not in ("stat_values", "roster", "stat_budget"):
+                # 중간 합계를 그대로 결과로 사용 (중단 시점 이후로는 더 이상 갱신되지 않음)
+                if isinstance(partial, PairedComparison):
+                    send_result(request["characters"], request["minutes"], [partial.stats1, partial.stats2], partial, partial=True)
+                elif all(stats.simulations for stats in partial):
+                    send_result(request["characters"], request["minutes"], list(partial), None, partial=True)
+                else:
+                    result_queue.put(("cancelled", job_id, None))
+            else:
+                result_queue.put(("cancelled", job_id, None))
+        except Exception as e:
+            result_queue.put(("error", job_id, str(e)))
+    shutdown_process_pool()
+
+
+class SimulationWorker:
+    """시뮬레이션 워커 프로세스 핸들 (요청 전송 / 응답 수신)"""
+
+    def __init__(self):
+        self.request_queue = None
+        self.result_queue = None
+        self.process = None
+        self.cancel_job_id = None
+        self.finish_job_id = None
+        self.next_job_id = 0
+        self.exit_registered = False
+
+    def start(self):
+        """워커 프로세스 시작 (내부에서 프로세스 풀을 띄우므로 daemon이 아닌 프로세스로 실행)"""
+        if self.process is not None and self.process.is_alive():
+            return
+        self.request_queue = multiprocessing.Queue()
+        self.result_queue = multiprocessing.Queue()
+        self.cancel_job_id = multiprocessing.Value("q", 0)
+        self.finish_job_id = multiprocessing.Value("q", 0)
+        self.process = multiprocessing.Process(target=simulation_worker_main,
+                                               args=(self.request_queue, self.result_queue, self.cancel_job_id, self.finish_job_id))
+        self.process.start()
+        # 죽은 워커를 다시 시작해도 종료 처리기는 한 번만 등록
+        if not self.exit_registered:
+            atexit.register(self.stop)
+            self.exit_registered = True
+
+    def submit(self, characters, minutes, simulations, **options):
+        """시뮬레이션 요청 전송 후 작업 번호 반환 (options는 simulation_worker_main 참고)"""
+        self.start()
+        self.next_job_id += 1
+        request = {
+            "job_id": self.next_job_id,
+            "characters": characters,
+            "minutes": minutes,
+            "simulations": simulations
+        }
+        request.update(options)
+        self.request_queue.put(request)
+        return self.next_job_id
+
+    def cancel(self, job_id):
+        """작업 취소 요청 (해당 번호 이하의 작업은 실행 중인 샤드까지 커널 안에서 중단되고 "cancelled" 응답을 보냄)"""
+        self._raise_job_id(self.cancel_job_id, job_id)
+
+    def finish(self, job_id):
+        """작업 조기 종료 요청 (실행 중인 샤드를 중단하고 그때까지 끝난 샤드의 중간 합계를 결과로 보냄)"""
+        self._raise_job_id(self.finish_job_id, job_id)
+
+    @staticmethod
+    def _raise_job_id(shared, job_id):
+        if shared is None:
+            return
+        with shared.get_lock():
+            shared.value = max(shared.value, job_id)
+
+    def poll(self):
+        """지금까지 도착한 응답 메시지를 모두 꺼내 반환 (블록하지 않음)"""
+        messages = []
+        if self.result_queue is None:
+            return messages
+        while True:
+            try:
+                messages.append(self.result_queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def stop(self, timeout=1.0):
+        """워커 프로세스 종료"""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.request_queue.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(timeout)
+        self.process = None
+
+
+def read_batch_builds(stream, input_format="jsonl"):
+    """배치 입력(JSONL 또는 CSV)에서 빌드 딕셔너리를 한 줄씩 생성 (파일 전체를 읽지 않음)"""
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            # CSV의 빈 칸은 생략된 항목으로 취급 (기본값 사용)
+            yield {key: value for key, value in row.items() if key and value not in ("", None)}
+        return
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_result_columns(stream):
+    """결과 CSV(배치/로스터/스윕 출력)를 열 단위로 읽기 → {열 이름: array 또는 문자열 list}
+
+    모든 값이 숫자인 열은 array("d")(정수뿐이면 array("q"), 빈 칸은 NaN)로, 나머지는 문자열 list로 저장해
+    행이 많아도 값마다 파이썬 객체를 만들지 않는다. 한 줄씩 읽으므로 파일 전체를 메모리에 올리지 않는다.
+    """
+    reader = csv.reader(stream)
+    names = next(reader, None)
+    if not names:
+        return {}
+    columns = [array("d") for _ in names]
+    integral = [True] * len(names)
+    for row in reader:
+        if not row:
+            continue
+        for index, column in enumerate(columns):
+            value = row[index].strip() if index < len(row) else ""
+            if isinstance(column, list):
+                column.append(value)
+                continue
+            try:
+                number = float(value) if value else math.nan
+            except ValueError:
+                # 숫자가 아닌 값이 나오면 그때까지의 값을 문자열로 바꿔 문자열 열로 전환
+                column = columns[index] = ["" if math.isnan(item) else str(int(item)) if item.is_integer() else repr(item) for item in column]
+                column.append(value)
+                continue
+            column.append(number)
+            if integral[index] and not number.is_integer():
+                integral[index] = False
+    result = {}
+    for name, column, is_integral in zip(names, columns, integral):
+        if isinstance(column, array) and is_integral and len(column):
+            column = array("q", map(int, column))
+        result[name] = column
+    return result
+
+
+def run_batch_build(index, build, minutes, simulations, engine, seed, use_cache=True, rng_algorithm=None):
+    """빌드 하나를 시뮬레이션해 결과 딕셔너리 반환 (배치 모드 작업 단위, 오류도 결과로 반환)"""
+    result = {"index": index, "name": build.get("name", "") if isinstance(build, dict) else ""}
+    try:
+        if not isinstance(build, dict):
+            raise ValueError("빌드는 JSON 객체여야 합니다.")
+        # 빌드 한 줄에 캐릭터 항목과 공통 항목을 함께 적을 수 있음
+        char = character_from_settings(build, build)
+        build_minutes = float(build.get("minutes", minutes))
+        build_simulations = int(float(build.get("simulations", simulations)))
+        stats = run_characters([char], build_minutes, build_simulations, build.get("engine", engine), 1, seed, use_cache=use_cache,
+                               rng_algorithm=build.get("rng", rng_algorithm))[0]
+        result.update({
+            "name": char.name,
+            "dpm": stats.dpm,
+            "apm": stats.apm,
+            "dpm_half_width": stats.dpm_half_width,
+            "dpm_p5": stats.dpm_percentile(5),
+            "dpm_p50": stats.dpm_percentile(50),
+            "dpm_p95": stats.dpm_percentile(95),
+            "simulations": stats.simulations,
+            "seed": stats.seed,
+            "rng": stats.rng_algorithm,
+            "from_cache": stats.from_cache
+        })
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def roster_rows(ranking):
+    """로스터 순위를 ROSTER_OUTPUT_FIELDS 딕셔너리 목록으로 변환 (배치 모드 출력용)"""
+    return [{
+        "rank": entry.rank,
+        "name": entry.name,
+        "dpm": entry.stats.dpm,
+        "apm": entry.stats.apm,
+        "dpm_half_width": entry.stats.dpm_half_width,
+        "gap": entry.gap,
+        "gap_half_width": entry.gap_half_width,
+        "simulations": entry.stats.simulations,
+        "pruned": entry.pruned,
+        "seed": entry.stats.seed,
+        "rng": entry.stats.rng_algorithm
+    } for entry in ranking]
+
+
+def run_batch(builds, minutes=1, simulations=20000, engine=DEFAULT_ENGINE, workers=1, seed=None, use_cache=True, rng_algorithm=None):
+    """빌드들을 병렬로 시뮬레이션하며 끝나는 순서대로 결과 딕셔너리를 생성
+
+    동시에 대기하는 작업 수를 워커 수 × BATCH_QUEUE_FACTOR로 제한해 입력이 커도 메모리 사용량이 일정하다.
+    seed를 지정하면 빌드마다 (seed, 입력 순번)에서 유도한 시드를 사용한다.
+    """
+    def build_seed(index):
+        return derive_seed(seed, "build", index) if seed is not None else None
+
+    if workers <= 1:
+        for index, build in enumerate(builds):
+            yield run_batch_build(index, build, minutes, simulations, engine, build_seed(index), use_cache, rng_algorithm)
+        return
+
+    pool = get_process_pool(workers)
+    pending = set()
+    for index, build in enumerate(builds):
+        pending.add(pool.submit(run_batch_build, index, build, minutes, simulations, engine, build_seed(index), use_cache, rng_algorithm))
+        if len(pending) >= workers * BATCH_QUEUE_FACTOR:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+    for future in as_completed(pending):
+        yield future.result()
+
@@ -0,0 +1,1964 @@
+"""SW Rush DPM 계산기 Tk GUI (창을 열 때만 import)"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog, simpledialog
+import sys
+import locale
+import tkinter.font
+import csv
+import json
+import os
+import re
+import operator
+import time
+import multiprocessing
+from array import array
+
+from dpm_engine import (
+    VERSION, CHARACTER_SETTING_KEYS, COMMON_SETTING_KEYS, ENGINE_EXACT, DEFAULT_ENGINE, DEFAULT_WORKERS, DAMAGE_SOURCES, DPM_PERCENTILES,
+    INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD, INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD, SETTINGS_FILE,
+    STAT_BUDGET_STATS, STAT_VALUE_STATS, SURROGATE_FILE,
+    Character, SimulationWorker, available_engines, character_from_settings, expected_attacks_with_critical_and_skill, get_surrogate_table,
+    load_surrogate_table, read_batch_builds, read_result_columns, run_characters, run_paired_comparison, np
+)
+
+# 상수
+PASTEL_BG = "#f9f6f2"
+WORKER_POLL_INTERVAL_MS = 16  # GUI가 워커 응답 큐를 확인하는 주기 (약 60fps)
+LIVE_RECOMPUTE_DELAY_MS = 400  # 자동 재계산 모드에서 마지막 입력 후 다시 계산하기까지 기다리는 시간
+STAT_BUDGET_DEFAULT = 20  # 스탯 배분 최적화 예산 입력창의 기본값 (포인트)
+ROSTER_TABLE_ROWS = 20  # 로스터 순위 표에 한 번에 보이는 줄 수 (나머지는 표 안에서 스크롤)
+VIRTUAL_TABLE_ROWS = 20  # 가상 표가 실제로 만드는 (한 번에 보이는) 행 수
+FILTER_CONDITION = re.compile(r"^(.+?)\s*(<=|>=|==|!=|=|<|>)\s*(.+)$")  # 가상 표 필터의 "열 연산자 값" 조건
+FILTER_OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "=": operator.eq, "==": operator.eq, "!=": operator.ne}
+
+# 한글 인코딩 설정
+if sys.platform.startswith('linux'):
+    try:
+        locale.setlocale(locale.LC_ALL, 'ko_KR.UTF-8')
+    except:
+        try:
+            locale.setlocale(locale.LC_ALL, 'C.UTF-8')
+        except:
+            pass
+
+
+def comparison_marker(value, other, higher_is_better=True):
+    """두 값의 차이가 0.01보다 크면 캐릭터 2 쪽 증감 표시 (▲ 좋아짐 / ▼ 나빠짐)"""
+    if abs(value - other) <= 0.01:
+        return ""
+    return " ▲" if (value > other) == higher_is_better else " ▼"
+
+
+def character_table_rows(char, other=None):
+    """캐릭터 스탯 표들의 행 → (상태, 기본 스탯, 스킬 배율, 쿨타임), other를 넘기면 other 대비 증감 표시"""
+    info_rows = []
+    for label, attribute in (("3각 상태", "is_third_awakening"), ("7각 상태", "is_seventh_awakening"), ("증폭 상태", "is_amplification")):
+        active = getattr(char, attribute)
+        text = "활성화" if active else "비활성화"
+        if other is not None and active != getattr(other, attribute):
+            text += " ▲" if active else " ▼"
+        info_rows.append([label, text])
+    
+    basic_rows = [
+        ["공격 속도", f"{char.attack_speed} ({60 * char.attack_speed / 100:.1f}회/분)"],
+        ["공격력", f"{char.attack_power}M"],
+        ["치명 확률", f"{char.p_critical * 100:.2f}%"],
+        ["강타 확률", f"{char.p_strong_hit * 100:.2f}%"],
+        ["더블샷 확률", f"{char.p_double_shot * 100:.2f}%"],
+        ["트리플샷 확률", f"{char.p_triple_shot * 100:.2f}%"],
+        ["치명 피해", f"{char.critical_multiplier * 100:.2f}%"],
+        ["강타 피해", f"{char.strong_hit_multiplier * 100:.2f}%"],
+        ["각성 배율", f"{char.seventh_awakening_multiplier:.2f}"]
+    ]
+    if other is not None:
+        # 화면에 표시한 값 기준으로 비교 (반올림으로 같아 보이는 값은 표시하지 않음)
+        other_values = [
+            other.attack_speed, other.attack_power, other.p_critical * 100, other.p_strong_hit * 100, other.p_double_shot * 100,
+            other.p_triple_shot * 100, other.critical_multiplier * 100, other.strong_hit_multiplier * 100, other.seventh_awakening_multiplier
+        ]
+        for row, other_value in zip(basic_rows, other_values):
+            row[1] += comparison_marker(float(row[1].split(' ')[0].replace('M', '').replace('%', '')), other_value)
+    
+    skill_rows = []
+    for label, damage, hits in (("일반 공격", char.damage_skill_1, char.hit_1), ("치명타 공격", char.damage_skill_2, char.hit_2),
+                                ("전용 스킬", char.damage_skill_3, char.hit_3)):
+        if char.is_amplification:
+            skill_rows.append([label, f"{damage - Character.AMPLIFICATION_BONUS:.2f} + {Character.AMPLIFICATION_BONUS:.2f} (증폭)", f"{damage:.2f}", f"{hits}", f"{damage * hits:.2f}"])
+        else:
+            skill_rows.append([label, f"{damage:.2f}", "-", f"{hits}", f"{damage * hits:.2f}"])
+    
+    cooldown_rows = [
+        ["치명타 쿨타임", f"{char.critical_cooldown:.1f}초"],
+        ["스킬 쿨타임", f"{char.skill_cooldown:.1f}초"]
+    ]
+    if other is not None:
+        # 쿨타임은 짧을수록 좋음
+        cooldown_rows[0][1] += comparison_marker(char.critical_cooldown, other.critical_cooldown, higher_is_better=False)
+        cooldown_rows[1][1] += comparison_marker(char.skill_cooldown, other.skill_cooldown, higher_is_better=False)
+    return info_rows, basic_rows, skill_rows, cooldown_rows
+
+
+def damage_verdict(char1, char2, damage1, damage2, comparison=None):
+    """DPM 비교 결과 문장과 색상 (공통 난수 비교면 고정 비율 대신 짝지은 표준오차 기반 p-값으로 판정)"""
+    if comparison is not None:
+        return paired_verdict(char1, char2, comparison)
+    if damage1 > damage2:
+        diff = damage1 - damage2
+        percentage = (diff / damage2) * 100
+        if percentage <= INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD:
+            return f"{char2.name}이 {char1.name}보다 {diff:,.2f} DPM (M) 낮음 ({percentage:.2f}% 차이, 의미 없음) ▼", "gray"
+        return f"{char2.name}이 {char1.name}보다 {diff:,.2f} DPM (M) 낮음 ({percentage:.2f}% 약함) ▼", "red"
+    if damage2 > damage1:
+        diff = damage2 - damage1
+        percentage = (diff / damage1) * 100
+        if percentage <= INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD:
+            return f"{char2.name}가 {char1.name}보다 {diff:,.2f} DPM (M) 높음 ({percentage:.2f}% 차이, 의미 없음) ▲", "gray"
+        return f"{char2.name}가 {char1.name}보다 {diff:,.2f} DPM (M) 높음 ({percentage:.2f}% 강함) ▲", "blue"
+    return "두 캐릭터의 데미지가 동일합니다.", "black"
+
+
+def apm_verdict(char1, char2, apm1, apm2):
+    """APM 비교 문장과 색상"""
+    apm_diff = apm1 - apm2
+    if apm_diff > INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD:
+        return f"{char2.name}가 {char1.name}보다 {abs(apm_diff):.1f} APM 느림 ▼", "red"
+    if apm_diff < -INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD:
+        return f"{char2.name}가 {char1.name}보다 {abs(apm_diff):.1f} APM 빠름 ▲", "blue"
+    return f"APM 차이: {apm_diff:+.1f} ({apm1:.1f} vs {apm2:.1f}) (의미 없음)", "gray"
+
+
+def count_widgets(widget):
+    """위젯과 모든 하위 위젯 수"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+class ComparisonView:
+    """두 캐릭터 비교 결과 화면 (한 번만 만들고 비교할 때마다 글자/값/태그만 바꿔 갱신)
+
+    비교마다 Canvas와 표 수십 개를 새로 만들던 방식 대신 위젯을 재사용하므로, 연속으로 비교해도 위젯 수와 메모리가 늘지 않는다.
+    결과마다 없을 수 있는 영역(분포, 출처별 DPM, 캐시 표시, 진단 정보)은 grid_remove로 숨겼다가 다시 보인다.
+    update는 화면 갱신에 걸린 시간(render_time, 배치 계산 포함)과 위젯 수를 결과 아래에 작게 표시한다.
+    """
+
+    def __init__(self, parent):
+        self.frame = tk.Frame(parent, bg=PASTEL_BG)
+        # 메인 스크롤 프레임
+        self.canvas = tk.Canvas(self.frame, bg=PASTEL_BG, highlightthickness=0, height=700)
+        scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview, bg=PASTEL_BG)
+        content = tk.Frame(self.canvas, bg=PASTEL_BG)
+        content.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.canvas.create_window((0, 0), window=content, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        content.grid_columnconfigure(0, weight=1)
+        self.render_time = None
+        
+        self.title_label = self.label(content, font=("Arial", 16, "bold"))
+        self.title_label.grid(row=0, column=0, pady=(10, 20))
+        
+        # 캐릭터별 스탯 표 (상태, 기본 스탯, 스킬 배율, 쿨타임)
+        self.character_titles = []
+        self.character_tables = []
+        for index in range(2):
+            if index:
+                self.separator(content).grid(row=3 * index, column=0, sticky='ew', padx=20, pady=15)
+            title_label = self.label(content, font=("Arial", 14, "bold"))
+            title_label.grid(row=3 * index + 1, column=0, pady=(10, 5))
+            char_frame = self.scroll_target(tk.Frame(content, bg=PASTEL_BG))
+            char_frame.grid(row=3 * index + 2, column=0, sticky='ew', padx=10, pady=5)
+            tables = [
+                self.table(char_frame, "", height=3),
+                self.table(char_frame, "기본 스탯", height=9),
+                self.table(char_frame, "스킬 배율", height=3),
+                self.table(char_frame, "쿨타임", height=2)
+            ]
+            for table in tables[:-1]:
+                table.frame.pack(fill='x', pady=(0, 10))
+            tables[-1].frame.pack(fill='x')
+            self.character_titles.append(title_label)
+            self.character_tables.append(tables)
+        self.separator(content).grid(row=6, column=0, sticky='ew', padx=20, pady=15)
+        
+        # 결과 비교
+        self.label(content, text="⚔️ 데미지 비교 결과", font=("Arial", 14, "bold")).grid(row=7, column=0, pady=(10, 5))
+        result_frame = self.scroll_target(tk.Frame(content, bg=PASTEL_BG))
+        result_frame.grid(row=8, column=0, sticky='ew', padx=10, pady=5)
+        result_frame.grid_columnconfigure(0, weight=1)
+        self.result_table = self.table(result_frame, "", height=2)
+        self.result_table.frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
+        # 한 전투(시뮬레이션 1회) DPM의 분포 (exact 엔진은 분포가 없어 표시하지 않음)
+        self.distribution_table = self.table(result_frame, "전투당 DPM 분포 (M)", height=2)
+        self.distribution_table.frame.grid(row=1, column=0, sticky='ew', pady=(0, 10))
+        # 출처별 DPM (전체 DPM 대비 비율)
+        self.source_table = self.table(result_frame, "출처별 DPM (M)", height=len(DAMAGE_SOURCES))
+        self.source_table.frame.grid(row=2, column=0, sticky='ew', pady=(0, 10))
+        # 캐시에서 가져온 결과 표시 (다시 계산하지 않음)
+        self.cache_label = self.label(result_frame, font=("Arial", 9), fg="gray")
+        self.cache_label.grid(row=3, column=0, pady=(0, 5))
+        self.verdict_label = self.label(result_frame, font=("Arial", 10, "bold"))
+        self.verdict_label.grid(row=4, column=0, pady=5)
+        self.apm_label = self.label(result_frame, font=("Arial", 10))
+        self.apm_label.grid(row=5, column=0, pady=5)
+        self.render_label = self.label(result_frame, font=("Arial", 8), fg="gray")
+        self.render_label.grid(row=6, column=0, pady=(0, 5))
+        
+        # 진단 정보 (계측을 켠 실행에서만, 기본은 접힌 상태)
+        self.diagnostics_frame = self.scroll_target(tk.Frame(content, bg=PASTEL_BG))
+        self.diagnostics_frame.grid(row=9, column=0, sticky='ew', padx=10, pady=(5, 10))
+        self.diagnostics_body = tk.Frame(self.diagnostics_frame, bg=PASTEL_BG)
+        self.diagnostics_button = tk.Button(self.diagnostics_frame, text="▶ 진단 정보", command=self.toggle_diagnostics, font=("Arial", 10, "bold"), bg=PASTEL_BG, activebackground=PASTEL_BG, relief="flat", borderwidth=0)
+        self.diagnostics_button.pack(anchor='w')
+        self.diagnostics_body.grid_columnconfigure(0, weight=1)
+        self.diagnostics_tables = []
+        for index in range(2):
+            table = self.table(self.diagnostics_body, " ", height=6)
+            table.frame.grid(row=index, column=0, sticky='ew', pady=(0, 10))
+            self.diagnostics_tables.append(table)
+        tk.Label(self.diagnostics_body, text="시간은 계측 오버헤드를 포함한 전체 샤드 합계", font=("Arial", 9), bg=PASTEL_BG, fg="gray").grid(row=2, column=0, pady=(0, 5))
+        
+        self.scroll_target(self.canvas)
+        self.scroll_target(content)
+        # 스크롤바 배치
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+    
+    def on_mousewheel(self, event):
+        """마우스 휠 스크롤 (Windows 기준)"""
+        self.canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+    
+    def scroll_target(self, widget):
+        """위젯 위에서도 마우스 휠로 결과창이 스크롤되도록 바인딩 (위젯을 만들 때 한 번만)"""
+        widget.bind("<MouseWheel>", self.on_mousewheel)
+        return widget
+    
+    def label(self, parent, text="", **options):
+        return self.scroll_target(tk.Label(parent, text=text, bg=PASTEL_BG, takefocus=1, **options))
+    
+    def separator(self, parent):
+        return self.scroll_target(tk.Frame(parent, height=2, bg="#e0d8c3"))
+    
+    def table(self, parent, title, height):
+        return ResultTable(parent, title, height, self.on_mousewheel)
+    
+    def toggle_diagnostics(self):
+        if self.diagnostics_body.winfo_ismapped():
+            self.diagnostics_body.pack_forget()
+            self.diagnostics_button.configure(text="▶ 진단 정보")
+        else:
+            self.diagnostics_body.pack(fill='x')
+            self.diagnostics_button.configure(text="▼ 진단 정보")
+    
+    def update(self, char1, char2, damage1, apm1, damage2, apm2, exact1=None, exact2=None, stats1=None, stats2=None, comparison=None, partial=False):
+        """비교 결과로 화면 갱신 (인자는 create_clean_output_display와 같음)"""
+        start = time.perf_counter()
+        self.title_label.configure(text="캐릭터 데미지 비교 결과 (조기 종료, 중간 결과)" if partial else "캐릭터 데미지 비교 결과")
+        
+        for char, other, title_label, tables in zip((char1, char2), (None, char1), self.character_titles, self.character_tables):
+            title_label.configure(text=f"📊 {char.name} 스탯")
+            info_rows, basic_rows, skill_rows, cooldown_rows = character_table_rows(char, other)
+            tables[0].update(["항목", "상태"], info_rows)
+            tables[1].update(["항목", "값"], basic_rows)
+            tables[2].update(["스킬", "기본 배율", "증폭 보너스", "타수", "총합"], skill_rows, is_amplification=char.is_amplification)
+            tables[3].update(["항목", "값"], cooldown_rows)
+        
+        result_headers = ["캐릭터", "DPM (M)", "APM"]
+        result_rows = [
+            [char1.name, f"{damage1:,.2f}", f"{apm1:.1f}"],
+            [char2.name, f"{damage2:,.2f}", f"{apm2:.1f}"]
+        ]
+        if stats1 is not None and stats2 is not None and stats1.engine != ENGINE_EXACT:
+            result_rows[0][1] += f" ± {stats1.dpm_half_width:,.2f}"
+            result_rows[1][1] += f" ± {stats2.dpm_half_width:,.2f}"
+            result_headers.append("시뮬레이션 수")
+            result_rows[0].append(f"{stats1.simulations:,}")
+            result_rows[1].append(f"{stats2.simulations:,}")
+        if exact1 is not None and exact2 is not None:
+            result_headers.append("기댓값 DPM (M)")
+            result_rows[0].append(f"{exact1[0]:,.2f}")
+            result_rows[1].append(f"{exact2[0]:,.2f}")
+        self.result_table.update(result_headers, result_rows)
+        
+        distributed = [(char, stats) for char, stats in ((char1, stats1), (char2, stats2)) if stats is not None and stats.histogram is not None]
+        if distributed:
+            distribution_rows = [
+                [char.name, f"{stats.dpm:,.2f}"] + [f"{stats.dpm_percentile(percent):,.0f}" for percent in DPM_PERCENTILES]
+                for char, stats in distributed
+            ]
+            self.distribution_table.update(["캐릭터", "평균"] + [f"p{percent}" for percent in DPM_PERCENTILES], distribution_rows, height=len(distribution_rows))
+            self.distribution_table.frame.grid()
+        else:
+            self.distribution_table.frame.grid_remove()
+        
+        if stats1 is not None and stats2 is not None and stats1.source_dpm is not None and stats2.source_dpm is not None:
+            source_rows = [
+                [label] + [f"{stats.source_dpm[key]:,.2f} ({stats.source_dpm[key] / stats.dpm * 100 if stats.dpm else 0:.1f}%)" for stats in (stats1, stats2)]
+                for key, label in DAMAGE_SOURCES
+            ]
+            self.source_table.update(["출처", char1.name, char2.name], source_rows)
+            self.source_table.frame.grid()
+        else:
+            self.source_table.frame.grid_remove()
+        
+        cached_names = [char.name for char, stats in ((char1, stats1), (char2, stats2)) if stats is not None and stats.from_cache]
+        if cached_names:
+            self.cache_label.configure(text=f"💾 캐시된 결과 사용: {', '.join(cached_names)}")
+            self.cache_label.grid()
+        else:
+            self.cache_label.grid_remove()
+        
+        result_text, result_color = damage_verdict(char1, char2, damage1, damage2, comparison)
+        self.verdict_label.configure(text=result_text, fg=result_color)
+        apm_text, apm_color = apm_verdict(char1, char2, apm1, apm2)
+        self.apm_label.configure(text=apm_text, fg=apm_color)
+        
+        diagnosed = [(char, stats.diagnostics) for char, stats in ((char1, stats1), (char2, stats2)) if stats is not None and stats.diagnostics is not None]
+        if diagnosed:
+            for index, table in enumerate(self.diagnostics_tables):
+                if index >= len(diagnosed):
+                    table.frame.grid_remove()
+                    continue
+                char, diagnostics = diagnosed[index]
+                table.update(["항목", "값"], [
+                    ["총 틱", f"{diagnostics.ticks:,}"],
+                    ["스킬 / 치명타 / 일반", f"{diagnostics.skill:,} / {diagnostics.critical:,} / {diagnostics.normal:,}"],
+                    ["더블샷 / 트리플샷", f"{diagnostics.double_shot:,} / {diagnostics.triple_shot:,}"],
+                    ["치명 / 강타 발동", f"{diagnostics.critical_proc:,} / {diagnostics.strong_hit_proc:,}"],
+                    ["난수 / 분기 / 콜백 (초)", f"{diagnostics.rng_time:.3f} / {diagnostics.branch_time:.3f} / {diagnostics.callback_time:.3f}"],
+                    ["초당 틱", f"{diagnostics.ticks_per_second:,.0f}"]
+                ], title=char.name)
+                table.frame.grid()
+            self.diagnostics_frame.grid()
+        else:
+            self.diagnostics_frame.grid_remove()
+        
+        # 배치 계산까지 끝낸 시간을 갱신 시간으로 기록
+        self.frame.update_idletasks()
+        self.render_time = time.perf_counter() - start
+        self.render_label.configure(text=f"화면 갱신 {self.render_time * 1000:.1f} ms, 위젯 {count_widgets(self.frame)}개")
+
+
+def create_clean_output_display(parent, char1, char2, damage1, apm1, damage2, apm2, exact1=None, exact2=None, stats1=None, stats2=None, comparison=None,
+                                partial=False):
+    """완전히 깔끔한 Treeview 기반 출력 방식 (결과 프레임 내부도 연베이지톤 통일)
+
+    exact1/exact2에 (DPM, APM) 기댓값을 넘기면 결과 표에 기댓값 열을 함께 표시한다.
+    stats1/stats2(SimulationStats)를 넘기면 DPM 신뢰구간과 실제 시뮬레이션 횟수를 함께 표시한다.
+    comparison(PairedComparison)을 넘기면 DPM 차이를 p-값으로 판정한다.
+    partial=True면 조기 종료한 중간 결과임을 제목에 표시한다.
+    stats에 계측 결과(diagnostics)가 있으면 접을 수 있는 진단 정보 영역을 추가한다.
+    stats에 DPM 분포/출처별 데미지가 기록되어 있으면 평균과 함께 p5/p50/p95와 출처별 DPM을 표시한다.
+    반복해서 비교하는 화면은 ComparisonView를 한 번 만들어 update로 갱신하는 편이 빠르다.
+    """
+    for widget in parent.winfo_children():
+        widget.destroy()
+    view = ComparisonView(parent)
+    view.frame.pack(fill='both', expand=True)
+    view.update(char1, char2, damage1, apm1, damage2, apm2, exact1, exact2, stats1, stats2, comparison, partial)
+    return view.canvas
+
+
+def create_stat_value_display(parent, char, values, base_stats):
+    """스탯 효율(1포인트당 DPM 증가량) 순위 표 출력"""
+    for widget in parent.winfo_children():
+        widget.destroy()
+    
+    frame = tk.Frame(parent, bg=PASTEL_BG)
+    frame.pack(fill='both', expand=True, padx=10, pady=5)
+    
+    title_label = tk.Label(frame, text=f"📈 {char.name} 스탯 효율", font=("Arial", 14, "bold"), bg=PASTEL_BG)
+    title_label.pack(pady=(10, 5))
+    base_text = f"기준 DPM {base_stats.dpm:,.2f} (M)"
+    if base_stats.engine != ENGINE_EXACT:
+        base_text += f" ± {base_stats.dpm_half_width:,.2f}, {base_stats.simulations:,}회 (공통 난수)"
+    tk.Label(frame, text=base_text, font=("Arial", 10), bg=PASTEL_BG).pack(pady=(0, 5))
+    
+    headers = ["순위", "스탯", "1포인트", "DPM 증가 (M)", "공격력 환산"]
+    data = []
+    for rank, value in enumerate(values, 1):
+        # 확률/배율은 %p, 공격 속도/공격력은 입력값 그대로 1포인트
+        unit_text = "+1%p" if value.unit < 1 else "+1"
+        gain_text = f"{value.dpm_gain:+,.2f}"
+        if base_stats.engine != ENGINE_EXACT:
+            gain_text += f" ± {value.half_width:,.2f}"
+        data.append([f"{rank}", value.label, unit_text, gain_text, f"공격력 {value.equivalent_attack_power:+.3f}%"])
+    table = create_table_frame(frame, headers, data, "", height=len(data))
+    table.pack(fill='x', pady=(0, 10))
+    
+    tk.Label(frame, text="공격력 환산: 해당 스탯 1포인트와 같은 DPM 증가를 주는 공격력 증가율", font=("Arial", 9), bg=PASTEL_BG, fg="gray").pack(pady=(0, 5))
+    return frame
+
+
+def format_stat_allocation(allocation):
+    """스탯 배분을 "공격 속도 +3, 치명 확률 +5%p" 형식 문장으로 변환"""
+    labels = {attribute: label for attribute, label, _, _ in STAT_VALUE_STATS}
+    deltas = {attribute: delta for attribute, delta, _, _ in STAT_BUDGET_STATS}
+    parts = []
+    for attribute, count in allocation.steps.items():
+        change = count * deltas.get(attribute, 1)
+        text = f"+{change:g}" if attribute == "attack_speed" else f"+{change * 100:g}%p"
+        parts.append(f"{labels.get(attribute, attribute)} {text}")
+    return ", ".join(parts) if parts else "투자 없음"
+
+
+def create_stat_budget_display(parent, char, allocations, base_dpm, budget):
+    """스탯 배분 최적화 결과 표 출력 (최적 배분과 차선 배분)"""
+    for widget in parent.winfo_children():
+        widget.destroy()
+    
+    frame = tk.Frame(parent, bg=PASTEL_BG)
+    frame.pack(fill='both', expand=True, padx=10, pady=5)
+    
+    title_label = tk.Label(frame, text=f"🧮 {char.name} 스탯 배분 ({budget}포인트)", font=("Arial", 14, "bold"), bg=PASTEL_BG)
+    title_label.pack(pady=(10, 5))
+    tk.Label(frame, text=f"현재 DPM {base_dpm:,.2f} (M), 기댓값(exact) 기준", font=("Arial", 10), bg=PASTEL_BG).pack(pady=(0, 5))
+    
+    headers = ["순위", "배분", "DPM (M)", "증가"]
+    data = []
+    for rank, allocation in enumerate(allocations, 1):
+        gain_rate = allocation.dpm_gain / base_dpm * 100 if base_dpm else 0.0
+        data.append([f"{rank}", format_stat_allocation(allocation), f"{allocation.dpm:,.2f}", f"{allocation.dpm_gain:+,.2f} ({gain_rate:+.2f}%)"])
+    table = create_table_frame(frame, headers, data, "", height=len(data))
+    table.pack(fill='x', pady=(0, 10))
+    return frame
+
+
+def create_roster_display(parent, ranking):
+    """로스터 순위 표 출력 (1위 대비 DPM 차이는 공통 난수 짝지은 신뢰구간)"""
+    for widget in parent.winfo_children():
+        widget.destroy()
+    
+    frame = tk.Frame(parent, bg=PASTEL_BG)
+    frame.pack(fill='both', expand=True, padx=10, pady=5)
+    
+    exact = ranking[0].stats.engine == ENGINE_EXACT
+    pruned = sum(entry.pruned for entry in ranking)
+    title_label = tk.Label(frame, text=f"🏆 로스터 순위 ({len(ranking)}개 빌드)", font=("Arial", 14, "bold"), bg=PASTEL_BG)
+    title_label.pack(pady=(10, 5))
+    if pruned:
+        tk.Label(frame, text=f"상위권과 차이가 확실한 {pruned}개 빌드는 중간에 제외 (제외 시점의 결과 표시)", font=("Arial", 10), bg=PASTEL_BG).pack(pady=(0, 5))
+    
+    # 빌드 수가 많아도 보이는 행만 그리도록 열 단위로 모아 가상 표에 넘김
+    columns = {
+        "rank": array("q", (entry.rank for entry in ranking)),
+        "name": [entry.name for entry in ranking],
+        "dpm": array("d", (entry.stats.dpm for entry in ranking)),
+        "dpm_half_width": array("d", (entry.stats.dpm_half_width for entry in ranking)),
+        "gap": array("d", (entry.gap for entry in ranking)),
+        "gap_half_width": array("d", (entry.gap_half_width for entry in ranking)),
+        "simulations": array("q", (entry.stats.simulations for entry in ranking)),
+        "status": ["(제외)" if entry.pruned else "" for entry in ranking]
+    }
+    headings = {"rank": "순위", "name": "이름", "dpm": "DPM (M)", "dpm_half_width": "DPM ±", "gap": "1위 대비 (M)", "gap_half_width": "차이 ±",
+                "simulations": "횟수", "status": "상태"}
+    if exact:
+        for name in ("dpm_half_width", "gap_half_width", "simulations"):
+            del columns[name]
+    formats = {"dpm": "{:,.2f}".format, "dpm_half_width": "{:,.2f}".format, "gap": "{:+,.2f}".format, "gap_half_width": "{:,.2f}".format}
+    table = VirtualTable(frame, ColumnarRows(columns, formats, headings), height=ROSTER_TABLE_ROWS)
+    table.frame.pack(fill='both', expand=True, pady=(0, 10))
+    return frame
+
+
+def create_columnar_display(parent, title, columns):
+    """열 단위 결과(스윕/배치/로스터 CSV 등)를 정렬·필터 가능한 가상 표로 출력"""
+    for widget in parent.winfo_children():
+        widget.destroy()
+    
+    frame = tk.Frame(parent, bg=PASTEL_BG)
+    frame.pack(fill='both', expand=True, padx=10, pady=5)
+    tk.Label(frame, text=title, font=("Arial", 14, "bold"), bg=PASTEL_BG).pack(pady=(10, 5))
+    tk.Label(frame, text="열 제목을 누르면 정렬, 필터 예: dpm>100, attack_speed=120, 이름 일부", font=("Arial", 10), bg=PASTEL_BG).pack(pady=(0, 5))
+    table = VirtualTable(frame, ColumnarRows(columns), height=VIRTUAL_TABLE_ROWS)
+    table.frame.pack(fill='both', expand=True, pady=(0, 10))
+    return frame
+
+
+def paired_verdict(char1, char2, comparison):
+    """공통 난수 비교 결과 문장과 색상 (고정 비율 대신 p-값으로 판정)"""
+    diff = comparison.dpm_difference
+    half_width = comparison.difference_half_width
+    percentage = abs(diff) / comparison.stats1.dpm * 100
+    detail = f"95% 구간 {diff - half_width:+,.2f} ~ {diff + half_width:+,.2f}, p={comparison.p_value:.3g}, {comparison.simulations:,}회"
+    if not comparison.is_significant:
+        return f"{char2.name}와 {char1.name}의 DPM 차이 {diff:+,.2f} (M)는 통계적으로 의미 없음\n({detail})", "gray"
+    if diff > 0:
+        return f"{char2.name}가 {char1.name}보다 {diff:,.2f} DPM (M) 높음 ({percentage:.2f}% 강함) ▲\n({detail})", "blue"
+    return f"{char2.name}이 {char1.name}보다 {-diff:,.2f} DPM (M) 낮음 ({percentage:.2f}% 약함) ▼\n({detail})", "red"
+
+
+def compare_characters(char1, char2, minutes=0.5, simulations=10000, text_widget=None, engine=DEFAULT_ENGINE, show_exact=False, workers=1, seed=None,
+                       target_relative_error=None, time_budget=None, paired=False):
+    """캐릭터 데미지 비교 - 새로운 깔끔한 출력 방식 사용 (show_exact=True면 기댓값도 함께 출력)
+
+    target_relative_error나 time_budget을 지정하면 두 캐릭터의 DPM 차이 신뢰구간이 충분히 좁아질 때까지만 시뮬레이션한다.
+    paired=True면 두 캐릭터가 같은 난수를 쓰는 공통 난수 비교를 하고 차이를 p-값으로 판정한다.
+    """
+    print(f"시뮬레이션 시작: {minutes}분, {simulations}회 ({engine} 엔진{', 공통 난수' if paired else ''})")
+    
+    # 시뮬레이션 실행
+    comparison = None
+    if paired and engine != ENGINE_EXACT:
+        comparison = run_paired_comparison(char1, char2, minutes, simulations, engine, workers, seed, None, target_relative_error, time_budget)
+        stats1, stats2 = comparison.stats1, comparison.stats2
+    else:
+        stats1, stats2 = run_characters([char1, char2], minutes, simulations, engine, workers, seed, None,
+                                        target_relative_error, time_budget, compare_difference=True)
+    damage1, apm1 = stats1.dpm, stats1.apm
+    damage2, apm2 = stats2.dpm, stats2.apm
+    
+    # 기댓값 계산 (exact 엔진이면 시뮬레이션 결과가 곧 기댓값)
+    exact1 = exact2 = None
+    if show_exact and engine != ENGINE_EXACT:
+        exact1 = char1.simulate_damage(minutes, engine=ENGINE_EXACT)
+        exact2 = char2.simulate_damage(minutes, engine=ENGINE_EXACT)
+    
+    print(f"시뮬레이션 완료!")
+    print(f"{char1.name}: {damage1:,.2f} ± {stats1.dpm_half_width:,.2f} DPM (M), {apm1:.1f} APM ({stats1.simulations:,}회)")
+    print(f"{char2.name}: {damage2:,.2f} ± {stats2.dpm_half_width:,.2f} DPM (M), {apm2:.1f} APM ({stats2.simulations:,}회)")
+    if exact1 is not None:
+        print(f"{char1.name} 기댓값: {exact1[0]:,.2f} DPM (M), {exact1[1]:.1f} APM")
+        print(f"{char2.name} 기댓값: {exact2[0]:,.2f} DPM (M), {exact2[1]:.1f} APM")
+    
+    # GUI 업데이트 (새로운 깔끔한 방식 사용)
+    if text_widget:
+        # text_widget의 부모 위젯을 찾아서 새로운 출력 방식 적용
+        parent_widget = text_widget.master
+        while parent_widget and not hasattr(parent_widget, 'winfo_children'):
+            parent_widget = parent_widget.master
+        
+        if parent_widget:
+            # 기존 텍스트 위젯 숨기기
+            text_widget.pack_forget()
+            
+            # 새로운 깔끔한 출력 생성
+            create_clean_output_display(parent_widget, char1, char2, damage1, apm1, damage2, apm2, exact1, exact2, stats1, stats2, comparison)
+    
+    # 콘솔 출력
+    print("\n" + "="*50)
+    print("캐릭터 데미지 비교 결과")
+    print("="*50)
+    
+    # 결과 테이블 출력
+    result_data = [
+        [char1.name, f"{damage1:,.2f}", f"{apm1:.1f}"],
+        [char2.name, f"{damage2:,.2f}", f"{apm2:.1f}"]
+    ]
+    
+    print("\n데미지 비교:")
+    print("┌" + "─" * 40 + "┐")
+    print("│" + "캐릭터".center(15) + "│" + "DPM (M)".center(15) + "│" + "APM".center(10) + "│")
+    print("├" + "─" * 40 + "┤")
+    for char_name, dpm, apm in result_data:
+        print(f"│{char_name:^15}│{dpm:^15}│{apm:^10}│")
+    print("└" + "─" * 40 + "┘")
+    
+    # 결과 분석
+    if comparison is not None:
+        print("\n" + paired_verdict(char1, char2, comparison)[0])
+    elif damage1 > damage2:
+        diff = damage1 - damage2
+        percentage = (diff / damage2) * 100
+        if percentage <= INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD:
+            print(f"\n{char2.name}이 {char1.name}보다 {diff:,.2f} DPM (M) 낮음 ({percentage:.2f}% 차이, 의미 없음)")
+        else:
+            print(f"\n{char2.name}이 {char1.name}보다 {diff:,.2f} DPM (M) 낮음 ({percentage:.2f}% 약함)")
+    elif damage2 > damage1:
+        diff = damage2 - damage1
+        percentage = (diff / damage1) * 100
+        if percentage <= INSIGNIFICANT_DPM_DIFFERENCE_RATE_THRESHOLD:
+            print(f"\n{char2.name}가 {char1.name}보다 {diff:,.2f} DPM (M) 높음 ({percentage:.2f}% 차이, 의미 없음)")
+        else:
+            print(f"\n{char2.name}가 {char1.name}보다 {diff:,.2f} DPM (M) 높음 ({percentage:.2f}% 강함)")
+    else:
+        print("\n두 캐릭터의 데미지가 동일합니다.")
+    
+    # APM 비교
+    apm_diff = apm1 - apm2
+    if apm_diff > INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD:
+        print(f"{char2.name}가 {char1.name}보다 {abs(apm_diff):.1f} APM 느림")
+    elif apm_diff < -INSIGNIFICANT_APM_DIFFERENCE_THRESHOLD:
+        print(f"{char2.name}가 {char1.name}보다 {abs(apm_diff):.1f} APM 빠름")
+    else:
+        print(f"APM 차이: {apm_diff:+.1f} ({apm1:.1f} vs {apm2:.1f}) (의미 없음)")
+    
+    print("="*50)
+
+
+class CharacterGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title(f"캐릭터 추가스펙 시뮬레이터 {VERSION}")
+        self.root.geometry("1x1000")
+        self.root.update_idletasks()
+        self.root.geometry("")
+        self.root.resizable(False, False)
+        self.root.configure(bg=PASTEL_BG)
+        
+        # 폰트 정의를 먼저!
+        self.text_font = ("맑은 고딕", 10)
+        
+        # 스타일 설정 (연베이지톤)
+        style = ttk.Style()
+        style.theme_use('clam')
+        style.configure("Custom.TFrame", background=PASTEL_BG)
+        style.configure("Custom.TLabel", background=PASTEL_BG)
+        style.configure("Custom.TLabelframe", background=PASTEL_BG)
+        style.configure("Custom.Treeview", background=PASTEL_BG, fieldbackground=PASTEL_BG, borderwidth=0)
+        style.configure("Custom.Treeview.Heading", background=PASTEL_BG)
+        style.map("Custom.Treeview", background=[('selected', '#e0d8c3')])
+        style.configure("Custom.TEntry", fieldbackground=PASTEL_BG, background=PASTEL_BG)
+        style.configure("Korean.TCheckbutton", background=PASTEL_BG)
+        style.configure("Korean.TButton", background=PASTEL_BG)
+        
+        # 시뮬레이션 워커 프로세스 (미리 띄워 두어 첫 비교 시 대기 없음)
+        self.worker = SimulationWorker()
+        self.worker.start()
+        self.current_job_id = None
+        self.current_characters = []
+        # 즉시 미리보기용 근사 DPM 표 ((시간, 치명타 쿨타임, 스킬 쿨타임) → 표), 없으면 별도 프로세스에서 만듦
+        self.surrogate_tables = {}
+        self.surrogate_builder = None
+        self.live_recompute_id = None  # 자동 재계산 대기 중인 after 번호 (입력이 이어지면 취소 후 다시 예약)
+        # 결과창에서 재사용하는 패널 (처음 필요할 때 만듦)
+        self.progress_frame = None
+        self.comparison_view = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # self.setup_korean_font()
+        self.create_widgets()
+        self.watch_inputs()
+        self.root.after(100, self.auto_load_settings)
+    
+    def setup_korean_font(self):
+        """한글 폰트 설정 (WSL2 등 환경 자동 대응)"""
+        try:
+            # 고정폭 한글 폰트 우선 (표 출력용)
+            monospace_korean_fonts = [
+                'D2Coding', 'NanumGothicCoding', 'NanumBarunGothicCoding',
+                'Consolas', 'Courier New', 'Monaco', 'Menlo'
+            ]
+            
+            # 일반 한글 폰트들
+            korean_fonts = [
+                'NanumGothic', 'NanumBarunGothic', 'NanumSquare', 'NanumMyeongjo',
+                'Malgun Gothic', 'Dotum', 'Gulim', 'Batang',
+                'DejaVu Sans', 'Liberation Sans', 'Ubuntu', 'Noto Sans CJK KR'
+            ]
+
+            # 사용 가능한 폰트 찾기 (tkinter.font 명시적 사용)
+            available_fonts = list(tkinter.font.families())
+            selected_font = None
+            selected_monospace_font = None
+
+            # 고정폭 폰트 먼저 찾기
+            for font_name in monospace_korean_fonts:
+                if font_name in available_fonts:
+                    selected_monospace_font = font_name
+                    break
+
+            # 일반 폰트 찾기
+            for font_name in korean_fonts:
+                if font_name in available_fonts:
+                    selected_font = font_name
+                    break
+
+            if selected_font:
+                # 기본 폰트 설정
+                default_font = tkinter.font.nametofont("TkDefaultFont")
+                default_font.configure(family=selected_font, size=10)
+                # 텍스트 위젯 폰트 설정
+                self.text_font = (selected_font, 10)
+                print(f"[INFO] 한글 폰트 적용: {selected_font}")
+            else:
+                # 폰트를 찾지 못한 경우 안내 메시지 출력
+                print("[WARNING] 시스템에 한글 폰트가 설치되어 있지 않습니다.\n"
+                      "WSL2 Ubuntu 환경이라면 아래 명령어로 한글 폰트를 설치하세요:\n"
+                      "sudo apt update && sudo apt install fonts-nanum fonts-nanum-coding fonts-nanum-extra\n"
+                      "설치 후 WSL을 재시작하세요.")
+                self.text_font = ("TkDefaultFont", 10)
+                
+            # 고정폭 폰트 설정
+            if selected_monospace_font:
+                self.monospace_font = (selected_monospace_font, 10)
+                print(f"[INFO] 고정폭 폰트 적용: {selected_monospace_font}")
+            else:
+                self.monospace_font = ("Consolas", 10)
+                print("[INFO] 기본 고정폭 폰트 적용: Consolas")
+                
+        except Exception as e:
+            print(f"폰트 설정 중 오류: {e}")
+            self.text_font = ("TkDefaultFont", 10)
+            self.monospace_font = ("Consolas", 10)
+    
+
+
+    
+    def save_settings(self):
+        """현재 설정을 JSON 파일로 저장"""
+        settings = {
+            "char1": {
+                "name": self.char1_name_var.get(),
+                "seventh_awakening": self.char1_seventh_awakening_var.get(),
+                "cooldown": self.char1_cooldown_var.get(),
+                "amplification": self.char1_amplification_var.get(),
+                "third_awakening": self.char1_third_awakening_var.get(),
+                "attack_speed": self.char1_attack_speed_var.get(),
+                "attack_power": self.char1_attack_power_var.get(),
+                "critical": self.char1_critical_var.get(),
+                "strong_hit": self.char1_strong_hit_var.get(),
+                "double_shot": self.char1_double_shot_var.get(),
+                "triple_shot": self.char1_triple_shot_var.get(),
+                "critical_mult": self.char1_critical_mult_var.get(),
+                "strong_hit_mult": self.char1_strong_hit_mult_var.get()
+            },
+            "char2": {
+                "name": self.char2_name_var.get(),
+                "seventh_awakening": self.char2_seventh_awakening_var.get(),
+                "cooldown": self.char2_cooldown_var.get(),
+                "amplification": self.char2_amplification_var.get(),
+                "third_awakening": self.char2_third_awakening_var.get(),
+                "attack_speed": self.char2_attack_speed_var.get(),
+                "attack_power": self.char2_attack_power_var.get(),
+                "critical": self.char2_critical_var.get(),
+                "strong_hit": self.char2_strong_hit_var.get(),
+                "double_shot": self.char2_double_shot_var.get(),
+                "triple_shot": self.char2_triple_shot_var.get(),
+                "critical_mult": self.char2_critical_mult_var.get(),
+                "strong_hit_mult": self.char2_strong_hit_mult_var.get()
+            },
+            "common": {
+                "damage_1": self.damage_1_var.get(),
+                "damage_2": self.damage_2_var.get(),
+                "damage_3": self.damage_3_var.get(),
+                "hit_1": self.hit_1_var.get(),
+                "hit_2": self.hit_2_var.get(),
+                "hit_3": self.hit_3_var.get(),
+                "critical_cd": self.critical_cd_var.get(),
+                "skill_cd": self.skill_cd_var.get()
+            },
+            "simulation": {
+                "minutes": self.minutes_var.get(),
+                "simulations": self.simulations_var.get(),
+                "engine": self.engine_var.get(),
+                "show_exact": self.show_exact_var.get(),
+                "workers": self.workers_var.get(),
+                "seed": self.seed_var.get(),
+                "target_error": self.target_error_var.get(),
+                "time_budget": self.time_budget_var.get(),
+                "paired": self.paired_var.get(),
+                "diagnostics": self.diagnostics_var.get()
+            }
+        }
+        
+        try:
+            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+                json.dump(settings, f, ensure_ascii=False, indent=2)
+            print("설정이 저장되었습니다.")
+        except Exception as e:
+            print(f"설정 저장 중 오류: {e}")
+    
+    def load_settings(self):
+        """JSON 파일에서 설정을 불러옴"""
+        if not os.path.exists(SETTINGS_FILE):
+            return False
+        
+        try:
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            
+            # 캐릭터 1 설정 불러오기
+            if "char1" in settings:
+                char1 = settings["char1"]
+                self.char1_name_var.set(char1.get("name", "사브리나(전)"))
+                self.char1_seventh_awakening_var.set(char1.get("seventh_awakening", True))
+                self.char1_cooldown_var.set(char1.get("cooldown", True))
+                self.char1_amplification_var.set(char1.get("amplification", False))
+                self.char1_third_awakening_var.set(char1.get("third_awakening", False))
+                self.char1_attack_speed_var.set(char1.get("attack_speed", str(Character.DEFAULT_ATTACK_SPEED)))
+                self.char1_attack_power_var.set(char1.get("attack_power", str(Character.DEFAULT_ATTACK_POWER)))
+                self.char1_critical_var.set(char1.get("critical", str(round(Character.DEFAULT_P_CRITICAL*100, 2))))
+                self.char1_strong_hit_var.set(char1.get("strong_hit", str(round(Character.DEFAULT_P_STRONG_HIT*100, 2))))
+                self.char1_double_shot_var.set(char1.get("double_shot", str(round(Character.DEFAULT_P_DOUBLE_SHOT*100, 2))))
+                self.char1_triple_shot_var.set(char1.get("triple_shot", str(round(Character.DEFAULT_P_TRIPLE_SHOT*100, 2))))
+                self.char1_critical_mult_var.set(char1.get("critical_mult", str(round(Character.DEFAULT_CRITICAL_MULTIPLIER*100, 2))))
+                self.char1_strong_hit_mult_var.set(char1.get("strong_hit_mult", str(round(Character.DEFAULT_STRONG_HIT_MULTIPLIER*100, 2))))
+            
+            # 캐릭터 2 설정 불러오기
+            if "char2" in settings:
+                char2 = settings["char2"]
+                self.char2_name_var.set(char2.get("name", "사브리나(후)"))
+                self.char2_seventh_awakening_var.set(char2.get("seventh_awakening", True))
+                self.char2_cooldown_var.set(char2.get("cooldown", True))
+                self.char2_amplification_var.set(char2.get("amplification", False))
+                self.char2_third_awakening_var.set(char2.get("third_awakening", False))
+                self.char2_attack_speed_var.set(char2.get("attack_speed", "130"))
+                self.char2_attack_power_var.set(char2.get("attack_power", str(Character.DEFAULT_ATTACK_POWER)))
+                self.char2_critical_var.set(char2.get("critical", str(round(Character.DEFAULT_P_CRITICAL*100, 2))))
+                self.char2_strong_hit_var.set(char2.get("strong_hit", str(round(Character.DEFAULT_P_STRONG_HIT*100, 2))))
+                self.char2_double_shot_var.set(char2.get("double_shot", str(round(Character.DEFAULT_P_DOUBLE_SHOT*100, 2))))
+                self.char2_triple_shot_var.set(char2.get("triple_shot", str(round(Character.DEFAULT_P_TRIPLE_SHOT*100, 2))))
+                self.char2_critical_mult_var.set(char2.get("critical_mult", str(round(Character.DEFAULT_CRITICAL_MULTIPLIER*100, 2))))
+                self.char2_strong_hit_mult_var.set(char2.get("strong_hit_mult", str(round(Character.DEFAULT_STRONG_HIT_MULTIPLIER*100, 2))))
+            
+            # 공통 설정 불러오기
+            if "common" in settings:
+                common = settings["common"]
+                self.damage_1_var.set(common.get("damage_1", str(round(Character.DEFAULT_DAMAGE_SKILL_1*100, 2))))
+                self.damage_2_var.set(common.get("damage_2", str(round(Character.DEFAULT_DAMAGE_SKILL_2*100, 2))))
+                self.damage_3_var.set(common.get("damage_3", str(round(Character.DEFAULT_DAMAGE_SKILL_3*100, 2))))
+                self.hit_1_var.set(common.get("hit_1", str(Character.DEFAULT_HIT_1)))
+                self.hit_2_var.set(common.get("hit_2", str(Character.DEFAULT_HIT_2)))
+                self.hit_3_var.set(common.get("hit_3", str(Character.DEFAULT_HIT_3)))
+                self.critical_cd_var.set(common.get("critical_cd", str(Character.DEFAULT_CRITICAL_COOLDOWN)))
+                self.skill_cd_var.set(common.get("skill_cd", str(Character.DEFAULT_SKILL_COOLDOWN)))
+            
+            # 시뮬레이션 설정 불러오기
+            if "simulation" in settings:
+                sim = settings["simulation"]
+                self.minutes_var.set(sim.get("minutes", "1"))
+                self.simulations_var.set(sim.get("simulations", "20000"))
+                engine = sim.get("engine", DEFAULT_ENGINE)
+                self.engine_var.set(engine if engine in available_engines() else DEFAULT_ENGINE)
+                self.show_exact_var.set(sim.get("show_exact", False))
+                self.workers_var.set(sim.get("workers", str(DEFAULT_WORKERS)))
+                self.seed_var.set(sim.get("seed", ""))
+                self.target_error_var.set(sim.get("target_error", ""))
+                self.time_budget_var.set(sim.get("time_budget", ""))
+                self.paired_var.set(sim.get("paired", False))
+                self.diagnostics_var.set(sim.get("diagnostics", False))
+            
+            print("설정을 불러왔습니다.")
+            return True
+            
+        except Exception as e:
+            print(f"설정 불러오기 중 오류: {e}")
+            return False
+    
+    def auto_load_settings(self):
+        """프로그램 시작 시 자동으로 설정 파일 불러오기"""
+        if self.load_settings():
+            print("프로그램 시작 시 설정 파일을 자동으로 불러왔습니다.")
+        # 설정 불러오기 완료 후 초기값 저장 (JSON에서 불러온 값이 초기값이 되도록)
+        self.save_initial_values()
+    
+    def validate_numeric_input(self, value, min_value=0, max_value=None, field_name="값", quiet=False):
+        """숫자 입력 검증 (quiet면 경고창 없이 결과만 반환)"""
+        try:
+            num_value = float(value)
+            if num_value < min_value:
+                if not quiet:
+                    messagebox.showwarning("입력 경고", f"{field_name}은 {min_value} 이상이어야 합니다.")
+                return False
+            if max_value is not None and num_value > max_value:
+                if not quiet:
+                    messagebox.showwarning("입력 경고", f"{field_name}은 {max_value} 이하여야 합니다.")
+                return False
+            return True
+        except ValueError:
+            if not quiet:
+                messagebox.showerror("입력 오류", f"{field_name}에 숫자를 입력해주세요.")
+            return False
+    
+    def validate_integer_input(self, value, min_value=1, field_name="값", quiet=False):
+        """정수 입력 검증 (quiet면 경고창 없이 결과만 반환)"""
+        try:
+            int_value = int(float(value))
+            if int_value < min_value:
+                if not quiet:
+                    messagebox.showwarning("입력 경고", f"{field_name}은 {min_value} 이상이어야 합니다.")
+                return False
+            return True
+        except ValueError:
+            if not quiet:
+                messagebox.showerror("입력 오류", f"{field_name}에 정수를 입력해주세요.")
+            return False
+    
+    def limit_probability(self, char_prefix, prob_type):
+        """확률 값을 100% 이하로 제한하는 함수"""
+        try:
+            var_name = f"{char_prefix}_{prob_type}_var"
+            var = getattr(self, var_name)
+            current_value = float(var.get())
+            
+            if current_value > 100:
+                var.set("100.00")
+                print(f"{prob_type} 확률이 100%를 초과하여 100%로 제한되었습니다.")
+        except ValueError:
+            # 숫자가 아닌 값이 입력된 경우 기본값으로 설정
+            default_values = {
+                'critical': round(Character.DEFAULT_P_CRITICAL * 100, 2),
+                'strong_hit': round(Character.DEFAULT_P_STRONG_HIT * 100, 2),
+                'double_shot': round(Character.DEFAULT_P_DOUBLE_SHOT * 100, 2),
+                'triple_shot': round(Character.DEFAULT_P_TRIPLE_SHOT * 100, 2)
+            }
+            var.set(str(default_values.get(prob_type, "0.00")))
+            print(f"{prob_type} 확률에 잘못된 값이 입력되어 기본값으로 설정되었습니다.")
+        
+    def create_widgets(self):
+        # 메인 프레임
+        main_frame = ttk.Frame(self.root, style="Custom.TFrame")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        for i in range(2):
+            main_frame.grid_columnconfigure(i, minsize=140)
+        main_frame.grid_rowconfigure(5, weight=1)
+
+        # 캐릭터 1 프레임 (tk.LabelFrame, 배경색 지정)
+        char1_frame = tk.LabelFrame(main_frame, text="캐릭터 1", bg=PASTEL_BG, fg="black", font=self.text_font)
+        char1_frame.grid(row=0, column=0, sticky=tk.NW, padx=(2, 8), pady=(4, 0))
+        # 캐릭터 2 프레임 (tk.LabelFrame, 배경색 지정)
+        char2_frame = tk.LabelFrame(main_frame, text="캐릭터 2", bg=PASTEL_BG, fg="black", font=self.text_font)
+        char2_frame.grid(row=0, column=1, sticky=tk.NW, padx=0, pady=(4, 0))
+
+        # 공통 설정 프레임 (tk.LabelFrame)
+        common_frame = tk.LabelFrame(main_frame, text="공통 설정", bg=PASTEL_BG, fg="black", font=self.text_font)
+        common_frame.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(10, 2), padx=(2, 2))
+        entry_width = 12
+        entry_justify = 'right'
+        entry_padx_1 = (3, 6)
+        entry_padx_2 = (29, 2)
+        label_padx_1 = (2, 3)
+        label_padx_2 = (10, 2)
+        # 1행
+        tk.Label(common_frame, text="일반 공격 배율 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=0, column=0, sticky=tk.W, padx=label_padx_1)
+        self.damage_1_var = tk.StringVar(value=str(round(Character.DEFAULT_DAMAGE_SKILL_1*100, 2)))
+        tk.Entry(common_frame, textvariable=self.damage_1_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=0, column=1, sticky=tk.W, padx=entry_padx_1)
+        tk.Label(common_frame, text="일반 공격 타수:", font=self.text_font, bg=PASTEL_BG).grid(row=0, column=2, sticky=tk.W, padx=label_padx_2)
+        self.hit_1_var = tk.StringVar(value=str(Character.DEFAULT_HIT_1))
+        tk.Entry(common_frame, textvariable=self.hit_1_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=0, column=3, sticky=tk.W, padx=entry_padx_2)
+        # 2행
+        tk.Label(common_frame, text="치명타 공격 배율 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=1, column=0, sticky=tk.W, padx=label_padx_1)
+        self.damage_2_var = tk.StringVar(value=str(round(Character.DEFAULT_DAMAGE_SKILL_2*100, 2)))
+        tk.Entry(common_frame, textvariable=self.damage_2_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=1, column=1, sticky=tk.W, padx=entry_padx_1)
+        tk.Label(common_frame, text="치명타 공격 타수:", font=self.text_font, bg=PASTEL_BG).grid(row=1, column=2, sticky=tk.W, padx=label_padx_2)
+        self.hit_2_var = tk.StringVar(value=str(Character.DEFAULT_HIT_2))
+        tk.Entry(common_frame, textvariable=self.hit_2_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=1, column=3, sticky=tk.W, padx=entry_padx_2)
+        # 3행
+        tk.Label(common_frame, text="전용 스킬 배율 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=2, column=0, sticky=tk.W, padx=label_padx_1)
+        self.damage_3_var = tk.StringVar(value=str(round(Character.DEFAULT_DAMAGE_SKILL_3*100, 2)))
+        tk.Entry(common_frame, textvariable=self.damage_3_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=2, column=1, sticky=tk.W, padx=entry_padx_1)
+        tk.Label(common_frame, text="전용 스킬 타수:", font=self.text_font, bg=PASTEL_BG).grid(row=2, column=2, sticky=tk.W, padx=label_padx_2)
+        self.hit_3_var = tk.StringVar(value=str(Character.DEFAULT_HIT_3))
+        tk.Entry(common_frame, textvariable=self.hit_3_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=2, column=3, sticky=tk.W, padx=entry_padx_2)
+        # 4행
+        tk.Label(common_frame, text="치명타 쿨타임 (초):", font=self.text_font, bg=PASTEL_BG).grid(row=3, column=0, sticky=tk.W, padx=label_padx_1, pady=(0, 1))
+        self.critical_cd_var = tk.StringVar(value=str(Character.DEFAULT_CRITICAL_COOLDOWN))
+        tk.Entry(common_frame, textvariable=self.critical_cd_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=3, column=1, sticky=tk.W, padx=entry_padx_1, pady=(0, 1))
+        tk.Label(common_frame, text="스킬 쿨타임 (초):", font=self.text_font, bg=PASTEL_BG).grid(row=3, column=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        self.skill_cd_var = tk.StringVar(value=str(Character.DEFAULT_SKILL_COOLDOWN))
+        tk.Entry(common_frame, textvariable=self.skill_cd_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=3, column=3, sticky=tk.W, padx=entry_padx_2, pady=(0, 1))
+
+        # 시뮬레이션 설정 프레임 (tk.LabelFrame)
+        simulation_frame = tk.LabelFrame(main_frame, text="시뮬레이션 설정", bg=PASTEL_BG, fg="black", font=self.text_font)
+        simulation_frame.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 2), padx=(2, 2))
+        tk.Label(simulation_frame, text="시뮬레이션 시간 (분):", font=self.text_font, bg=PASTEL_BG).grid(row=0, column=0, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+        self.minutes_var = tk.StringVar(value="1")
+        tk.Entry(simulation_frame, textvariable=self.minutes_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=0, column=1, sticky=tk.W, padx=entry_padx_1, pady=(0, 1))
+        tk.Label(simulation_frame, text="시뮬레이션 횟수:", font=self.text_font, bg=PASTEL_BG).grid(row=0, column=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        self.simulations_var = tk.StringVar(value="10000")
+        tk.Entry(simulation_frame, textvariable=self.simulations_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=0, column=3, sticky=tk.W, padx=(32, 2), pady=(0, 1))
+        tk.Label(simulation_frame, text="시뮬레이션 엔진:", font=self.text_font, bg=PASTEL_BG).grid(row=1, column=0, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+        self.engine_var = tk.StringVar(value=DEFAULT_ENGINE)
+        ttk.Combobox(simulation_frame, textvariable=self.engine_var, values=available_engines(), state="readonly", width=entry_width - 2, font=self.text_font).grid(row=1, column=1, sticky=tk.W, padx=entry_padx_1, pady=(0, 1))
+        self.show_exact_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(simulation_frame, text="기댓값 함께 표시", variable=self.show_exact_var, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        tk.Label(simulation_frame, text="워커 수 (코어):", font=self.text_font, bg=PASTEL_BG).grid(row=2, column=0, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+        self.workers_var = tk.StringVar(value=str(DEFAULT_WORKERS))
+        tk.Entry(simulation_frame, textvariable=self.workers_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=2, column=1, sticky=tk.W, padx=entry_padx_1, pady=(0, 1))
+        tk.Label(simulation_frame, text="난수 시드 (빈칸=무작위):", font=self.text_font, bg=PASTEL_BG).grid(row=2, column=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        self.seed_var = tk.StringVar(value="")
+        tk.Entry(simulation_frame, textvariable=self.seed_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=2, column=3, sticky=tk.W, padx=(32, 2), pady=(0, 1))
+        # 적응형 모드 (빈칸이면 사용 안 함, 입력 시 시뮬레이션 횟수는 최대 횟수)
+        tk.Label(simulation_frame, text="목표 오차 (%, 선택):", font=self.text_font, bg=PASTEL_BG).grid(row=3, column=0, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+        self.target_error_var = tk.StringVar(value="")
+        tk.Entry(simulation_frame, textvariable=self.target_error_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=3, column=1, sticky=tk.W, padx=entry_padx_1, pady=(0, 1))
+        tk.Label(simulation_frame, text="시간 제한 (초, 선택):", font=self.text_font, bg=PASTEL_BG).grid(row=3, column=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        self.time_budget_var = tk.StringVar(value="")
+        tk.Entry(simulation_frame, textvariable=self.time_budget_var, width=entry_width, font=self.text_font, justify=entry_justify, bg="white", relief="groove").grid(row=3, column=3, sticky=tk.W, padx=(32, 2), pady=(0, 1))
+        # 공통 난수 비교 (두 캐릭터가 같은 난수 사용, 차이를 p-값으로 판정)
+        self.paired_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(simulation_frame, text="공통 난수 비교 (차이 유의성 검정)", variable=self.paired_var, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+        # 진단 정보 (분기 카운터/구간별 시간 계측, 켜면 캐시를 쓰지 않음)
+        self.diagnostics_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(simulation_frame, text="진단 정보 수집", variable=self.diagnostics_var, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=4, column=2, columnspan=2, sticky=tk.W, padx=label_padx_2, pady=(0, 1))
+        # 자동 재계산 (입력이 멈추면 진행 중인 계산을 취소하고 최신 입력으로 다시 비교)
+        self.auto_recompute_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(simulation_frame, text="입력 시 자동 재계산", variable=self.auto_recompute_var, command=self.schedule_live_recompute, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=(2, 6), pady=(0, 1))
+
+        # 버튼 프레임 (tk.Frame)
+        button_frame = tk.Frame(main_frame, bg=PASTEL_BG)
+        button_frame.grid(row=4, column=0, columnspan=4, pady=10)
+        button_width = 18
+        tk.Button(button_frame, text="초기 값으로 돌리기", command=self.set_default_values, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=0, column=0, padx=8, pady=4)
+        tk.Button(button_frame, text="설정 저장", command=self.save_settings, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=0, column=1, padx=8, pady=4)
+        tk.Button(button_frame, text="설정 불러오기", command=self.load_settings, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=0, column=2, padx=8, pady=4)
+        tk.Button(button_frame, text="캐릭터 1→2 복사", command=self.set_char1_to_char2, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=1, column=0, padx=8, pady=4)
+        tk.Button(button_frame, text="캐릭터 2→1 복사", command=self.set_char2_to_char1, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=1, column=1, padx=8, pady=4)
+        tk.Button(button_frame, text="데미지 비교", command=self.compare_damage, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=1, column=2, padx=8, pady=4)
+        tk.Button(button_frame, text="스탯 배분 최적화 (캐릭터 1)", command=self.optimize_stat_budget, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=2, column=0, padx=8, pady=4)
+        tk.Button(button_frame, text="로스터 순위 (파일)", command=self.rank_roster_file, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=2, column=1, padx=8, pady=4)
+        tk.Button(button_frame, text="스탯 효율 (캐릭터 1)", command=self.analyze_stat_values, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=2, column=2, padx=8, pady=4)
+        tk.Button(button_frame, text="결과 표 열기 (CSV)", command=self.open_result_table, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=button_width).grid(row=3, column=0, padx=8, pady=4)
+
+        # 결과 프레임 (tk.LabelFrame, 배경색 지정)
+        self.result_frame = tk.LabelFrame(main_frame, text="결과", bg=PASTEL_BG, fg="black", font=self.text_font)
+        self.result_frame.grid(row=5, column=0, columnspan=4, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 0), padx=(2, 2))
+        self.result_frame.grid_rowconfigure(0, weight=3)
+        self.result_frame.grid_columnconfigure(0, weight=1)
+        # 결과 프레임 제목 라벨(배경 통일)
+        # tk.Label(self.result_frame, text="결과", bg=PASTEL_BG, font=self.text_font).pack(anchor='w', padx=8, pady=(2, 0))
+        self.initial_message = tk.Label(self.result_frame, text="데미지 비교 버튼을 클릭하여 결과를 확인하세요.", bg=PASTEL_BG, font=self.text_font)
+        self.initial_message.pack(expand=True, fill='both', pady=20)
+
+        # 저작권 정보 (맨 밑 오른쪽)
+        copyright_label = tk.Label(main_frame, text="Made by 교수 (Ch. KO17)", font=("Arial", 8), bg=PASTEL_BG, fg="#888888")
+        copyright_label.grid(row=6, column=0, columnspan=4, sticky='se', padx=(0, 5), pady=(2, 2))
+
+        # 캐릭터 1/2 위젯 생성
+        self.create_character_widgets(char1_frame, "char1")
+        self.create_character_widgets(char2_frame, "char2")
+        self.root.update_idletasks()
+        self.root.geometry("")
+        
+    def create_character_widgets(self, parent, char_prefix):
+        # 캐릭터 이름
+        tk.Label(parent, text="캐릭터 이름:", font=self.text_font, bg=PASTEL_BG).grid(row=0, column=0, sticky=tk.W, padx=(2, 24))
+        if char_prefix == "char1":
+            setattr(self, f"{char_prefix}_name_var", tk.StringVar(value="사브리나(전)"))
+        else:
+            setattr(self, f"{char_prefix}_name_var", tk.StringVar(value="사브리나(후)"))
+        tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_name_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove").grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        # 체크박스 영역을 별도 Frame으로 분리 (1행 4열 가로 배치, 촘촘한 간격)
+        check_frame = tk.Frame(parent, bg=PASTEL_BG)
+        check_frame.grid(row=1, column=0, columnspan=2, sticky='ew')
+        for i in range(4):
+            check_frame.grid_columnconfigure(i, weight=1)
+        # 3각
+        setattr(self, f"{char_prefix}_third_awakening_var", tk.BooleanVar(value=False if char_prefix == "char1" else True))
+        tk.Checkbutton(check_frame, text="3각", variable=getattr(self, f"{char_prefix}_third_awakening_var"), bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=0, column=0, sticky='ew', padx=(4, 2))
+        # 7각
+        setattr(self, f"{char_prefix}_seventh_awakening_var", tk.BooleanVar(value=False if char_prefix == "char1" else True))
+        tk.Checkbutton(check_frame, text="7각", variable=getattr(self, f"{char_prefix}_seventh_awakening_var"), bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=0, column=1, sticky='ew', padx=(2, 2))
+        # 증폭
+        setattr(self, f"{char_prefix}_amplification_var", tk.BooleanVar(value=False if char_prefix == "char1" else True))
+        tk.Checkbutton(check_frame, text="증폭", variable=getattr(self, f"{char_prefix}_amplification_var"), bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=0, column=2, sticky='ew', padx=(2, 2))
+        # 쿨감
+        setattr(self, f"{char_prefix}_cooldown_var", tk.BooleanVar(value=False if char_prefix == "char1" else True))
+        tk.Checkbutton(check_frame, text="쿨감", variable=getattr(self, f"{char_prefix}_cooldown_var"), bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, relief="flat", borderwidth=0, font=self.text_font).grid(row=0, column=3, sticky='ew', padx=(2, 4))
+        # 공격 관련
+        row = 3
+        tk.Label(parent, text="공격 속도:", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        if char_prefix == "char1":
+            attack_speed_default = Character.DEFAULT_ATTACK_SPEED
+        else:
+            attack_speed_default = 130  # 캐릭터 2의 기본 공격속도
+        setattr(self, f"{char_prefix}_attack_speed_var", tk.StringVar(value=str(attack_speed_default)))
+        tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_attack_speed_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove").grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        row += 1
+        tk.Label(parent, text="공격력 (M):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        setattr(self, f"{char_prefix}_attack_power_var", tk.StringVar(value=str(Character.DEFAULT_ATTACK_POWER)))
+        tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_attack_power_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove").grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        # 이하 확률/배율 관련 Entry도 모두 width=12로 통일
+        row += 1
+        tk.Label(parent, text="치명 확률 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        setattr(self, f"{char_prefix}_critical_var", tk.StringVar(value=str(round(Character.DEFAULT_P_CRITICAL*100, 2))))
+        critical_entry = tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_critical_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove")
+        critical_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        critical_entry.bind('<FocusOut>', lambda e, prefix=char_prefix: self.limit_probability(prefix, 'critical'))
+        row += 1
+        tk.Label(parent, text="강타 확률 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        setattr(self, f"{char_prefix}_strong_hit_var", tk.StringVar(value=str(round(Character.DEFAULT_P_STRONG_HIT*100, 2))))
+        strong_hit_entry = tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_strong_hit_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove")
+        strong_hit_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        strong_hit_entry.bind('<FocusOut>', lambda e, prefix=char_prefix: self.limit_probability(prefix, 'strong_hit'))
+        row += 1
+        tk.Label(parent, text="더블샷 확률 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        setattr(self, f"{char_prefix}_double_shot_var", tk.StringVar(value=str(round(Character.DEFAULT_P_DOUBLE_SHOT*100, 2))))
+        double_shot_entry = tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_double_shot_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove")
+        double_shot_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        double_shot_entry.bind('<FocusOut>', lambda e, prefix=char_prefix: self.limit_probability(prefix, 'double_shot'))
+        row += 1
+        tk.Label(parent, text="트리플샷 확률 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        if char_prefix == "char1":
+            triple_shot_default = 11.23
+        else:
+            triple_shot_default = 21.23
+        setattr(self, f"{char_prefix}_triple_shot_var", tk.StringVar(value=str(triple_shot_default)))
+        triple_shot_entry = tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_triple_shot_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove")
+        triple_shot_entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        triple_shot_entry.bind('<FocusOut>', lambda e, prefix=char_prefix: self.limit_probability(prefix, 'triple_shot'))
+        row += 1
+        tk.Label(parent, text="치명 피해 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24))
+        setattr(self, f"{char_prefix}_critical_mult_var", tk.StringVar(value=str(round(Character.DEFAULT_CRITICAL_MULTIPLIER*100, 2))))
+        tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_critical_mult_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove").grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2))
+        row += 1
+        tk.Label(parent, text="강타 피해 (%):", font=self.text_font, bg=PASTEL_BG).grid(row=row, column=0, sticky=tk.W, padx=(2, 24), pady=(0, 1))
+        setattr(self, f"{char_prefix}_strong_hit_mult_var", tk.StringVar(value=str(round(Character.DEFAULT_STRONG_HIT_MULTIPLIER*100, 2))))
+        tk.Entry(parent, textvariable=getattr(self, f"{char_prefix}_strong_hit_mult_var"), width=12, font=self.text_font, justify='right', bg="white", relief="groove").grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(0, 2), pady=(0, 1))
+
+    def save_initial_values(self):
+        self.initial_values = {
+            'char1_name': self.char1_name_var.get(),
+            'char1_seventh_awakening': self.char1_seventh_awakening_var.get(),
+            'char1_cooldown': self.char1_cooldown_var.get(),
+            'char1_amplification': self.char1_amplification_var.get(),
+            'char1_third_awakening': self.char1_third_awakening_var.get(),
+            'char1_attack_speed': self.char1_attack_speed_var.get(),
+            'char1_attack_power': self.char1_attack_power_var.get(),
+            'char1_critical': self.char1_critical_var.get(),
+            'char1_strong_hit': self.char1_strong_hit_var.get(),
+            'char1_double_shot': self.char1_double_shot_var.get(),
+            'char1_triple_shot': self.char1_triple_shot_var.get(),
+            'char1_critical_mult': self.char1_critical_mult_var.get(),
+            'char1_strong_hit_mult': self.char1_strong_hit_mult_var.get(),
+            'char2_name': self.char2_name_var.get(),
+            'char2_seventh_awakening': self.char2_seventh_awakening_var.get(),
+            'char2_cooldown': self.char2_cooldown_var.get(),
+            'char2_amplification': self.char2_amplification_var.get(),
+            'char2_third_awakening': self.char2_third_awakening_var.get(),
+            'char2_attack_speed': self.char2_attack_speed_var.get(),
+            'char2_attack_power': self.char2_attack_power_var.get(),
+            'char2_critical': self.char2_critical_var.get(),
+            'char2_strong_hit': self.char2_strong_hit_var.get(),
+            'char2_double_shot': self.char2_double_shot_var.get(),
+            'char2_triple_shot': self.char2_triple_shot_var.get(),
+            'char2_critical_mult': self.char2_critical_mult_var.get(),
+            'char2_strong_hit_mult': self.char2_strong_hit_mult_var.get(),
+            'damage_1': self.damage_1_var.get(),
+            'damage_2': self.damage_2_var.get(),
+            'damage_3': self.damage_3_var.get(),
+            'hit_1': self.hit_1_var.get(),
+            'hit_2': self.hit_2_var.get(),
+            'hit_3': self.hit_3_var.get(),
+            'critical_cd': self.critical_cd_var.get(),
+            'skill_cd': self.skill_cd_var.get(),
+            'minutes': self.minutes_var.get() or "1",
+            'simulations': self.simulations_var.get(),
+            'engine': self.engine_var.get(),
+            'show_exact': self.show_exact_var.get(),
+            'workers': self.workers_var.get(),
+            'seed': self.seed_var.get(),
+            'target_error': self.target_error_var.get(),
+            'time_budget': self.time_budget_var.get(),
+            'paired': self.paired_var.get(),
+            'diagnostics': self.diagnostics_var.get()
+        }
+
+    def set_default_values(self):
+        """프로그램 시작 시점의 값으로 복원"""
+        vals = getattr(self, 'initial_values', None)
+        if vals is None:
+            return
+        self.char1_name_var.set(vals['char1_name'])
+        self.char1_seventh_awakening_var.set(vals['char1_seventh_awakening'])
+        self.char1_cooldown_var.set(vals['char1_cooldown'])
+        self.char1_amplification_var.set(vals['char1_amplification'])
+        self.char1_third_awakening_var.set(vals['char1_third_awakening'])
+        self.char1_attack_speed_var.set(vals['char1_attack_speed'])
+        self.char1_attack_power_var.set(vals['char1_attack_power'])
+        self.char1_critical_var.set(vals['char1_critical'])
+        self.char1_strong_hit_var.set(vals['char1_strong_hit'])
+        self.char1_double_shot_var.set(vals['char1_double_shot'])
+        self.char1_triple_shot_var.set(vals['char1_triple_shot'])
+        self.char1_critical_mult_var.set(vals['char1_critical_mult'])
+        self.char1_strong_hit_mult_var.set(vals['char1_strong_hit_mult'])
+        self.char2_name_var.set(vals['char2_name'])
+        self.char2_seventh_awakening_var.set(vals['char2_seventh_awakening'])
+        self.char2_cooldown_var.set(vals['char2_cooldown'])
+        self.char2_amplification_var.set(vals['char2_amplification'])
+        self.char2_third_awakening_var.set(vals['char2_third_awakening'])
+        self.char2_attack_speed_var.set(vals['char2_attack_speed'])
+        self.char2_attack_power_var.set(vals['char2_attack_power'])
+        self.char2_critical_var.set(vals['char2_critical'])
+        self.char2_strong_hit_var.set(vals['char2_strong_hit'])
+        self.char2_double_shot_var.set(vals['char2_double_shot'])
+        self.char2_triple_shot_var.set(vals['char2_triple_shot'])
+        self.char2_critical_mult_var.set(vals['char2_critical_mult'])
+        self.char2_strong_hit_mult_var.set(vals['char2_strong_hit_mult'])
+        self.damage_1_var.set(vals['damage_1'])
+        self.damage_2_var.set(vals['damage_2'])
+        self.damage_3_var.set(vals['damage_3'])
+        self.hit_1_var.set(vals['hit_1'])
+        self.hit_2_var.set(vals['hit_2'])
+        self.hit_3_var.set(vals['hit_3'])
+        self.critical_cd_var.set(vals['critical_cd'])
+        self.skill_cd_var.set(vals['skill_cd'])
+        self.minutes_var.set(vals['minutes'])
+        self.simulations_var.set(vals['simulations'])
+        self.engine_var.set(vals['engine'])
+        self.show_exact_var.set(vals['show_exact'])
+        self.workers_var.set(vals['workers'])
+        self.seed_var.set(vals['seed'])
+        self.target_error_var.set(vals['target_error'])
+        self.time_budget_var.set(vals['time_budget'])
+        self.paired_var.set(vals['paired'])
+        self.diagnostics_var.set(vals['diagnostics'])
+
+    def copy_character_stats(self, from_prefix, to_prefix):
+        """캐릭터 간 스탯 복사 (이름 제외)"""
+        # 복사할 속성 목록
+        attributes = [
+            'seventh_awakening', 'cooldown', 'amplification', 'third_awakening', 'attack_speed', 'attack_power',
+            'critical', 'strong_hit', 'double_shot', 'triple_shot',
+            'critical_mult', 'strong_hit_mult'
+        ]
+        
+        for attr in attributes:
+            from_var = getattr(self, f"{from_prefix}_{attr}_var")
+            to_var = getattr(self, f"{to_prefix}_{attr}_var")
+            to_var.set(from_var.get())
+
+    def set_char2_to_char1(self):
+        """캐릭터 2의 정보를 캐릭터 1로 복사 (이름 제외)"""
+        self.copy_character_stats("char2", "char1")
+        
+    def set_char1_to_char2(self):
+        """캐릭터 1의 정보를 캐릭터 2로 복사 (이름 제외)"""
+        self.copy_character_stats("char1", "char2")
+    
+    def create_character_from_gui(self, char_prefix, quiet=False):
+        """GUI 입력값으로부터 Character 객체 생성 (quiet면 잘못된 입력에 경고창 없이 None)"""
+        try:
+            # 공격 관련 - 입력 검증
+            attack_speed_value = getattr(self, f"{char_prefix}_attack_speed_var").get()
+            if not self.validate_integer_input(attack_speed_value, 1, "공격 속도", quiet=quiet):
+                return None
+            attack_power_value = getattr(self, f"{char_prefix}_attack_power_var").get()
+            if not self.validate_numeric_input(attack_power_value, 0, field_name="공격력", quiet=quiet):
+                return None
+            
+            # 배율 관련 - 입력 검증
+            critical_mult_value = getattr(self, f"{char_prefix}_critical_mult_var").get()
+            if not self.validate_numeric_input(critical_mult_value, 0, field_name="치명 피해", quiet=quiet):
+                return None
+            strong_hit_mult_value = getattr(self, f"{char_prefix}_strong_hit_mult_var").get()
+            if not self.validate_numeric_input(strong_hit_mult_value, 0, field_name="강타 피해", quiet=quiet):
+                return None
+            
+            # 설정 파일과 같은 필드 이름으로 모아 공통 생성 함수 사용 (배치 모드와 동일한 변환)
+            settings = {"name": getattr(self, f"{char_prefix}_name_var").get()}
+            for key in CHARACTER_SETTING_KEYS:
+                settings[key] = getattr(self, f"{char_prefix}_{key}_var").get()
+            common = {key: getattr(self, f"{key}_var").get() for key in COMMON_SETTING_KEYS}
+            return character_from_settings(settings, common)
+            
+        except (ValueError, AttributeError) as e:
+            if not quiet:
+                messagebox.showerror("입력 오류", f"캐릭터 생성 중 오류가 발생했습니다: {str(e)}")
+            return None
+    
+    def validate_simulation_inputs(self, quiet=False):
+        """시뮬레이션 설정과 공통 설정 입력값 검증 (quiet면 경고창 없이 결과만 반환)"""
+        if not self.validate_numeric_input(self.minutes_var.get(), 0.1, field_name="시뮬레이션 시간", quiet=quiet):
+            return False
+        if not self.validate_integer_input(self.simulations_var.get(), 1, "시뮬레이션 횟수", quiet=quiet):
+            return False
+        if not self.validate_integer_input(self.workers_var.get(), 1, "워커 수", quiet=quiet):
+            return False
+        if self.seed_var.get().strip() and not self.validate_integer_input(self.seed_var.get(), 0, "난수 시드", quiet=quiet):
+            return False
+        if self.target_error_var.get().strip() and not self.validate_numeric_input(self.target_error_var.get(), 0.001, field_name="목표 오차", quiet=quiet):
+            return False
+        if self.time_budget_var.get().strip() and not self.validate_numeric_input(self.time_budget_var.get(), 0.1, field_name="시간 제한", quiet=quiet):
+            return False
+                
+        # 공통 설정 검증
+        if not self.validate_numeric_input(self.damage_1_var.get(), 0, field_name="일반 공격 배율", quiet=quiet):
+            return False
+        if not self.validate_numeric_input(self.damage_2_var.get(), 0, field_name="치명타 공격 배율", quiet=quiet):
+            return False
+        if not self.validate_numeric_input(self.damage_3_var.get(), 0, field_name="전용 스킬 배율", quiet=quiet):
+            return False
+        if not self.validate_integer_input(self.hit_1_var.get(), 1, "일반 공격 타수", quiet=quiet):
+            return False
+        if not self.validate_integer_input(self.hit_2_var.get(), 1, "치명타 공격 타수", quiet=quiet):
+            return False
+        if not self.validate_integer_input(self.hit_3_var.get(), 1, "전용 스킬 타수", quiet=quiet):
+            return False
+        if not self.validate_numeric_input(self.critical_cd_var.get(), 0, field_name="치명타 쿨타임", quiet=quiet):
+            return False
+        if not self.validate_numeric_input(self.skill_cd_var.get(), 0, field_name="스킬 쿨타임", quiet=quiet):
+            return False
+        return True
+    
+    def clear_result_frame(self, keep_view=False):
+        """결과창의 일회성 출력(스탯 효율/로스터 표, 취소 안내 등)은 지우고 재사용하는 패널은 숨김 (keep_view면 비교 결과는 유지)"""
+        view_frame = self.comparison_view.frame if self.comparison_view is not None else None
+        for widget in self.result_frame.winfo_children():
+            if widget is view_frame:
+                if not keep_view:
+                    widget.pack_forget()
+            elif widget is self.initial_message or widget is self.progress_frame:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
+    def result_container(self):
+        """일회성 결과를 그릴 새 프레임 (이전 일회성 결과는 지우고 재사용 패널은 숨김)"""
+        self.clear_result_frame()
+        container = tk.Frame(self.result_frame, bg=PASTEL_BG)
+        container.pack(fill='both', expand=True)
+        return container
+    
+    def show_comparison(self, *args):
+        """비교 결과 화면 갱신 (처음 한 번만 만들고 이후에는 값만 바꿈, 인자는 ComparisonView.update와 같음)"""
+        self.clear_result_frame(keep_view=True)
+        if self.comparison_view is None:
+            self.comparison_view = ComparisonView(self.result_frame)
+        if not self.comparison_view.frame.winfo_manager():
+            self.comparison_view.frame.pack(fill='both', expand=True)
+        self.comparison_view.update(*args)
+    
+    def create_progress_panel(self):
+        """진행률 패널 생성 (처음 한 번만, 이후 계산에서는 값만 초기화해 재사용)"""
+        self.progress_frame = tk.Frame(self.result_frame, bg=PASTEL_BG)
+        
+        progress_label = tk.Label(self.progress_frame, text="시뮬레이션 진행 중...", font=self.text_font, bg=PASTEL_BG)
+        progress_label.pack(pady=(0, 5))
+        
+        self.progress_bar = ttk.Progressbar(self.progress_frame, length=400, mode='determinate')
+        self.progress_bar.pack(pady=(0, 5))
+        
+        self.progress_text = tk.Label(self.progress_frame, text="0%", font=self.text_font, bg=PASTEL_BG)
+        self.progress_text.pack()
+        
+        # 현재 추정치 패널 (샤드가 끝날 때마다 워커가 보내는 중간 합계로 갱신)
+        self.estimate_label = tk.Label(self.progress_frame, text="", font=self.text_font, bg=PASTEL_BG, justify='left')
+        self.estimate_label.pack(pady=(5, 0))
+        
+        button_row = tk.Frame(self.progress_frame, bg=PASTEL_BG)
+        button_row.pack(pady=(5, 0))
+        self.finish_button = tk.Button(button_row, text="현재 결과로 완료", command=self.finish_simulation, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=14)
+        self.finish_button.pack(side='left', padx=4)
+        self.cancel_button = tk.Button(button_row, text="취소", command=self.cancel_simulation, bg=PASTEL_BG, activebackground=PASTEL_BG, highlightbackground=PASTEL_BG, font=self.text_font, width=10)
+        self.cancel_button.pack(side='left', padx=4)
+    
+    def show_progress(self):
+        """프로그레스 바 표시 (일회성 결과는 지우고, 이전 비교 결과는 새 결과가 올 때까지 아래에 그대로 둠)"""
+        self.clear_result_frame(keep_view=True)
+        if self.progress_frame is None:
+            self.create_progress_panel()
+        self.progress_bar.configure(value=0)
+        self.progress_text.configure(text="0%")
+        self.estimate_label.configure(text="")
+        self.finish_button.configure(state='normal')
+        self.cancel_button.configure(state='normal')
+        view_frame = self.comparison_view.frame if self.comparison_view is not None else None
+        if view_frame is not None and view_frame.winfo_manager():
+            self.progress_frame.pack(fill='x', padx=10, pady=10, before=view_frame)
+        else:
+            self.progress_frame.pack(fill='x', padx=10, pady=10)
+    
+    def finish_simulation(self):
+        """지금까지의 중간 결과로 시뮬레이션을 끝내도록 요청 (결과가 충분히 명확할 때 조기 종료)"""
+        if self.current_job_id is None:
+            return
+        self.worker.finish(self.current_job_id)
+        self.progress_text.configure(text="마무리 중...")
+        self.finish_button.configure(state='disabled')
+        self.cancel_button.configure(state='disabled')
+    
+    def update_estimate(self, summary):
+        """현재 추정치 패널 갱신 (캐릭터별 DPM ± 오차, 두 캐릭터면 차이)"""
+        lines = []
+        for char, estimate in zip(self.current_characters, summary["characters"]):
+            if estimate is None:
+                lines.append(f"{char.name}: 계산 중...")
+            else:
+                lines.append(f"{char.name}: {estimate['dpm']:,.2f} ± {estimate['dpm_half_width']:,.2f} DPM (M), APM {estimate['apm']:.1f} ({estimate['simulations']:,}회)")
+        if summary["difference"] is not None:
+            diff, half_width = summary["difference"]
+            lines.append(f"차이 (2 - 1): {diff:+,.2f} ± {half_width:,.2f} DPM (M)")
+        self.estimate_label.configure(text="\n".join(lines))
+    
+    def cancel_simulation(self):
+        """진행 중인 시뮬레이션 취소 요청 (워커와 프로세스 풀의 커널이 바로 중단)"""
+        if self.current_job_id is None:
+            return
+        self.worker.cancel(self.current_job_id)
+        self.progress_text.configure(text="취소 중...")
+        self.finish_button.configure(state='disabled')
+        self.cancel_button.configure(state='disabled')
+    
+    def submit_simulation(self, characters, **options):
+        """시뮬레이션 설정을 읽어 워커 프로세스에 요청 (GUI 프로세스는 큐만 확인)"""
+        minutes = float(self.minutes_var.get())
+        simulations = int(self.simulations_var.get())
+        engine = self.engine_var.get()
+        workers = int(float(self.workers_var.get()))
+        # 시드 미지정 시 엔진이 무작위 마스터 시드를 정함 (같은 빌드의 이전 무작위 시드 결과는 캐시에서 재사용)
+        seed_text = self.seed_var.get().strip()
+        seed = int(float(seed_text)) if seed_text else None
+        # 목표 오차/시간 제한이 입력되면 적응형 모드 (시뮬레이션 횟수는 최대 횟수로 사용)
+        target_text = self.target_error_var.get().strip()
+        target_relative_error = float(target_text) / 100 if target_text else None
+        budget_text = self.time_budget_var.get().strip()
+        time_budget = float(budget_text) if budget_text else None
+        
+        polling = self.current_job_id is not None
+        if polling:
+            # 새 요청이 진행 중인 작업을 대체 (이전 작업은 실행 중인 샤드까지 바로 중단되고 결과는 무시됨)
+            self.worker.cancel(self.current_job_id)
+        self.current_characters = characters
+        self.current_job_id = self.worker.submit(
+            characters, minutes, simulations, engine=engine, workers=workers, seed=seed,
+            target_relative_error=target_relative_error, time_budget=time_budget, **options
+        )
+        if not polling:
+            self.root.after(WORKER_POLL_INTERVAL_MS, self.poll_worker)
+    
+    def compare_damage(self, quiet=False):
+        """데미지 비교 실행 - 새로운 깔끔한 출력 방식 사용 (quiet면 잘못된 입력에 경고창 없이 무시)"""
+        # 입력값 검증
+        if not self.validate_simulation_inputs(quiet):
+            return
+        
+        # 캐릭터 생성
+        char1 = self.create_character_from_gui("char1", quiet)
+        char2 = self.create_character_from_gui("char2", quiet)
+        
+        if char1 is None or char2 is None:
+            return
+        
+        self.show_progress()
+        # 두 캐릭터를 워커 프로세스에서 동시에 계산
+        self.submit_simulation([char1, char2], show_exact=self.show_exact_var.get(), paired=self.paired_var.get(),
+                               diagnostics=self.diagnostics_var.get())
+        # 첫 중간 합계가 오기 전까지 근사 표의 즉시 예상치 표시
+        self.estimate_label.configure(text=self.surrogate_preview([char1, char2]))
+    
+    def watch_inputs(self):
+        """캐릭터/공통/시뮬레이션 입력이 바뀌면 자동 재계산을 예약하도록 변수 감시 등록 (이름은 결과에 영향이 없어 제외)"""
+        names = [f"{prefix}_{key}_var" for prefix in ("char1", "char2") for key in CHARACTER_SETTING_KEYS]
+        names += [f"{key}_var" for key in COMMON_SETTING_KEYS]
+        names += ["minutes_var", "simulations_var", "engine_var", "workers_var", "seed_var", "target_error_var", "time_budget_var",
+                  "show_exact_var", "paired_var", "diagnostics_var"]
+        for name in names:
+            getattr(self, name).trace_add("write", lambda *_: self.schedule_live_recompute())
+    
+    def schedule_live_recompute(self):
+        """자동 재계산 예약 (마지막 입력 후 LIVE_RECOMPUTE_DELAY_MS 동안 입력이 없을 때 한 번만 계산)"""
+        if self.live_recompute_id is not None:
+            self.root.after_cancel(self.live_recompute_id)
+            self.live_recompute_id = None
+        if self.auto_recompute_var.get():
+            self.live_recompute_id = self.root.after(LIVE_RECOMPUTE_DELAY_MS, self.live_recompute)
+    
+    def live_recompute(self):
+        """자동 재계산 실행 (입력 중간의 잘못된 값은 경고 없이 건너뛰고 이전 결과를 유지)"""
+        self.live_recompute_id = None
+        if self.auto_recompute_var.get():
+            self.compare_damage(quiet=True)
+    
+    def surrogate_table(self):
+        """현재 공통 설정의 근사 DPM 표 (아직 없으면 별도 프로세스에서 만들기 시작하고 None)"""
+        key = (float(self.minutes_var.get()), float(self.critical_cd_var.get()), float(self.skill_cd_var.get()))
+        table = self.surrogate_tables.get(key)
+        if table is None:
+            table = load_surrogate_table(SURROGATE_FILE, *key)
+            if table is not None:
+                self.surrogate_tables[key] = table
+            elif self.surrogate_builder is None or not self.surrogate_builder.is_alive():
+                self.surrogate_builder = multiprocessing.Process(target=get_surrogate_table, args=(SURROGATE_FILE, *key), daemon=True)
+                self.surrogate_builder.start()
+        return table
+    
+    def surrogate_preview(self, characters):
+        """캐릭터별 즉시 예상 DPM 문구 (근사 표 범위 밖이거나 표가 아직 없으면 exact 엔진으로 바로 계산)"""
+        minutes = float(self.minutes_var.get())
+        table = self.surrogate_table()
+        lines = []
+        for char in characters:
+            estimate = table.estimate(char, minutes) if table is not None else None
+            if estimate is None:
+                dpm, apm = expected_attacks_with_critical_and_skill(minutes=minutes, **char.simulation_params())
+                lines.append(f"{char.name}: 예상 {dpm:,.2f} DPM (M), APM {apm:.1f} (기댓값)")
+            else:
+                dpm, apm, dpm_error, _ = estimate
+                lines.append(f"{char.name}: 예상 {dpm:,.2f} ± {dpm_error:,.2f} DPM (M), APM {apm:.1f} (근사 표)")
+        return "\n".join(lines)
+    
+    def analyze_stat_values(self):
+        """캐릭터 1의 스탯별 1포인트당 DPM 증가량 계산 (공통 난수 한 번 실행)"""
+        if not self.validate_simulation_inputs():
+            return
+        char1 = self.create_character_from_gui("char1")
+        if char1 is None:
+            return
+        self.show_progress()
+        self.submit_simulation([char1], task="stat_values")
+    
+    def optimize_stat_budget(self):
+        """캐릭터 1에 정해진 포인트를 나눠 투자할 때 기대 DPM이 가장 높은 배분 탐색"""
+        if not self.validate_simulation_inputs():
+            return
+        char1 = self.create_character_from_gui("char1")
+        if char1 is None:
+            return
+        budget = simpledialog.askinteger("스탯 배분 최적화", "투자할 포인트 수 (공격 속도 1, 확률/피해 1%p가 1포인트)", parent=self.root,
+                                         initialvalue=STAT_BUDGET_DEFAULT, minvalue=1)
+        if budget is None:
+            return
+        self.show_progress()
+        self.submit_simulation([char1], task="stat_budget", budget=budget)
+    
+    def rank_roster_file(self):
+        """빌드 목록 파일(JSONL/CSV, 배치 모드와 같은 형식)의 모든 빌드를 공통 난수로 순위 계산"""
+        if not self.validate_simulation_inputs():
+            return
+        path = filedialog.askopenfilename(title="빌드 목록 선택", filetypes=[("빌드 목록", "*.jsonl *.csv"), ("모든 파일", "*.*")])
+        if not path:
+            return
+        # 빌드에 없는 공통 항목은 화면의 공통 설정 사용
+        common = {key: getattr(self, f"{key}_var").get() for key in COMMON_SETTING_KEYS}
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                builds = list(read_batch_builds(f, "csv" if path.lower().endswith(".csv") else "jsonl"))
+            characters = [character_from_settings(build, dict(common, **build)) for build in builds]
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            messagebox.showerror("입력 오류", f"빌드 목록을 읽는 중 오류가 발생했습니다: {str(e)}")
+            return
+        if not characters:
+            messagebox.showerror("입력 오류", "빌드 목록이 비어 있습니다.")
+            return
+        self.show_progress()
+        self.submit_simulation(characters, task="roster")
+    
+    def open_result_table(self):
+        """스윕/배치/로스터 결과 CSV를 가상 표로 열기 (행이 많아도 보이는 행만 그림)"""
+        path = filedialog.askopenfilename(title="결과 CSV 선택", filetypes=[("CSV", "*.csv"), ("모든 파일", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                columns = read_result_columns(f)
+        except (OSError, ValueError, csv.Error) as e:
+            messagebox.showerror("입력 오류", f"결과 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
+            return
+        if not columns:
+            messagebox.showerror("입력 오류", "결과 파일이 비어 있습니다.")
+            return
+        size = len(next(iter(columns.values())))
+        create_columnar_display(self.result_container(), f"📄 {os.path.basename(path)} ({size:,}행)", columns)
+    
+    def poll_worker(self):
+        """워커 응답 큐를 비우고 최신 작업의 진행률/결과만 화면에 반영 (타이머로 반복 호출)"""
+        progress = None
+        partial = None
+        for kind, job_id, payload in self.worker.poll():
+            if job_id != self.current_job_id:
+                continue
+            if kind == "progress":
+                progress = payload
+            elif kind == "partial":
+                partial = payload
+            elif kind == "result":
+                self.current_job_id = None
+                self.progress_frame.pack_forget()
+                if payload.get("task") == "stat_values":
+                    create_stat_value_display(self.result_container(), payload["characters"][0], payload["stat_values"], payload["stats"][0])
+                    return
+                if payload.get("task") == "stat_budget":
+                    create_stat_budget_display(self.result_container(), payload["characters"][0], payload["allocations"], payload["base_dpm"], payload["budget"])
+                    return
+                if payload.get("task") == "roster":
+                    create_roster_display(self.result_container(), payload["ranking"])
+                    return
+                char1, char2 = payload["characters"]
+                exact1, exact2 = payload["exact"] or (None, None)
+                stats1, stats2 = payload["stats"]
+                self.show_comparison(char1, char2, payload["dpm"][0], payload["apm"][0], payload["dpm"][1], payload["apm"][1], exact1, exact2, stats1, stats2, payload["comparison"], payload.get("partial", False))
+                return
+            elif kind == "cancelled":
+                self.current_job_id = None
+                self.progress_frame.pack_forget()
+                tk.Label(self.result_container(), text="시뮬레이션이 취소되었습니다.", bg=PASTEL_BG, font=self.text_font).pack(expand=True, fill='both', pady=20)
+                return
+            elif kind == "error":
+                self.current_job_id = None
+                self.progress_frame.pack_forget()
+                messagebox.showerror("계산 오류", f"계산 중 오류가 발생했습니다: {payload}")
+                return
+        
+        # 여러 진행률 메시지가 쌓였으면 마지막 값만 반영
+        if progress is not None:
+            self.progress_bar.configure(value=progress)
+            self.progress_text.configure(text=f"{progress:.1f}%")
+        if partial is not None:
+            self.update_estimate(partial)
+        self.root.after(WORKER_POLL_INTERVAL_MS, self.poll_worker)
+    
+    def on_close(self):
+        """창 닫기 시 워커 프로세스 정리"""
+        self.worker.stop()
+        if self.surrogate_builder is not None and self.surrogate_builder.is_alive():
+            self.surrogate_builder.terminate()
+        self.root.destroy()
+
+def table_column_widths(headers, table_name="", is_amplification=False):
+    """표 열 너비 (총 너비를 열 수로 나누고, 증폭이 켜진 스킬 배율 표는 "기본 배율" 열을 넓게)"""
+    total_width = 434  # 총 테이블 너비 (픽셀)
+    base_width = total_width // len(headers)  # 기본 컬럼 너비
+    widths = []
+    for i in range(len(headers)):
+        if table_name == "스킬 배율" and is_amplification:
+            # 두 번째 열(index 1)은 40% 더 넓게, 나머지 컬럼은 15% 더 좁게
+            widths.append(int(base_width * 1.4) if i == 1 else int(base_width * 0.85))
+        else:
+            widths.append(base_width)
+    return widths
+
+
+def row_tags(row):
+    """행 색상 태그 (비교 표시 ▲ 파랑, ▼ 빨강, 의미 없음/제외 회색)"""
+    for value in row:
+        if isinstance(value, str):
+            if '▲' in value:
+                return ('white_bg', 'blue_text')
+            if '▼' in value:
+                return ('white_bg', 'red_text')
+            if '(의미 없음)' in value or '(제외)' in value:
+                return ('white_bg', 'gray_text')
+    return ('white_bg',)
+
+
+def configure_row_tags(tree):
+    """행 색상 태그 스타일 등록 (표마다 한 번)"""
+    tree.tag_configure('white_bg', background='white')
+    tree.tag_configure('red_text', foreground='red')
+    tree.tag_configure('blue_text', foreground='blue')
+    tree.tag_configure('gray_text', foreground='gray')
+
+
+class ResultTable:
+    """제목 + Treeview 표 (한 번 만들고 update로 열/행 값과 태그만 바꿈, 행 항목은 재사용)"""
+
+    def __init__(self, parent, title="", height=6, on_mousewheel=None):
+        self.frame = ttk.Frame(parent, style="Custom.TFrame")
+        self.title = title
+        self.title_label = ttk.Label(self.frame, text=title, font=("Arial", 10, "bold"), style="Custom.TLabel")
+        if title:
+            self.title_label.pack(pady=(5, 2))
+        self.tree = ttk.Treeview(self.frame, columns=(), show='headings', height=height, style="Custom.Treeview")
+        configure_row_tags(self.tree)
+        self.tree.pack(side='left', fill='both', expand=True)
+        if on_mousewheel is not None:
+            self.title_label.bind("<MouseWheel>", on_mousewheel)
+            self.tree.bind("<MouseWheel>", on_mousewheel)
+        self.headers = []
+        self.widths = []
+        self.height = height
+        self.items = []
+    
+    def update(self, headers, rows, title=None, height=None, is_amplification=False):
+        """열 제목과 행 갱신 (바뀐 부분만 Tk에 반영)"""
+        if title is not None and title != self.title:
+            self.title = title
+            self.title_label.configure(text=title)
+        if height is not None and height != self.height:
+            self.height = height
+            self.tree.configure(height=height)
+        headers = list(headers)
+        if headers != self.headers:
+            self.tree.configure(columns=headers)
+            for header in headers:
+                self.tree.heading(header, text=header)
+            self.headers = headers
+            self.widths = []
+        widths = table_column_widths(headers, self.title, is_amplification)
+        if widths != self.widths:
+            for header, width in zip(headers, widths):
+                self.tree.column(header, width=width, anchor='center')
+            self.widths = widths
+        for index, row in enumerate(rows):
+            if index < len(self.items):
+                self.tree.item(self.items[index], values=row, tags=row_tags(row))
+            else:
+                self.items.append(self.tree.insert('', 'end', values=row, tags=row_tags(row)))
+        if len(self.items) > len(rows):
+            self.tree.delete(*self.items[len(rows):])
+            del self.items[len(rows):]
+
+
+def format_cell(value):
+    """가상 표 칸 표시 (큰 수는 천 단위 구분 소수 둘째 자리, 작은 수는 유효숫자 4자리, NaN은 빈칸)"""
+    if isinstance(value, float):
+        if value != value:
+            return ""
+        return f"{value:,.2f}" if abs(value) >= 100 else f"{value:.4g}"
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"{value:,}"
+    return str(value)
+
+
+class ColumnarRows:
+    """열 단위 결과(열 이름 → array/list)를 정렬·필터한 행 순서 (데이터는 복사하지 않고 행 번호 순열만 유지)
+
+    필터는 쉼표로 구분한 조건의 AND이다. "dpm>100000", "attack_speed=120"처럼 열 이름(또는 표 제목)과 비교 연산자를 쓰면
+    그 열의 값을 비교하고, 그 밖의 글자는 문자열 열(이름 등)에 대소문자 구분 없이 포함되는지 찾는다.
+    NumPy가 있으면 숫자 열은 np.frombuffer로 같은 메모리를 보며 정렬/필터하고, 없으면 행 번호만 파이썬으로 정렬한다.
+    """
+
+    def __init__(self, columns, formats=None, headings=None):
+        self.columns = columns
+        self.names = list(columns)
+        self.size = len(next(iter(columns.values()))) if columns else 0
+        self.formats = formats or {}
+        self.headings = headings or {}
+        self.conditions = []
+        self.terms = []
+        self.sort_column = None
+        self.descending = False
+        self.order = range(self.size)  # 화면 순서 → 원래 행 번호
+    
+    def __len__(self):
+        return len(self.order)
+    
+    def heading(self, name):
+        return self.headings.get(name, name)
+    
+    def column_name(self, text):
+        """필터에 적은 열 이름(열 키 또는 표 제목)에 해당하는 열 키 (없으면 None)"""
+        text = text.strip()
+        if text in self.columns:
+            return text
+        for name in self.names:
+            if self.heading(name) == text:
+                return name
+        return None
+    
+    def is_numeric(self, name):
+        return isinstance(self.columns[name], array)
+    
+    def numpy_column(self, name):
+        """숫자 열의 NumPy 보기 (복사 없음, NumPy가 없거나 문자열 열이면 None)"""
+        column = self.columns[name]
+        if np is None or not isinstance(column, array):
+            return None
+        return np.frombuffer(column, dtype=column.typecode)
+    
+    def set_filter(self, text):
+        """필터 문자열 적용 (잘못된 조건이면 ValueError)"""
+        conditions = []
+        terms = []
+        for part in text.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            match = FILTER_CONDITION.match(part)
+            name = match and self.column_name(match.group(1))
+            if name:
+                operator_text, value = match.group(2), match.group(3).strip()
+                if self.is_numeric(name):
+                    try:
+                        value = float(value.replace(",", ""))
+                    except ValueError:
+                        raise ValueError(f"{self.heading(name)} 열은 숫자와 비교해야 합니다: {part}")
+                conditions.append((name, FILTER_OPERATORS[operator_text], value))
+            else:
+                terms.append(part.lower())
+        self.conditions = conditions
+        self.terms = terms
+        self.refresh()
+    
+    def sort_by(self, name):
+        """열 기준 정렬 (같은 열을 다시 고르면 방향 전환, 숫자 열은 큰 값부터 시작)"""
+        if self.sort_column == name:
+            self.descending = not self.descending
+        else:
+            self.sort_column = name
+            self.descending = self.is_numeric(name)
+        self.refresh()
+    
+    def refresh(self):
+        """필터와 정렬을 다시 적용해 행 순서 갱신"""
+        text_columns = [self.columns[name] for name in self.names if not self.is_numeric(name)]
+        if np is not None:
+            mask = None
+            for name, compare, value in self.conditions:
+                column = self.numpy_column(name)
+                selected = compare(column, value) if column is not None else np.fromiter(
+                    (compare(item, value) for item in self.columns[name]), dtype=bool, count=self.size)
+                mask = selected if mask is None else mask & selected
+            if self.terms:
+                selected = np.fromiter((self.matches_terms(text_columns, index) for index in range(self.size)), dtype=bool, count=self.size)
+                mask = selected if mask is None else mask & selected
+            if self.sort_column is not None:
+                column = self.numpy_column(self.sort_column)
+                if column is None:
+                    order = np.array(sorted(range(self.size), key=self.columns[self.sort_column].__getitem__, reverse=self.descending), dtype=np.intp)
+                else:
+                    # 내림차순도 NaN(빈칸)은 맨 뒤에 두도록 부호를 바꿔 정렬
+                    order = np.argsort(-column if self.descending else column, kind="stable")
+                self.order = order if mask is None else order[mask[order]]
+            else:
+                self.order = range(self.size) if mask is None else np.flatnonzero(mask)
+            return
+        
+        def selected(index):
+            return all(compare(self.columns[name][index], value) for name, compare, value in self.conditions) and \
+                (not self.terms or self.matches_terms(text_columns, index))
+        
+        order = range(self.size)
+        if self.conditions or self.terms:
+            order = array("q", filter(selected, order))
+        if self.sort_column is not None:
+            column = self.columns[self.sort_column]
+            if self.is_numeric(self.sort_column):
+                # NaN(빈칸)은 방향과 관계없이 맨 뒤
+                sign = -1 if self.descending else 1
+                order = array("q", sorted(order, key=lambda index: (column[index] != column[index], sign * column[index])))
+            else:
+                order = array("q", sorted(order, key=column.__getitem__, reverse=self.descending))
+        self.order = order
+    
+    def matches_terms(self, text_columns, index):
+        """문자열 열 중 하나에 모든 검색어가 포함되는지"""
+        text = " ".join(column[index] for column in text_columns).lower()
+        return all(term in text for term in self.terms)
+    
+    def row(self, position):
+        """화면 순서 position번째 행의 표시 문자열 목록"""
+        index = int(self.order[position])
+        return [self.formats.get(name, format_cell)(self.columns[name][index]) for name in self.names]
+
+
+class VirtualTable:
+    """큰 열 단위 결과용 표 (보이는 height개 행만 Treeview 항목으로 만들고, 스크롤하면 그 항목의 값만 바꿈)
+
+    행 수와 관계없이 위젯/항목 수가 일정하므로 100만 행도 스크롤 비용이 같다. 열 제목을 누르면 정렬하고,
+    필터 입력창에서 Enter를 누르면 ColumnarRows의 필터 문법으로 행을 거른다.
+    """
+
+    def __init__(self, parent, rows, height=VIRTUAL_TABLE_ROWS):
+        self.rows = rows
+        self.height = max(1, min(height, rows.size))
+        self.top = 0
+        self.render_pending = False
+        self.frame = ttk.Frame(parent, style="Custom.TFrame")
+        
+        filter_row = ttk.Frame(self.frame, style="Custom.TFrame")
+        filter_row.pack(fill='x', pady=(0, 4))
+        ttk.Label(filter_row, text="필터:", style="Custom.TLabel").pack(side='left')
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_row, textvariable=self.filter_var, width=40)
+        filter_entry.pack(side='left', padx=4)
+        filter_entry.bind("<Return>", lambda event: self.apply_filter())
+        self.count_label = ttk.Label(filter_row, text="", style="Custom.TLabel")
+        self.count_label.pack(side='left', padx=4)
+        
+        body = ttk.Frame(self.frame, style="Custom.TFrame")
+        body.pack(fill='both', expand=True)
+        self.tree = ttk.Treeview(body, columns=rows.names, show='headings', height=self.height, style="Custom.Treeview")
+        widths = table_column_widths(rows.names)
+        for name, width in zip(rows.names, widths):
+            self.tree.heading(name, text=rows.heading(name), command=lambda name=name: self.sort_by(name))
+            self.tree.column(name, width=max(width, 60), anchor='center')
+        configure_row_tags(self.tree)
+        self.items = [self.tree.insert('', 'end', values=()) for _ in range(self.height)]
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scroll)
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_mousewheel)
+        self.render()
+    
+    def apply_filter(self):
+        try:
+            self.rows.set_filter(self.filter_var.get())
+        except ValueError as e:
+            messagebox.showwarning("필터 오류", str(e))
+            return
+        self.top = 0
+        self.schedule_render()
+    
+    def sort_by(self, name):
+        self.rows.sort_by(name)
+        for column in self.rows.names:
+            mark = (" ▼" if self.rows.descending else " ▲") if column == self.rows.sort_column else ""
+            self.tree.heading(column, text=self.rows.heading(column) + mark)
+        self.top = 0
+        self.schedule_render()
+    
+    def scroll_to(self, top):
+        self.top = max(0, min(int(top), len(self.rows) - self.height))
+        self.schedule_render()
+    
+    def on_scroll(self, action, amount, unit=None):
+        """스크롤바 명령 ("moveto", 비율) 또는 ("scroll", 칸 수, "units"/"pages")"""
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.rows))
+        elif action == "scroll":
+            self.scroll_to(self.top + int(amount) * (self.height if unit == "pages" else 1))
+    
+    def on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return "break"
+    
+    def schedule_render(self):
+        """다음 유휴 시점에 한 번만 다시 그림 (휠/스크롤바 이벤트가 몰려도 화면 갱신은 한 번)"""
+        if not self.render_pending:
+            self.render_pending = True
+            self.frame.after_idle(self.render)
+    
+    def render(self):
+        """보이는 행의 값만 Treeview 항목에 채움"""
+        self.render_pending = False
+        total = len(self.rows)
+        for offset, item in enumerate(self.items):
+            position = self.top + offset
+            if position < total:
+                values = self.rows.row(position)
+                self.tree.item(item, values=values, tags=row_tags(values))
+            else:
+                self.tree.item(item, values=(), tags=())
+        if total:
+            self.scrollbar.set(self.top / total, min(self.top + self.height, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+        self.count_label.configure(text=f"{total:,} / {self.rows.size:,}행")
+
+
+def create_table_frame(parent, headers, data, table_name="", height=6, is_amplification=False, main_canvas=None):
+    """Treeview를 사용한 표 프레임 생성 (연베이지톤 스타일 적용)"""
+    try:
+        frame = ttk.Frame(parent, style="Custom.TFrame")
+        if table_name:
+            title_label = ttk.Label(frame, text=table_name, font=("Arial", 10, "bold"), style="Custom.TLabel")
+            title_label.pack(pady=(5, 2))
+            # 테이블 제목 라벨에도 마우스 휠 바인딩 적용
+            if main_canvas and hasattr(main_canvas, 'yview_scroll'):
+                def _on_mousewheel(event):
+                    main_canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+                title_label.bind("<MouseWheel>", _on_mousewheel)
+        
+        tree = ttk.Treeview(frame, columns=headers, show='headings', height=height, style="Custom.Treeview")
+        for header, column_width in zip(headers, table_column_widths(headers, table_name, is_amplification)):
+            tree.heading(header, text=header)
+            tree.column(header, width=column_width, anchor='center')
+        
+        # 색상 태그는 표마다 한 번 등록하고, 비교 표시가 있는 행에 적용
+        configure_row_tags(tree)
+        for row in data:
+            tree.insert('', 'end', values=row, tags=row_tags(row))
+        
+        tree.pack(side='left', fill='both', expand=True)
+        
+        # Treeview에도 마우스 휠 스크롤 바인딩 적용 (main_canvas가 전달된 경우에만)
+        if main_canvas and hasattr(main_canvas, 'yview_scroll'):
+            def _on_mousewheel(event):
+                main_canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+            tree.bind("<MouseWheel>", _on_mousewheel)
+            
+        return frame
+    except Exception as e:
+        print(f"Treeview 생성 중 오류: {e}")
+        return ttk.Frame(parent, style="Custom.TFrame")
+
+
+def run_gui():
+    """메인 창 실행"""
+    root = tk.Tk()
+    app = CharacterGUI(root)
+    root.mainloop()
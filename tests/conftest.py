@@ -0,0 +1,15 @@
+import os
+import sys
+
+# 저장소 루트의 dpm_engine을 설치 없이 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dpm_engine import Character  # noqa: E402
+
+
+def character(**overrides):
+    """기본 캐릭터에서 주어진 속성만 바꾼 테스트용 캐릭터"""
+    char = Character("test")
+    for attribute, value in overrides.items():
+        setattr(char, attribute, value)
+    return char
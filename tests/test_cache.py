@@ -0,0 +1,61 @@
+"""결과 캐시 키와 디스크 캐시 동작 확인
+
+캐시 키는 결과를 바꾸는 모든 입력(파라미터 전체, 시간, 횟수, 시드, 엔진, 난수 알고리즘, 엔진 버전)을 포함해야 하고,
+결과와 무관한 표현 차이(1과 1.0, exact 엔진의 횟수/시드)는 같은 키가 되어야 한다.
+"""
+from conftest import character
+from dpm_engine import ENGINE_EXACT, ENGINE_PYTHON, RNG_MT19937, RNG_PCG64, ResultCache, result_cache_key
+
+
+def cache_key(params=None, **overrides):
+    arguments = {"kind": "stats", "params": params or character().simulation_params(), "minutes": 1, "simulations": 1000,
+                 "engine": ENGINE_PYTHON, "seed": 7, "rng_algorithm": None}
+    arguments.update(overrides)
+    return result_cache_key(**arguments)
+
+
+def test_cache_key_covers_every_simulation_param():
+    base = character().simulation_params()
+    keys = {cache_key(base)}
+    for name, value in base.items():
+        changed = dict(base)
+        changed[name] = (not value) if isinstance(value, bool) else value + 1
+        keys.add(cache_key(changed))
+    assert len(keys) == len(base) + 1
+
+
+def test_cache_key_covers_run_settings():
+    base = cache_key()
+    variants = [cache_key(minutes=2), cache_key(simulations=2000), cache_key(seed=8), cache_key(kind="paired"),
+                cache_key(rng_algorithm=RNG_PCG64), cache_key(engine=ENGINE_EXACT)]
+    assert base not in variants
+    assert len(set(variants)) == len(variants)
+
+
+def test_cache_key_ignores_representation_only_differences():
+    params = character().simulation_params()
+    floats = {name: float(value) if isinstance(value, int) and not isinstance(value, bool) else value for name, value in params.items()}
+    assert cache_key(params) == cache_key(floats)
+    assert cache_key(minutes=1) == cache_key(minutes=1.0)
+    # 기본 난수 알고리즘을 명시해도 같은 키
+    assert cache_key() == cache_key(rng_algorithm=RNG_MT19937)
+    # exact 엔진은 횟수/시드/난수와 무관
+    assert cache_key(engine=ENGINE_EXACT) == cache_key(engine=ENGINE_EXACT, simulations=5, seed=None, rng_algorithm=RNG_PCG64)
+
+
+def test_disk_cache_keeps_recently_used_entries(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), memory_entries=1, disk_entries=300)
+    for index in range(1000):
+        cache.put(f"key{index}", {"value": index})
+    assert cache.get("key999") == {"value": 999}
+    assert cache.get("key0") is None
+    # 디스크에서 다시 읽은 항목은 최근 사용으로 기록되어 정리에서 살아남음
+    oldest = min(index for index in range(1000) if cache.get(f"key{index}") is not None)
+    assert cache.get(f"key{oldest}") == {"value": oldest}
+    for index in range(1000, 1100):
+        cache.put(f"key{index}", {"value": index})
+    assert cache.get(f"key{oldest}") == {"value": oldest}
+    assert cache.get(f"key{oldest + 1}") is None
+
+    reopened = ResultCache(str(tmp_path / "cache.sqlite3"), disk_entries=300)
+    assert len([index for index in range(1100) if reopened.get(f"key{index}") is not None]) <= 300
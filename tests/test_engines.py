@@ -0,0 +1,83 @@
+"""엔진 간 일치와 시드 재현성 확인
+
+numpy 엔진은 파이썬 엔진과 같은 분포를 따라야 하고, 샘플링 엔진(python/numpy/aggregate)의 DPM은 exact 엔진의 기댓값과 신뢰구간 안에서 맞아야 하며,
+같은 마스터 시드의 결과는 워커 수와 관계없이 같아야 한다.
+"""
+import math
+
+import pytest
+
+from conftest import character
+from dpm_engine import (
+    ENGINE_AGGREGATE, ENGINE_EXACT, ENGINE_NUMPY, ENGINE_PYTHON, available_engines, run_characters, run_exact,
+    run_paired_comparison, shutdown_process_pool
+)
+
+SAMPLED_ENGINES = [engine for engine in (ENGINE_PYTHON, ENGINE_NUMPY, ENGINE_AGGREGATE) if engine in available_engines()]
+AGREEMENT_SIGMAS = 5  # 여러 엔진 × 빌드를 한꺼번에 검사하므로 표준오차의 5배까지 허용
+
+BUILDS = [
+    {},
+    {"is_third_awakening": True, "attack_speed": 180},
+    {"attack_speed": 300, "p_critical": 0.4, "critical_cooldown": 0.5},
+    {"hit_1": 2, "hit_3": 5, "p_triple_shot": 0.4, "is_cooldown": False},
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def process_pool():
+    yield
+    shutdown_process_pool()
+
+
+@pytest.mark.skipif(ENGINE_NUMPY not in available_engines(), reason="NumPy 없음")
+@pytest.mark.parametrize("overrides", BUILDS)
+def test_numpy_engine_agrees_with_python_engine(overrides):
+    char = character(**overrides)
+    python = run_characters([char], 1.5, 4000, ENGINE_PYTHON, seed=11, use_cache=False)[0]
+    numpy = run_characters([char], 1.5, 20000, ENGINE_NUMPY, seed=11, use_cache=False)[0]
+
+    assert abs(numpy.dpm - python.dpm) <= AGREEMENT_SIGMAS * math.hypot(numpy.dpm_std_error, python.dpm_std_error)
+    assert numpy.apm == pytest.approx(python.apm, rel=0.01)
+
+
+@pytest.mark.parametrize("engine", SAMPLED_ENGINES)
+@pytest.mark.parametrize("overrides", BUILDS)
+def test_sampled_engines_agree_with_exact(engine, overrides):
+    char = character(**overrides)
+    minutes = 1.5
+    exact = run_exact(char, minutes)
+    stats = run_characters([char], minutes, 4000 if engine == ENGINE_PYTHON else 20000, engine, seed=11, use_cache=False)[0]
+
+    assert abs(stats.dpm - exact.dpm) <= AGREEMENT_SIGMAS * stats.dpm_std_error
+    assert stats.apm == pytest.approx(exact.apm, rel=0.01)
+
+
+@pytest.mark.parametrize("engine", SAMPLED_ENGINES + [ENGINE_EXACT])
+def test_fixed_seed_is_independent_of_worker_count(engine):
+    characters = [character(), character(attack_speed=150)]
+    single = run_characters(characters, 1, 12000, engine, workers=1, seed=7, use_cache=False)
+    pooled = run_characters(characters, 1, 12000, engine, workers=2, seed=7, use_cache=False)
+
+    assert [(s.simulations, s.total_damage, s.total_attacks, s.damage_m2) for s in single] == \
+        [(s.simulations, s.total_damage, s.total_attacks, s.damage_m2) for s in pooled]
+
+
+@pytest.mark.parametrize("engine", SAMPLED_ENGINES)
+def test_adaptive_stop_is_independent_of_worker_count(engine):
+    char = character()
+    single = run_characters([char], 1, 200000, engine, workers=1, seed=7, target_relative_error=0.002, use_cache=False)[0]
+    pooled = run_characters([char], 1, 200000, engine, workers=3, seed=7, target_relative_error=0.002, use_cache=False)[0]
+
+    assert single.simulations == pooled.simulations < 200000
+    assert single.total_damage == pooled.total_damage
+
+
+def test_paired_comparison_is_independent_of_worker_count():
+    engine = SAMPLED_ENGINES[-1]
+    char1, char2 = character(), character(attack_speed=125)
+    single = run_paired_comparison(char1, char2, 1, 6000, engine, workers=1, seed=3, use_cache=False)
+    pooled = run_paired_comparison(char1, char2, 1, 6000, engine, workers=2, seed=3, use_cache=False)
+
+    assert single.dpm_difference == pooled.dpm_difference
+    assert single.p_value == pooled.p_value
@@ -0,0 +1,57 @@
+"""시뮬레이션별 DPM 분포 히스토그램 확인
+
+분위수는 구간 대표값으로 근사하므로 실제 값과의 상대 오차가 (γ - 1) / (γ + 1) 이하여야 하고,
+샤드별 히스토그램을 병합한 결과는 모든 값을 한 번에 넣은 히스토그램과 같아야 한다.
+"""
+import random
+
+import pytest
+
+from conftest import character
+from dpm_engine import DPM_PERCENTILES, HISTOGRAM_GAMMA, DpmHistogram, SimulationStats, np, simulate_attacks_with_critical_and_skill
+
+MINUTES = 1
+SIMULATIONS = 2000
+
+
+@pytest.fixture(scope="module")
+def simulated():
+    """시뮬레이션을 하나씩 실행해 시뮬레이션별 DPM과 병합한 합계를 함께 반환"""
+    params = character(attack_speed=150).simulation_params()
+    rng = random.Random(3)
+    total = SimulationStats(MINUTES)
+    dpms = []
+    for _ in range(SIMULATIONS):
+        stats = SimulationStats(MINUTES)
+        simulate_attacks_with_critical_and_skill(minutes=MINUTES, simulations=1, rng=rng, stats=stats, **params)
+        dpms.append(stats.total_damage / MINUTES)
+        total.merge(stats)
+    return dpms, total
+
+
+@pytest.mark.skipif(np is None, reason="NumPy 없음")
+def test_percentiles_match_raw_dpms_within_bucket_error(simulated):
+    dpms, total = simulated
+    # 구간 (γ^(i-1), γ^i]의 값과 대표값 2γ^i / (γ + 1)의 상대 오차 상한
+    tolerance = (HISTOGRAM_GAMMA - 1) / (HISTOGRAM_GAMMA + 1) + 1e-12
+    for percent in DPM_PERCENTILES:
+        # quantile은 q × (n - 1)번째 값(내림)이 속한 구간을 쓰므로 numpy의 "lower" 방식과 비교
+        exact = float(np.percentile(dpms, percent, method="lower"))
+        assert total.dpm_percentile(percent) == pytest.approx(exact, rel=tolerance)
+
+
+def test_merged_shards_equal_single_histogram(simulated):
+    dpms, total = simulated
+    single = DpmHistogram()
+    single.add_values(dpms)
+    half = len(dpms) // 2
+    merged = DpmHistogram()
+    for shard in (dpms[:half], dpms[half:]):
+        histogram = DpmHistogram()
+        histogram.add_values(np.array(shard) if np is not None else shard)
+        merged.merge(histogram)
+
+    for histogram in (merged, total.histogram):
+        assert histogram.counts == single.counts
+        assert histogram.zero_count == single.zero_count
+        assert histogram.total == single.total == SIMULATIONS
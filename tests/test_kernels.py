@@ -0,0 +1,53 @@
+"""파이썬 커널의 계측(diagnostics)이 시뮬레이션 결과를 바꾸지 않는지 확인
+
+계측은 판정이 성공했을 때만 곱하는 배율/타수를 횟수를 세는 값으로 바꿔 분기/발동 횟수를 세므로,
+같은 난수에서 계측을 켠 실행과 끈 실행의 합계/분포가 비트 단위로 같아야 하고 횟수는 타임라인과 맞아야 한다.
+"""
+import random
+
+import pytest
+
+from conftest import character
+from dpm_engine import KernelDiagnostics, SimulationStats, simulate_attacks_with_critical_and_skill, tick_timeline
+
+KERNEL_CASES = [
+    {},
+    {"is_third_awakening": True},
+    {"attack_speed": 300, "critical_cooldown": 0},
+    {"hit_1": 2, "hit_2": 0, "hit_3": 4, "p_triple_shot": 0.5},
+    {"is_seventh_awakening": False, "is_cooldown": False, "is_amplification": False, "skill_cooldown": 0.1},
+    {"hit_1": 0, "damage_skill_1": 2, "attack_power": 3, "critical_multiplier": 3, "strong_hit_multiplier": 2},
+]
+SIMULATIONS = 300
+
+
+@pytest.mark.parametrize("minutes", [0.5, 2])
+@pytest.mark.parametrize("overrides", KERNEL_CASES)
+def test_diagnostics_do_not_change_the_simulation(overrides, minutes):
+    params = character(**overrides).simulation_params()
+    plain = SimulationStats(minutes)
+    instrumented = SimulationStats(minutes)
+    result = simulate_attacks_with_critical_and_skill(minutes=minutes, simulations=SIMULATIONS, rng=random.Random(7), stats=plain, **params)
+    diagnostics = KernelDiagnostics()
+    instrumented_result = simulate_attacks_with_critical_and_skill(minutes=minutes, simulations=SIMULATIONS, rng=random.Random(7),
+                                                                   stats=instrumented, diagnostics=diagnostics, **params)
+
+    # 합계/편차 제곱합/출처별 데미지/DPM 분포까지 비트 단위로 같아야 함
+    assert instrumented_result == result
+    assert instrumented.to_dict() == plain.to_dict()
+    assert instrumented.diagnostics is diagnostics
+    # 분기 횟수의 합은 전체 틱 수, 스킬 횟수는 타임라인으로 정해짐
+    timeline = tick_timeline(minutes, int(params["attack_speed"]), params["skill_cooldown"], params["critical_cooldown"],
+                             params["third_awakening"])
+    assert diagnostics.ticks == SIMULATIONS * len(timeline.skill_schedule)
+    assert diagnostics.skill == SIMULATIONS * sum(timeline.skill_schedule)
+    assert diagnostics.skill + diagnostics.critical + diagnostics.normal == diagnostics.ticks
+    assert diagnostics.double_shot + diagnostics.triple_shot <= diagnostics.normal
+    # 일반 공격의 발사 수로 공격 횟수가 정해짐
+    hit_attacks = diagnostics.skill * params["hit_3"] + diagnostics.critical * params["hit_2"]
+    shots = diagnostics.normal + diagnostics.double_shot + 2 * diagnostics.triple_shot
+    assert plain.total_attacks == hit_attacks + shots * params["hit_1"]
+    # 치명 발동은 스킬 타격과 더블/트리플샷 타격에서만, 강타 발동은 모든 타격에서 일어날 수 있음
+    multi_shot_hits = (2 * diagnostics.double_shot + 3 * diagnostics.triple_shot) * params["hit_1"]
+    assert diagnostics.critical_proc <= diagnostics.skill * params["hit_3"] + multi_shot_hits
+    assert diagnostics.strong_hit_proc <= plain.total_attacks
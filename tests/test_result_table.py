@@ -0,0 +1,65 @@
+"""큰 결과 표(ColumnarRows)의 정렬·필터 확인
+
+NaN(빈칸)은 정렬 방향과 관계없이 맨 뒤에 와야 하고, NumPy 경로와 순수 파이썬 경로의 행 순서가 같아야 한다.
+"""
+import math
+import random
+from array import array
+
+import pytest
+
+pytest.importorskip("tkinter")
+import dpm_gui  # noqa: E402
+from dpm_gui import ColumnarRows  # noqa: E402
+
+
+def make_rows():
+    rng = random.Random(4)
+    size = 200
+    # 같은 값(동순위)과 NaN이 섞인 열
+    dpm = [float("nan") if rng.random() < 0.1 else float(rng.randint(0, 20)) for _ in range(size)]
+    return ColumnarRows({
+        "name": [f"빌드{index}" for index in range(size)],
+        "attack_speed": array("q", (rng.randint(100, 200) for _ in range(size))),
+        "dpm": array("d", dpm),
+    })
+
+
+def row_order(rows, filter_text, sort_clicks):
+    rows.set_filter(filter_text)
+    for _ in range(sort_clicks):
+        rows.sort_by("dpm")
+    return [int(index) for index in rows.order]
+
+
+@pytest.mark.parametrize("sort_clicks", [1, 2])
+def test_nan_sorts_last_in_both_directions(sort_clicks):
+    rows = make_rows()
+    dpm = rows.columns["dpm"]
+    order = row_order(rows, "", sort_clicks)
+    values = [dpm[index] for index in order]
+    nan_count = sum(1 for value in values if math.isnan(value))
+
+    assert 0 < nan_count < len(values)
+    assert all(math.isnan(value) for value in values[-nan_count:])
+    finite = values[:-nan_count]
+    assert finite == sorted(finite, reverse=(sort_clicks == 1))
+
+
+@pytest.mark.skipif(dpm_gui.np is None, reason="NumPy 없음")
+@pytest.mark.parametrize("sort_clicks", [0, 1, 2])
+@pytest.mark.parametrize("filter_text", ["", "attack_speed>=150", "dpm<10, 빌드1", "dpm!=5"])
+def test_numpy_and_python_paths_give_same_order(monkeypatch, filter_text, sort_clicks):
+    with_numpy = row_order(make_rows(), filter_text, sort_clicks)
+    monkeypatch.setattr(dpm_gui, "np", None)
+    without_numpy = row_order(make_rows(), filter_text, sort_clicks)
+
+    assert with_numpy == without_numpy
+
+
+def test_non_numeric_value_on_numeric_column_is_rejected():
+    rows = make_rows()
+    with pytest.raises(ValueError):
+        rows.set_filter("dpm>많이")
+    with pytest.raises(ValueError):
+        rows.set_filter("attack_speed=abc")
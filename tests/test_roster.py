@@ -0,0 +1,46 @@
+"""로스터 순위의 빌드 제외와 시드 재현성 확인
+
+확실히 낮은 빌드는 중간 라운드에서 제외(pruned)되어 시뮬레이션 수가 적어야 하고,
+같은 시드의 순위는 워커 수와 관계없이 같아야 한다.
+"""
+import pytest
+
+from conftest import character
+from dpm_engine import ENGINE_AGGREGATE, ENGINE_PYTHON, available_engines, run_roster, shutdown_process_pool
+
+ENGINE = ENGINE_AGGREGATE if ENGINE_AGGREGATE in available_engines() else ENGINE_PYTHON
+SIMULATIONS = 16000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def process_pool():
+    yield
+    shutdown_process_pool()
+
+
+def roster_characters():
+    return [
+        character(name="기본"),
+        character(name="빠름", attack_speed=150),
+        character(name="약함", attack_power=3),
+    ]
+
+
+def test_clearly_worse_build_is_pruned_early():
+    ranking = run_roster(roster_characters(), 1, SIMULATIONS, ENGINE, seed=5, keep_top=1)
+    entries = {entry.name: entry for entry in ranking}
+
+    assert ranking[0].name == "빠름"
+    assert entries["약함"].pruned
+    assert entries["약함"].stats.simulations < SIMULATIONS
+    assert entries["약함"].gap < 0
+    assert not entries["빠름"].pruned
+    assert entries["빠름"].stats.simulations == SIMULATIONS
+
+
+def test_ranking_is_independent_of_worker_count():
+    single = run_roster(roster_characters(), 1, SIMULATIONS, ENGINE, workers=1, seed=5, keep_top=1)
+    pooled = run_roster(roster_characters(), 1, SIMULATIONS, ENGINE, workers=2, seed=5, keep_top=1)
+
+    assert [(entry.rank, entry.name, entry.pruned, entry.stats.simulations, entry.stats.total_damage, entry.gap) for entry in single] == \
+        [(entry.rank, entry.name, entry.pruned, entry.stats.simulations, entry.stats.total_damage, entry.gap) for entry in pooled]
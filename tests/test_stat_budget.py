@@ -0,0 +1,66 @@
+"""스탯 배분 최적화 확인
+
+작은 예산에서 최적 배분은 예산과 최댓값(확률 100%)을 지키고, 한 단계를 더하거나 다른 스탯으로 옮긴
+모든 이웃 배분보다 exact 엔진 기준 DPM이 낮지 않아야 한다.
+"""
+import copy
+
+import pytest
+
+from conftest import character
+from dpm_engine import STAT_BUDGET_STATS, optimize_stat_budget, run_exact
+
+BUDGET = 6
+
+
+def base_character():
+    # 치명/강타 확률은 최댓값 바로 아래라 몇 단계만 투자할 수 있음
+    return character(p_critical=0.97, p_strong_hit=0.99, attack_speed=140)
+
+
+def allocate(char, steps):
+    upgraded = copy.copy(char)
+    for attribute, delta, _, _ in STAT_BUDGET_STATS:
+        value = getattr(char, attribute) + delta * steps.get(attribute, 0)
+        setattr(upgraded, attribute, int(round(value)) if attribute == "attack_speed" else value)
+    return upgraded
+
+
+def within_limits(char, steps):
+    cost = sum(cost * steps.get(attribute, 0) for attribute, _, cost, _ in STAT_BUDGET_STATS)
+    capped = all(cap is None or getattr(char, attribute) + delta * steps.get(attribute, 0) <= cap + 1e-9
+                 for attribute, delta, _, cap in STAT_BUDGET_STATS)
+    return cost <= BUDGET and capped and min(steps.values(), default=0) >= 0
+
+
+def neighbors(steps):
+    attributes = [attribute for attribute, _, _, _ in STAT_BUDGET_STATS]
+    for target in attributes:
+        yield dict(steps, **{target: steps.get(target, 0) + 1})
+        for source in attributes:
+            if source != target and steps.get(source):
+                yield dict(steps, **{source: steps[source] - 1, target: steps.get(target, 0) + 1})
+
+
+@pytest.fixture(scope="module")
+def best():
+    allocations, _ = optimize_stat_budget(base_character(), BUDGET)
+    return allocations[0]
+
+
+def test_best_allocation_respects_budget_and_caps(best):
+    assert best.cost <= BUDGET
+    for attribute in ("p_critical", "p_strong_hit", "p_double_shot", "p_triple_shot"):
+        assert getattr(best.character, attribute) <= 1 + 1e-9
+    assert best.dpm == pytest.approx(run_exact(best.character, 1).dpm, rel=1e-12)
+
+
+def test_best_allocation_beats_every_single_step_neighbor(best):
+    char = base_character()
+    checked = 0
+    for steps in neighbors(best.steps):
+        if not within_limits(char, steps):
+            continue
+        assert run_exact(allocate(char, steps), 1).dpm <= best.dpm * (1 + 1e-12)
+        checked += 1
+    assert checked > 0
@@ -0,0 +1,57 @@
+"""근사 DPM 표의 오차 한계와 파일 왕복 확인
+
+estimate가 돌려주는 오차 한계는 exact 엔진과의 실제 차이보다 항상 커야 한다 (GUI 미리보기의 ± 표시 근거).
+"""
+import random
+
+import pytest
+
+from conftest import character
+from dpm_engine import SurrogateTable, load_surrogate_table, run_exact
+
+MAX_ATTACK_SPEED = 200  # 테스트용으로 줄인 표의 공격 속도 범위 (낮은 속도는 보간 오차가 거의 없어 높은 쪽을 주로 검사)
+
+
+@pytest.fixture(scope="module")
+def table():
+    return SurrogateTable.build(minutes=1, max_attack_speed=MAX_ATTACK_SPEED)
+
+
+def random_character(rng):
+    return character(
+        attack_speed=rng.randint(MAX_ATTACK_SPEED // 2, MAX_ATTACK_SPEED), attack_power=rng.uniform(1, 30),
+        p_critical=rng.random(), p_strong_hit=rng.random(), p_double_shot=rng.random(), p_triple_shot=rng.random(),
+        critical_multiplier=rng.uniform(1, 20), strong_hit_multiplier=rng.uniform(1, 3),
+        is_seventh_awakening=rng.random() < 0.5, is_cooldown=rng.random() < 0.5,
+        is_third_awakening=rng.random() < 0.5, is_amplification=rng.random() < 0.5,
+    )
+
+
+def test_estimates_stay_within_their_error_bounds(table):
+    rng = random.Random(5)
+    for _ in range(200):
+        char = random_character(rng)
+        dpm, apm, dpm_error, apm_error = table.estimate(char)
+        exact = run_exact(char, 1)
+        assert abs(dpm - exact.dpm) <= dpm_error + 1e-9 * exact.dpm
+        assert abs(apm - exact.apm) <= apm_error + 1e-9 * exact.apm
+
+
+def test_out_of_range_builds_fall_back_to_exact(table):
+    char = character(attack_speed=MAX_ATTACK_SPEED + 1)
+    assert table.estimate(char) is None
+    char.attack_speed = MAX_ATTACK_SPEED
+    assert table.estimate(char) is not None
+    assert table.estimate(char, minutes=2) is None
+
+
+def test_saved_table_round_trips_and_rejects_other_settings(table, tmp_path):
+    path = str(tmp_path / "surrogate.bin")
+    table.save(path)
+    loaded = load_surrogate_table(path, 1, max_attack_speed=MAX_ATTACK_SPEED)
+    try:
+        char = random_character(random.Random(9))
+        assert loaded.estimate(char) == table.estimate(char)
+    finally:
+        loaded.close()
+    assert load_surrogate_table(path, 2, max_attack_speed=MAX_ATTACK_SPEED) is None
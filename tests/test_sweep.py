@@ -0,0 +1,25 @@
+"""스윕 결과의 .npz 저장 확인
+
+save_npz는 NumPy 없이 .npy 형식을 직접 쓰므로, numpy.load로 읽은 열이 to_numpy()와 dtype/값까지 같아야 한다.
+"""
+import pytest
+
+from conftest import character
+from dpm_engine import ENGINE_EXACT, np, run_sweep
+
+
+@pytest.mark.skipif(np is None, reason="NumPy 없음")
+def test_saved_npz_matches_numpy_columns(tmp_path):
+    axes = {"attack_speed": [100, 130, 160, 190], "p_critical": [0.1, 0.25, 0.5]}
+    result = run_sweep(character(), axes, 1, engine=ENGINE_EXACT)
+    path = str(tmp_path / "sweep.npz")
+    result.save_npz(path)
+    columns = result.to_numpy()
+
+    with np.load(path) as loaded:
+        assert sorted(loaded.files) == sorted(columns)
+        for name in ("attack_speed", "dpm"):
+            assert loaded[name].dtype == columns[name].dtype
+            assert np.array_equal(loaded[name], columns[name])
+    assert columns["attack_speed"].dtype.kind == "i"
+    assert columns["dpm"].dtype.kind == "f"